@@ -0,0 +1,101 @@
+from manim import *
+import os
+import threading
+import time
+
+from compile_assets import load_compiled_svg
+
+# Lazy asset handles for a scene, with a background thread that prepares the assets of the upcoming sections while the
+# current one renders.
+#
+# A scene lists its assets once, by name: svg files as paths, and titles as {"text": ..., "font": ...} (the first
+# Text with a given font is slow, it has to go through pango, every later one reads manim's text cache). Nothing is
+# read until a section asks for the asset or the prefetch thread gets to it, and assets no section lists are never
+# touched at all. TeX has its own pre-pass, see tex_batch.py.
+
+def _load_asset(spec):
+  """Prepares the asset so the scene's own constructor hits a warm cache"""
+  if isinstance(spec, dict):
+    Text(**spec)
+  elif spec.endswith(".svg"):
+    # Compiled (if it isn't already), so the scene's own load only maps the buffers
+    load_compiled_svg(spec)
+  else:
+    os.stat(spec)
+
+class AssetHandle:
+  """One asset of the manifest, loaded at most once, by whoever needs it first"""
+  def __init__(self, name: str, spec):
+    self.name = name
+    self.spec = spec
+    self.loaded_by: str | None = None
+    self.load_time = 0.0
+    self.error: Exception | None = None
+    self._lock = threading.Lock()
+
+  @property
+  def is_loaded(self) -> bool:
+    return self.loaded_by is not None
+
+  def load(self, loaded_by="demand"):
+    """Loads the asset unless it already is. Waits on the prefetch thread instead of loading it twice"""
+    with self._lock:
+      if self.is_loaded:
+        return self.spec
+
+      start = time.perf_counter()
+      try:
+        _load_asset(self.spec)
+      except Exception as error:
+        # A failed prefetch is retried (and raised) when the section actually needs the asset
+        if loaded_by == "prefetch":
+          self.error = error
+          return self.spec
+        raise
+
+      self.load_time = time.perf_counter() - start
+      self.loaded_by = loaded_by
+
+    return self.spec
+
+class AssetManifest:
+  """Every asset a scene uses, by name, and which of them each section needs"""
+  def __init__(self, assets: dict, section_assets: dict[str, list[str]]):
+    self.handles = {name: AssetHandle(name, spec) for name, spec in assets.items()}
+    self.section_assets = section_assets
+    self.prefetch_thread: threading.Thread | None = None
+
+  def __getitem__(self, name: str) -> AssetHandle:
+    return self.handles[name]
+
+  def resolve(self, name: str):
+    """The asset's path (or text spec), once it's loaded"""
+    return self.handles[name].load()
+
+  def get_section_handles(self, section: str) -> list[AssetHandle]:
+    return [self.handles[name] for name in self.section_assets.get(section, [])]
+
+  def prefetch(self, sections: list[str]) -> threading.Thread:
+    """Starts loading the assets of the sections, in the order the sections render, on a background thread"""
+    handles = list(dict.fromkeys(handle for section in sections for handle in self.get_section_handles(section)))
+
+    def prefetch_handles():
+      for handle in handles:
+        handle.load("prefetch")
+
+    self.prefetch_thread = threading.Thread(target=prefetch_handles, name="asset-prefetch", daemon=True)
+    self.prefetch_thread.start()
+
+    return self.prefetch_thread
+
+  def report(self):
+    """
+      Which assets were loaded, by whom and how long they took. Anything the render didn't need shows up as skipped.
+      Logged at debug level, it only shows with manim's -v DEBUG
+    """
+    lines = [f"{'asset':<20}{'loaded by':>12}{'time':>12}"]
+    for handle in self.handles.values():
+      loaded_by = handle.loaded_by or "skipped"
+      lines.append(f"{handle.name:<20}{loaded_by:>12}{handle.load_time * 1000:>10.1f}ms")
+
+    logger.debug("Asset loads:\n" + "\n".join(lines))
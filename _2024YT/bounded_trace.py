@@ -0,0 +1,141 @@
+from manim import *
+
+# A TracedPath that doesn't grow forever. Manim's adds a line to the path on every frame, so a trace left running
+# for a minute is thousands of curves, all redrawn (and re-copied by set_points when it dissipates) every frame.
+#
+# BoundedTracedPath keeps its points in a preallocated ring buffer instead. Every chunk_size points the chunk just
+# finished is simplified with Douglas-Peucker (only the points that bend the trace by more than tolerance survive),
+# and once the buffer is full the oldest points drop off the end. With dissipating_time the points drop off by age
+# instead, the same fading tail as TracedPath. Either way memory and the per-frame cost are capped by capacity.
+
+def douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+  """Mask of the points to keep so the polyline stays within tolerance of the original, both ends always kept"""
+  keep = np.zeros(len(points), dtype=bool)
+  keep[[0, -1]] = True
+  stack = [(0, len(points) - 1)]
+
+  while stack:
+    first, last = stack.pop()
+    if last - first < 2:
+      continue
+
+    start, end = points[first], points[last]
+    segment = end - start
+    length_squared = np.dot(segment, segment)
+    inner = points[first + 1:last]
+
+    # Distance of every point in between to the segment first -> last
+    if length_squared == 0:
+      distances = np.linalg.norm(inner - start, axis=1)
+    else:
+      t = np.clip((inner - start) @ segment / length_squared, 0, 1)
+      distances = np.linalg.norm(inner - (start + t[:, None] * segment), axis=1)
+
+    farthest = int(np.argmax(distances))
+    if distances[farthest] > tolerance:
+      split = first + 1 + farthest
+      keep[split] = True
+      stack.append((first, split))
+      stack.append((split, last))
+
+  return keep
+
+class BoundedTracedPath(VMobject):
+  """
+    Traces traced_point_func like TracedPath, in at most capacity points. The newest chunk_size points are kept as
+    they are, older ones are simplified down to within tolerance of the trace.
+  """
+  def __init__(
+    self,
+    traced_point_func,
+    stroke_width=2,
+    stroke_color=WHITE,
+    dissipating_time: float | None = None,
+    capacity=1024,
+    chunk_size=64,
+    tolerance=0.01,
+    **kwargs,
+  ):
+    if capacity <= chunk_size:
+      raise ValueError(f"capacity ({capacity}) has to be larger than chunk_size ({chunk_size})")
+
+    super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+    self.traced_point_func = traced_point_func
+    self.dissipating_time = dissipating_time
+    self.capacity = capacity
+    self.chunk_size = chunk_size
+    self.tolerance = tolerance
+
+    self._points = np.zeros((capacity, 3))
+    self._times = np.zeros(capacity)
+    self._start = 0
+    self._count = 0
+    # How many of the newest points haven't been simplified yet
+    self._open = 0
+    self.time = 0.0
+
+    self.add_updater(self.update_path)
+
+  def _indices(self, start: int, count: int) -> np.ndarray:
+    """Ring buffer slots of count points from the start-th oldest on"""
+    return (self._start + start + np.arange(count)) % self.capacity
+
+  def get_trace_points(self) -> np.ndarray:
+    """The points of the trace, oldest first"""
+    return self._points[self._indices(0, self._count)]
+
+  def clear_trace(self):
+    self._start = self._count = self._open = 0
+    self.clear_points()
+    return self
+
+  def _drop_oldest(self, count: int):
+    count = min(count, self._count)
+    self._start = (self._start + count) % self.capacity
+    self._count -= count
+    self._open = min(self._open, self._count)
+
+  def _append(self, point: np.ndarray):
+    if self._count == self.capacity:
+      self._drop_oldest(1)
+
+    slot = (self._start + self._count) % self.capacity
+    self._points[slot] = point
+    self._times[slot] = self.time
+    self._count += 1
+    self._open += 1
+
+  def _simplify_open_chunk(self):
+    """Simplifies the chunk of the newest points in place, its last point starts the next chunk"""
+    first = self._count - self._open
+    slots = self._indices(first, self._open)
+    keep = douglas_peucker(self._points[slots], self.tolerance)
+
+    kept = slots[keep]
+    points, times = self._points[kept], self._times[kept]
+    slots = slots[:len(kept)]
+    self._points[slots] = points
+    self._times[slots] = times
+
+    self._count = first + len(kept)
+    self._open = 1
+
+  def update_path(self, mob: Mobject, dt: float):
+    self.time += dt
+    point = np.array(self.traced_point_func(), dtype=float)
+
+    # Standing still adds nothing to the trace
+    if self._count == 0 or not np.allclose(point, self._points[(self._start + self._count - 1) % self.capacity]):
+      self._append(point)
+      if self._open > self.chunk_size:
+        self._simplify_open_chunk()
+
+    if self.dissipating_time is not None and self._count:
+      times = self._times[self._indices(0, self._count)]
+      # The newest point stays even when it's old, so the trace picks up again from wherever the point stopped
+      self._drop_oldest(min(int(np.searchsorted(times, self.time - self.dissipating_time)), self._count - 1))
+
+    if self._count < 2:
+      self.clear_points()
+    else:
+      self.set_points_as_corners(self.get_trace_points())
@@ -0,0 +1,252 @@
+from manim import *
+import argparse
+import os
+import time
+
+# Offline svg compiler for the heavy fly_2trains assets.
+# Usage (from the project root):
+#   python _2024YT/compile_assets.py [--assets _2024YT/fly_2trains/assets] [--tolerance 0.005]
+#
+# Every svg in the assets folder is parsed once the normal way, each of its paths is simplified and the result is
+# dumped next to it in a `compiled` folder as two files:
+#   <name>.npy - every anchor/handle of every curve as one raw (n, 3) float64 buffer, memory-mappable
+#   <name>.npz - the offsets into that buffer and the full style (fill rgbas, stroke rgbas, stroke width) of each path
+# CompiledSVGMobject then loads those without touching any xml, every path's points a view into the mapped buffer.
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fly_2trains", "assets")
+
+# Max distance (in scene units, i.e. after the svg is scaled to its default height of 2) a simplified curve can stray
+DEFAULT_TOLERANCE = 0.005
+
+def _distance_to_chord(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+  """Perpendicular distance of each point to the chord start -> end (or to start itself, for a zero length chord)"""
+  chord = end - start
+  chord_length = np.linalg.norm(chord[..., :2], axis=-1)
+  offset = points - start
+  cross = np.abs(chord[..., 0] * offset[..., 1] - chord[..., 1] * offset[..., 0])
+
+  return np.where(
+    chord_length > 0,
+    cross / np.maximum(chord_length, 1e-12),
+    np.linalg.norm(offset[..., :2], axis=-1)
+  )
+
+def _douglas_peucker(anchors: np.ndarray, tolerance: float) -> np.ndarray:
+  """Drops every anchor of the polyline that lies within `tolerance` of the simplified line"""
+  keep = np.zeros(len(anchors), dtype=bool)
+  keep[0] = keep[-1] = True
+  stack = [(0, len(anchors) - 1)]
+
+  while stack:
+    i, j = stack.pop()
+    if j <= i + 1:
+      continue
+
+    distances = _distance_to_chord(anchors[i + 1:j], anchors[i], anchors[j])
+    k = int(np.argmax(distances))
+
+    if distances[k] > tolerance:
+      keep[i + 1 + k] = True
+      stack.extend(((i, i + 1 + k), (i + 1 + k, j)))
+
+  return anchors[keep]
+
+def _straight_curves(anchors: np.ndarray) -> np.ndarray:
+  """Cubic bezier points for the straight segments between consecutive anchors"""
+  starts, ends = anchors[:-1], anchors[1:]
+  return np.stack((starts, starts + (ends - starts) / 3, starts + 2 * (ends - starts) / 3, ends), axis=1).reshape(-1, 3)
+
+def simplify_bezier_points(points: np.ndarray, tolerance=DEFAULT_TOLERANCE) -> np.ndarray:
+  """
+    Simplifies the cubic bezier points of a VMobject. Curves whose handles are within `tolerance` of their chord are
+    treated as straight lines, and every run of those is collapsed with Douglas-Peucker. Anything actually curved is
+    left untouched, and the start/end of each subpath is always kept so subpaths stay closed.
+  """
+  if len(points) < 4:
+    return points
+
+  curves = points[:len(points) - len(points) % 4].reshape(-1, 4, 3)
+  starts, first_handles, second_handles, ends = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+
+  is_flat = np.maximum(
+    _distance_to_chord(first_handles, starts, ends),
+    _distance_to_chord(second_handles, starts, ends)
+  ) <= tolerance
+
+  # A new subpath begins wherever a curve does not start at the end of the previous one
+  breaks = np.flatnonzero(np.any(starts[1:] != ends[:-1], axis=1)) + 1
+  simplified = []
+
+  for subpath in np.split(np.arange(len(curves)), breaks):
+    flat_run = []
+
+    for idx in subpath:
+      if is_flat[idx]:
+        flat_run.append(idx)
+        continue
+
+      if flat_run:
+        anchors = np.vstack((starts[flat_run[0]], ends[flat_run]))
+        simplified.append(_straight_curves(_douglas_peucker(anchors, tolerance)))
+        flat_run = []
+
+      simplified.append(curves[idx])
+
+    if flat_run:
+      anchors = np.vstack((starts[flat_run[0]], ends[flat_run]))
+      simplified.append(_straight_curves(_douglas_peucker(anchors, tolerance)))
+
+  return np.vstack(simplified) if simplified else np.zeros((0, 3))
+
+def _get_offsets(arrays: list[np.ndarray]) -> np.ndarray:
+  return np.cumsum([0] + [len(array) for array in arrays])
+
+def compile_mobject(svg: VMobject, tolerance=DEFAULT_TOLERANCE) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+  """
+    Compiles a parsed svg into (points, index). Transforms are already baked into the points by the svg parser, so all
+    that is left is simplifying the curves of every path. Paths are never merged, even with the same style: overlapping
+    semi-transparent fills only blend the way the svg draws them as separate paths.
+  """
+  paths = svg.family_members_with_points()
+  buffers = [simplify_bezier_points(mob.points, tolerance) for mob in paths]
+  fill_rgbas = [mob.get_fill_rgbas() for mob in paths]
+  stroke_rgbas = [mob.get_stroke_rgbas() for mob in paths]
+
+  points = np.vstack(buffers) if buffers else np.zeros((0, 3))
+  index = {
+    "offsets": _get_offsets(buffers),
+    # Every rgba of every path (a gradient has more than one), each array indexed by its own offsets
+    "fill_rgbas": np.vstack(fill_rgbas) if paths else np.zeros((0, 4)),
+    "fill_offsets": _get_offsets(fill_rgbas),
+    "stroke_rgbas": np.vstack(stroke_rgbas) if paths else np.zeros((0, 4)),
+    "stroke_offsets": _get_offsets(stroke_rgbas),
+    "stroke_widths": np.array([mob.get_stroke_width() for mob in paths], dtype=float),
+  }
+
+  return points, index
+
+def get_compiled_paths(file_name) -> tuple[str, str]:
+  """Paths of the raw point buffer and its index for the given svg, in a `compiled` folder next to it"""
+  compiled_dir = os.path.join(os.path.dirname(os.path.abspath(file_name)), "compiled")
+  stem = os.path.splitext(os.path.basename(file_name))[0]
+  return os.path.join(compiled_dir, f"{stem}.npy"), os.path.join(compiled_dir, f"{stem}.npz")
+
+def compile_svg(file_name, tolerance=DEFAULT_TOLERANCE, svg: VMobject | None = None) -> tuple[str, str]:
+  """Parses (unless already parsed) and compiles the svg, returns the paths the compiled buffers were written to"""
+  if svg is None:
+    svg = SVGMobject(file_name)
+
+  points, index = compile_mobject(svg, tolerance)
+  buffer_path, index_path = get_compiled_paths(file_name)
+
+  os.makedirs(os.path.dirname(buffer_path), exist_ok=True)
+  # Written aside and moved into place, parallel section renders may be loading (or compiling) the same svg
+  for path, save in ((buffer_path, lambda f: np.save(f, points)), (index_path, lambda f: np.savez(f, tolerance=tolerance, **index))):
+    scratch = f"{path}.{os.getpid()}.tmp"
+    with open(scratch, "wb") as f:
+      save(f)
+    os.replace(scratch, path)
+
+  return buffer_path, index_path
+
+def is_compiled(file_name) -> bool:
+  """Whether the compiled buffers exist, are newer than the svg itself and hold every path's full style"""
+  svg_mtime = os.path.getmtime(file_name)
+  paths = get_compiled_paths(file_name)
+  if not all(os.path.exists(path) and os.path.getmtime(path) >= svg_mtime for path in paths):
+    return False
+
+  # Compiled before the styles were kept whole
+  with np.load(paths[1]) as index:
+    return "stroke_widths" in index.files
+
+class CompiledSVGMobject(VMobject):
+  """
+    Loads an svg compiled by compile_svg, memory-mapping its point buffer instead of parsing any xml. The buffer is
+    mapped copy-on-write, so a path's points only get copied into memory once something moves it.
+  """
+  def __init__(self, file_name, height: float | None = 2, color=None, compile_if_stale=True, **kwargs):
+    super().__init__(**kwargs)
+    self.file_name = file_name
+
+    if compile_if_stale and not is_compiled(file_name):
+      compile_svg(file_name)
+
+    buffer_path, index_path = get_compiled_paths(file_name)
+    buffer = np.load(buffer_path, mmap_mode="c")
+
+    with np.load(index_path) as index:
+      index = dict(index)
+
+    offsets, fill_offsets, stroke_offsets = index["offsets"], index["fill_offsets"], index["stroke_offsets"]
+    for idx, stroke_width in enumerate(index["stroke_widths"]):
+      mob = VMobject()
+      # Straight onto the attributes: set_points would copy the points out of the mapped buffer, and set_fill and
+      # set_stroke only take one color per call
+      mob.points = buffer[offsets[idx]:offsets[idx + 1]]
+      mob.fill_rgbas = index["fill_rgbas"][fill_offsets[idx]:fill_offsets[idx + 1]].copy()
+      mob.stroke_rgbas = index["stroke_rgbas"][stroke_offsets[idx]:stroke_offsets[idx + 1]].copy()
+      mob.stroke_width = stroke_width
+      self.add(mob)
+
+    # The buffer was written at the default svg height, only rescale if something else was asked for
+    if height is not None and height != 2:
+      self.scale_to_fit_height(height)
+
+    if color is not None:
+      self.set_color(color)
+
+def load_compiled_svg(file_name) -> VMobject:
+  """
+    The svg as a CompiledSVGMobject, compiling it first if it isn't (or is stale). Falls back to parsing it with
+    SVGMobject whenever the compiled buffers can't be written or read.
+  """
+  try:
+    return CompiledSVGMobject(file_name)
+  except (OSError, ValueError, KeyError) as error:
+    logger.debug(f"Could not load the compiled {file_name} ({error}), parsing the svg instead")
+    return SVGMobject(file_name)
+
+def compile_assets(assets_dir=ASSETS_DIR, tolerance=DEFAULT_TOLERANCE):
+  """Compiles every svg in the assets folder and reports the point counts and load times before and after"""
+  rows = []
+
+  for file_name in sorted(os.listdir(assets_dir)):
+    if not file_name.endswith(".svg"):
+      continue
+
+    path = os.path.join(assets_dir, file_name)
+
+    start = time.perf_counter()
+    svg = SVGMobject(path)
+    svg_load_time = time.perf_counter() - start
+    svg_point_count = sum(len(mob.points) for mob in svg.family_members_with_points())
+
+    compile_svg(path, tolerance, svg=svg)
+
+    start = time.perf_counter()
+    compiled = CompiledSVGMobject(path, compile_if_stale=False)
+    compiled_load_time = time.perf_counter() - start
+    compiled_point_count = sum(len(mob.points) for mob in compiled.family_members_with_points())
+
+    rows.append((file_name, svg_point_count, compiled_point_count, svg_load_time, compiled_load_time))
+
+  header = f"{'asset':<24}{'points':>10}{'compiled':>10}{'svg load':>12}{'npy load':>12}{'speedup':>10}"
+  print(header)
+  print("-" * len(header))
+
+  for file_name, svg_points, compiled_points, svg_time, compiled_time in rows:
+    print(
+      f"{file_name:<24}{svg_points:>10}{compiled_points:>10}"
+      f"{svg_time * 1000:>10.1f}ms{compiled_time * 1000:>10.1f}ms{svg_time / max(compiled_time, 1e-9):>9.1f}x"
+    )
+
+  return rows
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Compile the fly_2trains svg assets into memory-mappable point buffers")
+  parser.add_argument("--assets", default=ASSETS_DIR, help="folder holding the svgs to compile")
+  parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="max deviation allowed when simplifying curves")
+  args = parser.parse_args()
+
+  compile_assets(args.assets, args.tolerance)
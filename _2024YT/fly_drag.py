@@ -0,0 +1,170 @@
+import numpy as np
+
+# Fly trajectories under air resistance, for the "real world constraint" part of the video.
+# Like fly_simulation, nothing in here knows about manim: positions are x coordinates (scene units), times in seconds.
+#
+# Both drag laws are written in terms of a time constant tau, the way the video ends up writing them:
+#   linear drag     m dv/dt = -b v      ->  v(t) = v0 exp(-t/tau)       x(t) = x0 + v0 tau (1 - exp(-t/tau)),  tau = m/b
+#   quadratic drag  m dv/dt = -c v^2    ->  v(t) = v0 / (1 + t/tau)     x(t) = x0 + v0 tau ln(1 + t/tau),       tau = m/(c v0)
+#
+# Every function takes an array of taus and returns one row per tau, so sweeping tau is one numpy pass instead of one
+# updater per fly.
+
+LINEAR = "linear"
+QUADRATIC = "quadratic"
+
+def _as_columns(taus) -> np.ndarray:
+  return np.atleast_1d(np.asarray(taus, dtype=float))[:, None]
+
+def get_drag_velocity(t, v0: float, taus, drag=QUADRATIC) -> np.ndarray:
+  """Velocity of a fly coasting from v0, shape (len(taus), len(t))"""
+  t, taus = np.atleast_1d(np.asarray(t, dtype=float))[None, :], _as_columns(taus)
+
+  if drag == LINEAR:
+    return v0 * np.exp(-t / taus)
+  if drag == QUADRATIC:
+    return v0 / (1 + t / taus)
+
+  raise ValueError(f"Unknown drag law {drag!r}, expected {LINEAR!r} or {QUADRATIC!r}")
+
+def get_drag_position(t, v0: float, taus, x0=0.0, drag=QUADRATIC) -> np.ndarray:
+  """Position of a fly coasting from x0 at v0, shape (len(taus), len(t))"""
+  t, taus = np.atleast_1d(np.asarray(t, dtype=float))[None, :], _as_columns(taus)
+
+  if drag == LINEAR:
+    return x0 + v0 * taus * -np.expm1(-t / taus)
+  if drag == QUADRATIC:
+    return x0 + v0 * taus * np.log1p(t / taus)
+
+  raise ValueError(f"Unknown drag law {drag!r}, expected {LINEAR!r} or {QUADRATIC!r}")
+
+class DragTrajectory:
+  """Positions and velocities of one fly per tau, sampled at every frame time"""
+  def __init__(self, times, taus, x, v, left_x=None, right_x=None):
+    self.times = np.asarray(times, dtype=float)
+    self.taus = np.atleast_1d(np.asarray(taus, dtype=float))
+    # (len(taus), len(times))
+    self.x = np.asarray(x, dtype=float)
+    self.v = np.asarray(v, dtype=float)
+    # Where the trains were, for the bounce scenarios (the trains don't depend on tau)
+    self.left_x = left_x
+    self.right_x = right_x
+
+  @property
+  def duration(self) -> float:
+    return float(self.times[-1])
+
+  @property
+  def frame_rate(self) -> float:
+    return (len(self.times) - 1) / self.duration
+
+  def get_frame(self, t: float) -> int:
+    """Index of the frame at (or just before) time t"""
+    return int(np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, len(self.times) - 1))
+
+  def sample(self, t: float) -> tuple[np.ndarray, np.ndarray]:
+    """(x, v) of every fly at time t, interpolated between the two closest frames"""
+    t = float(np.clip(t, 0, self.duration))
+    idx = min(self.get_frame(t), len(self.times) - 2)
+    weight = (t - self.times[idx]) / (self.times[idx + 1] - self.times[idx])
+
+    return (
+      self.x[:, idx] + weight * (self.x[:, idx + 1] - self.x[:, idx]),
+      self.v[:, idx] + weight * (self.v[:, idx + 1] - self.v[:, idx]),
+    )
+
+def build_drag_trajectories(taus, v0: float, duration: float, frame_rate=60, x0=0.0, drag=QUADRATIC) -> DragTrajectory:
+  """Trajectories of flies coasting in open air, straight from the closed forms"""
+  times = np.linspace(0, duration, int(round(duration * frame_rate)) + 1)
+
+  return DragTrajectory(
+    times,
+    taus,
+    get_drag_position(times, v0, taus, x0, drag),
+    get_drag_velocity(times, v0, taus, drag),
+  )
+
+def _coast(x: np.ndarray, v: np.ndarray, taus: np.ndarray, v0: float, dt: float, drag: str):
+  """Advances every fly by dt in place. Each step is solved exactly, so the step size only matters for the bounces"""
+  if drag == LINEAR:
+    decay = np.exp(-dt / taus)
+    x += v * taus * (1 - decay)
+    v *= decay
+  else:
+    # Quadratic drag opposes the velocity whichever way the fly is heading
+    growth = 1 + np.abs(v) * dt / (v0 * taus)
+    x += np.sign(v) * v0 * taus * np.log(growth)
+    v /= growth
+
+def integrate_drag_bounces(
+  taus,
+  v0: float,
+  gap: float,
+  train_speed: float,
+  duration: float | None = None,
+  frame_rate=60,
+  steps_per_frame=8,
+  fly_width=0.0,
+  left_x=0.0,
+  restitution=1.0,
+  drag=QUADRATIC,
+) -> DragTrajectory:
+  """
+    The fly bouncing between the approaching trains while drag slows it down, which has no closed form. The fly starts
+    touching the left train at v0. On a bounce it turns around keeping its speed (times the restitution), like the fly
+    of the video, so a bounce never speeds it up. A fly too slow to get away from the train that hit it rides in front
+    of it instead. All taus are integrated together, steps_per_frame exact drag steps between every two frame times,
+    and once the trains meet each fly is pinned to the front of the left train. Runs until the trains meet unless a
+    duration is given (trains standing still, train_speed=0, never meet).
+  """
+  if drag not in (LINEAR, QUADRATIC):
+    raise ValueError(f"Unknown drag law {drag!r}, expected {LINEAR!r} or {QUADRATIC!r}")
+
+  taus = np.atleast_1d(np.asarray(taus, dtype=float))
+  half_width = fly_width / 2
+  meeting_time = max(gap - fly_width, 0) / (2 * train_speed) if train_speed > 0 else np.inf
+  if duration is None:
+    if meeting_time == np.inf:
+      raise ValueError("The trains never meet, give a duration")
+    duration = meeting_time
+
+  frame_count = int(round(duration * frame_rate))
+  times = np.linspace(0, duration, frame_count + 1)
+
+  x = np.full(len(taus), left_x + half_width)
+  v = np.full(len(taus), float(v0))
+  xs, vs = np.empty((len(taus), frame_count + 1)), np.empty((len(taus), frame_count + 1))
+  xs[:, 0], vs[:, 0] = x, v
+
+  for frame in range(1, frame_count + 1):
+    # The steps split the time between this frame and the last, so they land exactly on the frame times
+    dt = (times[frame] - times[frame - 1]) / steps_per_frame
+
+    for step in range(1, steps_per_frame + 1):
+      t = times[frame - 1] + step * dt
+      _coast(x, v, taus, v0, dt, drag)
+
+      if t >= meeting_time - 1e-9:
+        # The trains have met (and stopped), with the fly squashed against the left one
+        x[:] = left_x + train_speed * meeting_time + half_width
+        v[:] = 0
+        continue
+
+      left, right = left_x + train_speed * t, left_x + gap - train_speed * t
+
+      # Mirror whatever went past a train back in front of it and turn it around. Whatever can't outrun the train
+      # rides on its front
+      hit_right = x + half_width > right
+      x[hit_right] = 2 * (right - half_width) - x[hit_right]
+      v[hit_right] = np.minimum(-restitution * v[hit_right], -train_speed)
+      x[hit_right & (v == -train_speed)] = right - half_width
+
+      hit_left = x - half_width < left
+      x[hit_left] = 2 * (left + half_width) - x[hit_left]
+      v[hit_left] = np.maximum(-restitution * v[hit_left], train_speed)
+      x[hit_left & (v == train_speed)] = left + half_width
+
+    xs[:, frame], vs[:, frame] = x, v
+
+  closing = np.minimum(times, meeting_time) * train_speed
+  return DragTrajectory(times, taus, xs, vs, left_x + closing, left_x + gap - closing)
@@ -0,0 +1,136 @@
+import numpy as np
+
+# The roaming state of the fly and the trains (speed, direction, roam trips, clearances), which FlyTrainEvents in
+# roam_events.py drives in every section that roams. It only needs a handful of mobject methods (get_left/get_right,
+# width, shift, flip, suspend/resume_updating), so the same code works on the mobjects of the scene and the
+# bare-coordinate bodies of headless_puzzle.py. The roam_step methods are the old per-frame updaters, only
+# headless_puzzle.py --per-frame still steps them, to compare against the events.
+
+# manim's SMALL_BUFF, how far into the fly's own half width it's allowed to get past an obstacle
+CONTACT_BUFF = 0.1
+
+class FlyRoamingMixin:
+  """The fly roams horizontally between two obstacles at `speed` (scene units per second), turning around on contact"""
+  contact_buff = CONTACT_BUFF
+
+  def init_roaming(self, speed: float):
+    self.speed = speed
+    self.direction = 1
+    self.infinite_roam = False
+    self.roam_trips = 0
+    self._roam_count = 0
+    self.roam_current_trip = False
+
+  def get_obstacle_point_tracker(self, obstacle1, obstacle2, direction: int) -> float:
+    """Gets the x coord of the obstacle the fly is currently heading towards"""
+    return obstacle1.get_right()[0] if direction == -1 else obstacle2.get_left()[0]
+
+  def get_relevant_extreme(self, direction: int) -> float:
+    """Gets the x coord of the side of the fly facing the given direction"""
+    return self.get_left()[0] if direction == -1 else self.get_right()[0]
+
+  def get_clearance(self, obstacle1, obstacle2) -> float:
+    """How far the fly can still go before it collides with the obstacle it's heading towards"""
+    obstacle_x = self.get_obstacle_point_tracker(obstacle1, obstacle2, self.direction)
+    return (obstacle_x - self.get_relevant_extreme(self.direction) - (self.width/2 - self.contact_buff)) * self.direction
+
+  def set_infinite_roam(self, should_roam: bool):
+    """Sets the infinite roam property of the fly"""
+    self.infinite_roam = should_roam
+
+  def set_roam_trips(self, roam_trips):
+    self.roam_trips = roam_trips
+
+  def roam_update(self):
+    """Updates the number of trips that the fly has taken"""
+    self._roam_count += 1
+    if self._roam_count == self.roam_trips:
+      self.infinite_roam = True
+
+  def update_direction(self, dir: int):
+    """Updates the direction of the fly"""
+    self.direction = dir
+
+  def set_force_roam_trip(self, roam_current_trip):
+    self.roam_current_trip = roam_current_trip
+
+  def roam_step(self, obstacle1, obstacle2, dt: float):
+    """
+      One frame of roaming. A long (low fps) frame can take the fly into an obstacle and back out again, so it never
+      steps past an obstacle and spends whatever is left of the frame heading the other way. That's only exact for
+      obstacles that stay put during the frame, the trains have moved for the whole frame already by then.
+    """
+    travel = self.speed * dt
+    bounces = 0
+
+    while travel > 0 and bounces < 2:
+      remaining = self.get_clearance(obstacle1, obstacle2)
+
+      if remaining > 1e-9:
+        step = min(travel, remaining)
+        self.shift(np.array((step * self.direction, 0.0, 0.0)))
+        travel -= step
+
+      elif self.infinite_roam or self.roam_current_trip:
+        self.flip()
+        self.update_direction(self.direction * -1)
+        self.set_force_roam_trip(False)
+        bounces += 1
+
+      else:
+        self.suspend_roaming()
+        break
+
+  def resume_roaming(self):
+    # self.set_infinite_roam(True)
+    self.resume_updating()
+
+  def suspend_roaming(self):
+    """We need this to basically suspend running the updater function, but update a go-ahead flag to be used when the updates resume"""
+    self.set_force_roam_trip(True)
+    self.roam_update()
+    self.suspend_updating()
+
+class TrainRoamingMixin:
+  """A train keeps moving at `speed` (scene units per second) in its direction for as long as it isn't touching the fly"""
+  def init_roaming(self, speed: float, direction: int):
+    self.speed = speed
+    self.direction = direction
+    self.roaming_suspended = False
+
+  def get_clearance(self, fly) -> float:
+    """How far the train can still go before it touches the fly"""
+    train_relevant_extreme = self.get_right()[0] if self.direction == 1 else self.get_left()[0]
+    buff_contact = -fly.width/2 if self.direction == 1 else fly.width/2
+
+    return (buff_contact - (train_relevant_extreme - fly.get_center()[0])) * self.direction
+
+  def roam_step(self, fly, target, dt: float):
+    """
+      One frame of the train moving till it comes in contact with the fly, or till another of the target objects in
+      the vicinity comes in contact with the fly. A train that gets to the fly mid frame waits out the rest of the
+      frame (and the target the next one), so every bounce can hold the trains back by up to a frame and the bounce
+      count and timing depend on the frame rate. FlyTrainEvents in roam_events.py splits the frame at every contact
+      instead, the scene roams with that.
+    """
+    remaining = self.get_clearance(fly)
+
+    if remaining > 1e-9:
+      # Never step into the fly, however long the frame was
+      self.shift(np.array((min(self.speed * dt, remaining) * self.direction, 0.0, 0.0)))
+
+      if target.roaming_suspended:
+        target.resume_roaming()
+
+    else:
+      target.pause_roaming()
+
+  def pause_roaming(self):
+    """Pauses update of the train with every frame"""
+    self.roaming_suspended = True
+    self.suspend_updating()
+
+  def resume_roaming(self):
+    """Resumes update of the train with every frame"""
+    self.roaming_suspended = False
+    self.resume_updating()
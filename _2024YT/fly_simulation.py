@@ -0,0 +1,96 @@
+import numpy as np
+
+# Closed form simulation of the fly bouncing between two approaching trains.
+# Nothing in here knows about manim, positions are plain x coordinates (scene units) and times are in seconds.
+#
+# Each leg of the fly's trip is solved exactly: heading right, the fly and the right train close their gap at
+# (fly_speed + right_speed), heading left it's (fly_speed + left_speed). Stacking those legs up is the geometric
+# series the video explains, so the whole trip is a handful of keyframes no matter what frame rate it's rendered at.
+
+class BounceTimeline:
+  """
+    Keyframes of the fly and train motion, everything moves linearly between them. headless_puzzle.py checks the
+    scene's event legs against these
+  """
+  def __init__(self, times, fly_x, left_x, right_x, directions):
+    self.times = np.asarray(times, dtype=float)
+    self.fly_x = np.asarray(fly_x, dtype=float)
+    self.left_x = np.asarray(left_x, dtype=float)
+    self.right_x = np.asarray(right_x, dtype=float)
+    # direction the fly is heading *from* each keyframe on
+    self.directions = np.asarray(directions, dtype=int)
+
+  @property
+  def leg_lengths(self) -> np.ndarray:
+    return np.abs(np.diff(self.fly_x))
+
+def simulate_fly_between_trains(
+  gap: float,
+  fly_speed: float,
+  left_speed: float,
+  right_speed: float | None = None,
+  fly_width=0.0,
+  left_x=0.0,
+  start_direction=1,
+  max_bounces=1000,
+  min_leg_time=1e-6,
+) -> BounceTimeline:
+  """
+    Solves every bounce of the fly in closed form. `gap` is the distance between the fronts of the two trains, the fly
+    starts touching the left train (or the right one, for start_direction=-1). Bouncing stops once a leg gets shorter
+    than `min_leg_time`, after which the trains just close whatever is left of the gap.
+  """
+  if right_speed is None:
+    right_speed = left_speed
+
+  half_width = fly_width / 2
+  left, right = left_x, left_x + gap
+  fly = left + half_width if start_direction == 1 else right - half_width
+  t = 0.0
+  direction = start_direction
+
+  times, fly_xs, left_xs, right_xs, directions = [t], [fly], [left], [right], [direction]
+
+  while len(times) <= max_bounces:
+    if direction == 1:
+      leg_time = (right - half_width - fly) / (fly_speed + right_speed)
+    else:
+      leg_time = (fly - half_width - left) / (fly_speed + left_speed)
+
+    if leg_time <= min_leg_time:
+      break
+
+    t += leg_time
+    fly += direction * fly_speed * leg_time
+    left += left_speed * leg_time
+    right -= right_speed * leg_time
+    direction *= -1
+
+    times.append(t)
+    fly_xs.append(fly)
+    left_xs.append(left)
+    right_xs.append(right)
+    directions.append(direction)
+
+  # Whatever gap is left is closed by the trains, with the fly pinned to the front of the one it's touching (the one
+  # it's heading away from)
+  closing_time = max(right - left - fly_width, 0) / (left_speed + right_speed)
+  if closing_time > 0:
+    t += closing_time
+    left += left_speed * closing_time
+    right -= right_speed * closing_time
+
+    times.append(t)
+    fly_xs.append(left + half_width if direction == 1 else right - half_width)
+    left_xs.append(left)
+    right_xs.append(right)
+    directions.append(direction)
+
+  return BounceTimeline(times, fly_xs, left_xs, right_xs, directions)
+
+def get_analytic_fly_distance(gap: float, fly_speed: float, left_speed: float, right_speed: float | None = None, fly_width=0.0) -> float:
+  """The "easy solution": the fly flies for as long as the trains take to meet"""
+  if right_speed is None:
+    right_speed = left_speed
+
+  return fly_speed * (gap - fly_width) / (left_speed + right_speed)
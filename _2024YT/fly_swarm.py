@@ -0,0 +1,141 @@
+from manim import *
+
+from track_broadphase import TrackWorld
+
+# A swarm of flies as a single mobject, for the "what if there were lots of flies" variant of the video.
+#
+# A GojoFly is a whole svg with its own updater, so even a hundred of them crawl. Here the flies are just rows of the
+# TrackWorld arrays (position, speed, facing), one updater steps all of them at once, and their points are stamped
+# from a single cached glyph, one numpy op per part of it: no mobject per fly, and nothing re-parsed or re-flipped on
+# a bounce.
+# Zoomed out far enough that a fly is only a few pixels tall, the glyphs aren't worth drawing and the swarm switches to
+# a point cloud (one dot per fly).
+
+class FlySwarm(Group):
+  """
+    Draws every fly of the world. The world is one dimensional so all the flies sit at height y, give or take a
+    random y_spread to keep them from piling up on a single line. Obstacle mobjects (the trains) are kept lined up
+    with the world's obstacles, in the same order. A Group rather than a VGroup, the point cloud isn't a VMobject.
+  """
+  def __init__(
+    self,
+    world: TrackWorld,
+    glyph: VMobject,
+    y=0.0,
+    y_spread=0.0,
+    fly_height=0.15,
+    glyph_facing=-1,
+    color: ParsableManimColor | None = None,
+    min_glyph_pixels=6,
+    dot_size=2,
+    camera_frame: Mobject | None = None,
+    obstacles: list[Mobject] | None = None,
+    seed=0,
+    **kwargs,
+  ):
+    super().__init__(**kwargs)
+    self.world = world
+    self.fly_y = y + np.random.default_rng(seed).uniform(-y_spread / 2, y_spread / 2, world.fly_count)
+    self.fly_height = fly_height
+    self.min_glyph_pixels = min_glyph_pixels
+    self.camera_frame = camera_frame
+    self.obstacles = obstacles or []
+
+    # The glyph, centered and sized once, in both facings, one set of points per part so every part keeps its own
+    # style. Row 0 faces left, row 1 faces right
+    parts = glyph.family_members_with_points()
+    points = np.concatenate([part.points for part in parts])
+    center = (points.min(axis=0) + points.max(axis=0)) / 2
+    scale = fly_height / np.ptp(points[:, 1])
+    self.glyph_points = []
+    for part in parts:
+      part_points = (part.points - center) * scale
+      mirrored = part_points * np.array((-1, 1, 1))
+      self.glyph_points.append(np.stack((part_points, mirrored) if glyph_facing == -1 else (mirrored, part_points)))
+
+    self.body = VGroup(*[VMobject().match_style(part) for part in parts])
+    if color is not None:
+      self.body.set_color(color)
+    self.fly_color = ManimColor(color) if color is not None else parts[0].get_fill_color()
+    self.cloud = PMobject(stroke_width=dot_size)
+
+    # The obstacles are part of the swarm: the swarm updater moves them, and they have to count as moving with it
+    # or the scene would freeze them into the static background
+    self.add(*self.obstacles, self.body, self.cloud)
+    self.update_points()
+
+  @property
+  def fly_count(self) -> int:
+    return self.world.fly_count
+
+  def get_fly_centers(self) -> np.ndarray:
+    """(fly_count, 3) centers of the flies"""
+    return np.stack((self.world.fly_x, self.fly_y, np.zeros(self.fly_count)), axis=1)
+
+  def get_glyph_pixels(self) -> float:
+    """How many pixels tall a fly is with the camera where it is now"""
+    frame_height = self.camera_frame.height if self.camera_frame is not None else config.frame_height
+    return self.fly_height * config.pixel_height / frame_height
+
+  def is_point_cloud(self) -> bool:
+    return self.get_glyph_pixels() < self.min_glyph_pixels
+
+  def get_visible(self, centers: np.ndarray) -> np.ndarray:
+    """Which flies are (at least partly) inside the camera frame"""
+    if self.camera_frame is None:
+      half_size = np.array((config.frame_width, config.frame_height)) / 2
+      frame_center = np.zeros(2)
+    else:
+      half_size = np.array((self.camera_frame.width, self.camera_frame.height)) / 2
+      frame_center = self.camera_frame.get_center()[:2]
+
+    return np.all(np.abs(centers[:, :2] - frame_center) <= half_size + self.fly_height, axis=1)
+
+  def stamp_glyphs(self, part: int, centers: np.ndarray, facing: np.ndarray) -> np.ndarray:
+    """
+      Points of one part of the glyph for the given flies, facing the right way, moved to their centers. A new array
+      every time: the part keeps it as its points, so a copy of the swarm (or its saved state) keeps its own frame
+    """
+    points = np.take(self.glyph_points[part], (facing > 0).astype(int), axis=0)
+    points += centers[:, None, :]
+
+    return points.reshape((-1, 3))
+
+  def update_points(self):
+    """Redraws the swarm from the world's arrays, as glyphs or as a point cloud depending on the zoom"""
+    centers = self.get_fly_centers()
+
+    if self.is_point_cloud():
+      for part in self.body.submobjects:
+        part.points = np.zeros((0, 3))
+      self.cloud.points = centers
+      if len(self.cloud.rgbas) != self.fly_count:
+        self.cloud.rgbas = np.repeat([color_to_rgba(self.fly_color)], self.fly_count, axis=0)
+    else:
+      # Only the flies on screen get a glyph, zoomed in on a few of them the other thousands cost nothing to draw
+      visible = self.get_visible(centers)
+      self.cloud.reset_points()
+      for i, part in enumerate(self.body.submobjects):
+        part.points = self.stamp_glyphs(i, centers[visible], self.world.fly_direction[visible])
+
+    for obstacle, left_x in zip(self.obstacles, self.world.obstacle_left):
+      obstacle.shift(RIGHT * (left_x - obstacle.get_left()[0]))
+
+    return self
+
+  def step(self, dt: float):
+    self.world.step(dt)
+    return self.update_points()
+
+  def start_swarming(self):
+    """Steps the whole world once per frame, a single updater for every fly and obstacle"""
+    def swarm_updater(mob: "FlySwarm", dt):
+      if dt > 0:
+        mob.step(dt)
+
+    self.add_updater(swarm_updater)
+    return self
+
+  def stop_swarming(self):
+    self.clear_updaters()
+    return self
@@ -0,0 +1,337 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from fly_roaming import FlyRoamingMixin, TrainRoamingMixin
+from fly_simulation import get_analytic_fly_distance, simulate_fly_between_trains
+from roam_events import FlyTrainEvents
+
+# Runs the fly/train roaming of the medium solution without manim: no mobjects, no camera, no rasterization. The fly
+# and the trains are bare x intervals driven by the very same FlyTrainEvents the scene uses, advanced frame by frame
+# like its updater, and the result is checked against the closed form answer (100 km, in the video). --per-frame
+# runs the older per-object roam_step updaters instead, which can hold a train back for up to a frame per bounce, so
+# how far off they end up depends on the frame rate and the bounce count: that's only reported, never passes or fails.
+# Usage (from the project root):
+#   python _2024YT/headless_puzzle.py [--gap 10] [--fly-speed 3.75] [--train-speed 1.875] [--frame-rate 60]
+#   python _2024YT/headless_puzzle.py --sweep 1000 [--per-frame]
+
+# The video's setup: the trains start 100 km apart at 50 km/hr each and the fly does 100 km/hr
+VIDEO_GAP_KM = 100
+VIDEO_FLY_DISTANCE_KM = 100
+# The events fire at the exact contact times, the only error left is the trains stopping once the fly has less than
+# min_leg left to go between them
+MIN_LEG = 1e-3
+# The events and the closed form bounces solve the same legs, they only part ways by float error
+TIMELINE_TOLERANCE = 1e-9
+
+class HeadlessBody:
+  """A bare x interval with just enough of the mobject api for the roaming logic"""
+  def __init__(self, left: float, right: float):
+    self.left_x = left
+    self.right_x = right
+    self.updating_suspended = False
+
+  @property
+  def width(self) -> float:
+    return self.right_x - self.left_x
+
+  def get_left(self) -> tuple[float, float, float]:
+    return (self.left_x, 0.0, 0.0)
+
+  def get_right(self) -> tuple[float, float, float]:
+    return (self.right_x, 0.0, 0.0)
+
+  def get_center(self) -> tuple[float, float, float]:
+    return ((self.left_x + self.right_x) / 2, 0.0, 0.0)
+
+  def shift(self, vector):
+    self.left_x += vector[0]
+    self.right_x += vector[0]
+    return self
+
+  def flip(self):
+    # An interval looks the same both ways
+    return self
+
+  def suspend_updating(self):
+    self.updating_suspended = True
+
+  def resume_updating(self):
+    self.updating_suspended = False
+
+class HeadlessFly(FlyRoamingMixin, HeadlessBody):
+  """The fly, keeping track of how far it went on every leg"""
+  def __init__(self, x: float, width: float, speed: float, contact_buff: float):
+    HeadlessBody.__init__(self, x - width / 2, x + width / 2)
+    self.init_roaming(speed)
+    self.contact_buff = contact_buff
+    self.legs = [0.0]
+
+  def shift(self, vector):
+    self.legs[-1] += abs(vector[0])
+    return super().shift(vector)
+
+  def update_direction(self, dir: int):
+    super().update_direction(dir)
+    self.legs.append(0.0)
+
+class HeadlessTrain(TrainRoamingMixin, HeadlessBody):
+  def __init__(self, left: float, right: float, speed: float, direction: int):
+    HeadlessBody.__init__(self, left, right)
+    self.init_roaming(speed, direction)
+
+def step_events(fly: HeadlessFly, left_train: HeadlessTrain, right_train: HeadlessTrain, dt: float, max_time: float) -> tuple[bool, float | None, list[float]]:
+  """
+    The scene's FlyTrainEvents, advanced a frame at a time. The meeting time and the times the fly got to a train are
+    the exact event times, not frames, less the time everything sat waiting for the next leg (roam_trips)
+  """
+  roaming = FlyTrainEvents(fly, left_train, right_train, min_leg=MIN_LEG)
+  meeting = []
+  leg_ends = []
+  contacts = []
+  waited = 0.0
+  roaming.bus.subscribe("meet", lambda time: meeting.append(time))
+  roaming.bus.subscribe("leg_end", lambda time: leg_ends.append(time))
+  roaming.bus.subscribe("fly_contact", lambda time, direction: contacts.append(time - waited))
+
+  frame = 0
+  while frame * dt < max_time and not roaming.stopped:
+    if roaming.fly_suspended:
+      waited += roaming.scheduler.time - leg_ends[-1]
+      roaming.resume()
+
+    roaming.scheduler.advance(dt)
+    frame += 1
+
+  return roaming.stopped, meeting[0] - waited if meeting else None, contacts
+
+def step_per_frame(fly: HeadlessFly, left_train: HeadlessTrain, right_train: HeadlessTrain, dt: float, max_time: float) -> tuple[bool, float | None]:
+  """The per-object roam_step updaters, in the order the medium solution used to add them to the scene"""
+  frame = 0
+
+  while frame * dt < max_time:
+    trains_x = (left_train.right_x, right_train.left_x)
+
+    if fly.updating_suspended:
+      fly.resume_roaming()
+      left_train.resume_roaming()
+      right_train.resume_roaming()
+
+    if not left_train.updating_suspended:
+      left_train.roam_step(fly, right_train, dt)
+    if not right_train.updating_suspended:
+      right_train.roam_step(fly, left_train, dt)
+    if not fly.updating_suspended:
+      fly.roam_step(left_train, right_train, dt)
+
+    frame += 1
+    train_gap = right_train.left_x - left_train.right_x
+
+    if train_gap <= fly.width + 1e-9:
+      return True, frame * dt
+
+    # Neither train got to move and the fly is bouncing in a gap narrower than it flies in a frame: each train is
+    # holding the other one back, which is as close as frame by frame updaters get to the trains meeting
+    if trains_x == (left_train.right_x, right_train.left_x) and train_gap - fly.width < fly.speed * dt:
+      return True, frame * dt
+
+  return False, None
+
+def simulate_puzzle(
+  gap: float,
+  fly_speed: float,
+  train_speed: float,
+  fly_width=0.0,
+  contact_buff=0.0,
+  frame_rate=60,
+  infinite_roam=True,
+  roam_trips=0,
+  max_time: float | None = None,
+  per_frame=False,
+) -> dict:
+  """
+    Runs the trains and the fly until the trains meet. Whenever the fly stops at a train (roam_trips) everything is
+    resumed on the next frame, like the scene does between legs. contact_buff is 0 by default so the fly is a plain
+    interval, the scene uses CONTACT_BUFF.
+  """
+  train_length = 1.0
+  left_train = HeadlessTrain(-train_length, 0.0, train_speed, direction=1)
+  right_train = HeadlessTrain(gap, gap + train_length, train_speed, direction=-1)
+  fly = HeadlessFly(fly_width / 2, fly_width, fly_speed, contact_buff)
+  fly.set_infinite_roam(infinite_roam)
+  fly.set_roam_trips(roam_trips)
+
+  analytic_time = max(gap - fly_width, 0) / (2 * train_speed)
+  max_time = 10 * analytic_time + 1 if max_time is None else max_time
+  dt = 1 / frame_rate
+
+  if per_frame:
+    collided, collision_time = step_per_frame(fly, left_train, right_train, dt, max_time)
+    contact_times = None
+  else:
+    collided, collision_time, contact_times = step_events(fly, left_train, right_train, dt, max_time)
+
+  legs = [leg for leg in fly.legs if leg > 0]
+  fly_distance = sum(legs)
+  analytic_distance = get_analytic_fly_distance(gap, fly_speed, train_speed, fly_width=fly_width)
+
+  return {
+    "gap": gap,
+    "fly_speed": fly_speed,
+    "train_speed": train_speed,
+    "fly_width": fly_width,
+    "frame_rate": frame_rate,
+    "collided": collided,
+    "per_frame": per_frame,
+    "collision_time": collision_time,
+    "contact_times": contact_times,
+    "final_gap": right_train.left_x - left_train.right_x - fly_width,
+    "analytic_collision_time": analytic_time,
+    "bounces": len(legs) - 1 if legs else 0,
+    "legs": legs,
+    "fly_distance": fly_distance,
+    "analytic_fly_distance": analytic_distance,
+    "relative_error": abs(fly_distance - analytic_distance) / analytic_distance if analytic_distance else 0.0,
+  }
+
+def get_allowed_error(result: dict) -> tuple[float, float]:
+  """How far off the closed form the fly distance and the meeting time can be, from the stepping alone"""
+  # Stopped with less than MIN_LEG left between the fly and a train, which the trains would have closed in under
+  # MIN_LEG / train speed, with the fly flying all along
+  closing_time = MIN_LEG / result["train_speed"]
+  return result["fly_speed"] * closing_time, closing_time
+
+def compare_with_timeline(result: dict) -> tuple[float, float]:
+  """
+    How far the event legs (the fly's distance and the time it got to a train, leg by leg) are off the closed form
+    bounces of simulate_fly_between_trains. The events stop bouncing MIN_LEG short of the meeting, so only the legs
+    both of them finished are compared
+  """
+  timeline = simulate_fly_between_trains(result["gap"], result["fly_speed"], result["train_speed"], fly_width=result["fly_width"])
+  legs = min(len(result["contact_times"]), len(timeline.times) - 2)
+  if not legs:
+    return 0.0, 0.0
+
+  leg_error = np.abs(np.asarray(result["legs"][:legs]) - timeline.leg_lengths[:legs]).max()
+  time_error = np.abs(np.asarray(result["contact_times"][:legs]) - timeline.times[1:legs + 1]).max()
+  return float(leg_error), float(time_error)
+
+def check_video_answer(result: dict) -> dict:
+  """
+    Scales the result to the video's units (the gap is 100 km) and checks the fly covered the closed form distance,
+    i.e. 100 km in the video's setup, and the trains met when they should, both within what the stepping allows. Every
+    leg has to match the closed form bounces as well, up to float error. The per-frame updaters are only reported (ok is None), next to what the events got for the same setup
+  """
+  km_per_unit = VIDEO_GAP_KM / result["gap"]
+  fly_distance_km = result["fly_distance"] * km_per_unit
+
+  if result["per_frame"]:
+    events = simulate_puzzle(
+      result["gap"], result["fly_speed"], result["train_speed"], fly_width=result["fly_width"], frame_rate=result["frame_rate"],
+    )
+    return {
+      **result,
+      "fly_distance_km": fly_distance_km,
+      "legs_km": [leg * km_per_unit for leg in result["legs"]],
+      "events_bounces": events["bounces"],
+      "events_collision_time": events["collision_time"],
+      "ok": None,
+    }
+
+  # The video's speeds exactly, not just close to them
+  is_video_setup = result["fly_speed"] == 2 * result["train_speed"] and result["fly_width"] == 0
+  allowed_error, allowed_delay = get_allowed_error(result)
+  error = abs(result["fly_distance"] - result["analytic_fly_distance"])
+  on_time = result["collided"] and abs(result["collision_time"] - result["analytic_collision_time"]) <= allowed_delay
+  leg_error, contact_time_error = compare_with_timeline(result)
+
+  return {
+    **result,
+    "fly_distance_km": fly_distance_km,
+    "legs_km": [leg * km_per_unit for leg in result["legs"]],
+    "allowed_error_km": allowed_error * km_per_unit,
+    "timeline_leg_error": leg_error,
+    "timeline_contact_time_error": contact_time_error,
+    "ok": bool(on_time and error <= allowed_error and max(leg_error, contact_time_error) <= TIMELINE_TOLERANCE
+      and (not is_video_setup or abs(fly_distance_km - VIDEO_FLY_DISTANCE_KM) <= allowed_error * km_per_unit)),
+  }
+
+def sweep(count: int, per_frame=False, seed=0) -> dict:
+  """
+    Simulates `count` random setups (gap, speeds, frame rate) and reports the ones that miss the closed form. With
+    per_frame there's nothing to miss, it reports how far the updaters strayed from the events instead
+  """
+  rng = np.random.default_rng(seed)
+  start = time.perf_counter()
+  failures = []
+  max_error = 0.0
+  max_delay = 0.0
+  max_bounce_difference = 0
+
+  for _ in range(count):
+    train_speed = float(rng.uniform(.5, 3))
+    result = check_video_answer(
+      simulate_puzzle(
+        gap=float(rng.uniform(2, 20)),
+        fly_speed=train_speed * float(rng.uniform(1.2, 5)),
+        train_speed=train_speed,
+        frame_rate=int(rng.choice((15, 30, 60))),
+        per_frame=per_frame,
+      ),
+    )
+    max_error = max(max_error, result["relative_error"])
+
+    if per_frame:
+      if result["collided"] and result["events_collision_time"] is not None:
+        max_delay = max(max_delay, abs(result["collision_time"] - result["events_collision_time"]))
+      max_bounce_difference = max(max_bounce_difference, abs(result["bounces"] - result["events_bounces"]))
+
+    elif not result["ok"]:
+      failures.append({key: result[key] for key in ("gap", "fly_speed", "train_speed", "frame_rate", "fly_distance", "analytic_fly_distance")})
+
+  report = {
+    "setups": count,
+    "failures": failures,
+    "max_relative_error": max_error,
+    "elapsed": time.perf_counter() - start,
+  }
+  if per_frame:
+    report.update(informational=True, max_collision_delay=max_delay, max_bounce_difference=max_bounce_difference)
+
+  return report
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Simulate the fly puzzle without rendering and check it against the closed form")
+  parser.add_argument("--gap", type=float, default=10, help="distance between the trains (scene units)")
+  parser.add_argument("--fly-speed", type=float, default=3.75, help="scene units per second")
+  parser.add_argument("--train-speed", type=float, default=1.875, help="scene units per second")
+  parser.add_argument("--fly-width", type=float, default=0.0)
+  parser.add_argument("--frame-rate", type=int, default=60)
+  parser.add_argument("--roam-trips", type=int, default=0, help="legs after which the fly pauses, like the medium solution")
+  parser.add_argument("--sweep", type=int, default=0, help="simulate this many random setups instead")
+  parser.add_argument("--per-frame", action="store_true", help="step the per-object roam_step updaters instead of the events, report only")
+  args = parser.parse_args()
+
+  if args.sweep:
+    report = sweep(args.sweep, args.per_frame)
+    ok = not report["failures"]
+  else:
+    report = check_video_answer(
+      simulate_puzzle(
+        args.gap,
+        args.fly_speed,
+        args.train_speed,
+        fly_width=args.fly_width,
+        frame_rate=args.frame_rate,
+        infinite_roam=not args.roam_trips,
+        roam_trips=args.roam_trips,
+        per_frame=args.per_frame,
+      ),
+    )
+    ok = report["ok"] is not False
+
+  print(json.dumps(report, indent=2))
+  sys.exit(0 if ok else 1)
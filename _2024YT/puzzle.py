@@ -1,84 +1,232 @@
 from manim import *
-
-class SimpleTrain(VMobject):
-  def __init__(self, no_of_cars=1, no_of_tyre_groups=2, **kwargs):
+import os
+from fly_drag import DragTrajectory, integrate_drag_bounces
+from fly_roaming import FlyRoamingMixin, TrainRoamingMixin
+from roam_events import FlyTrainEvents
+from tex_batch import TexBatchMixin
+from compile_assets import load_compiled_svg
+from asset_manifest import AssetManifest
+from track_broadphase import TrackWorld
+from fly_swarm import FlySwarm
+from bounded_trace import BoundedTracedPath
+
+class CachedBoundsMixin:
+  """
+    Keeps the bounding box of the mobject around, so get_left/get_right/get_center and width/height don't rescan every
+    point of the svg on each call. Shifting (and so move_to/next_to) carries the cached box along with it, anything that
+    changes the points in any other way throws it away and it gets recomputed on the next lookup.
+
+    NOTE: transform the mobject itself, transforming one of its submobjects directly leaves the cached box stale.
+  """
+  _bounds = None
+
+  def get_bounds(self) -> np.ndarray | None:
+    """Returns the (min, max) corners of the bounding box, only scanning the points if they changed non-rigidly"""
+    if self._bounds is None:
+      points = self.get_points_defining_boundary()
+      if len(points) == 0:
+        return None
+      self._bounds = np.array((points.min(axis=0), points.max(axis=0)))
+
+    return self._bounds
+
+  def invalidate_bounds(self):
+    for mob in self.get_family():
+      if isinstance(mob, CachedBoundsMixin):
+        mob._bounds = None
+    return self
+
+  def get_critical_point(self, direction):
+    bounds = self.get_bounds()
+    if bounds is None:
+      return super().get_critical_point(direction)
+
+    direction = np.asarray(direction)
+    return np.where(direction > 0, bounds[1], np.where(direction < 0, bounds[0], (bounds[0] + bounds[1]) / 2))
+
+  def length_over_dim(self, dim: int) -> float:
+    bounds = self.get_bounds()
+    if bounds is None:
+      return super().length_over_dim(dim)
+
+    return bounds[1][dim] - bounds[0][dim]
+
+  def shift(self, *vectors):
+    super().shift(*vectors)
+    total_vector = np.sum(np.array(vectors, dtype=float), axis=0)
+
+    for mob in self.get_family():
+      if isinstance(mob, CachedBoundsMixin) and mob._bounds is not None:
+        mob._bounds = mob._bounds + total_vector
+
+    return self
+
+  def flip(self, axis=UP, **kwargs):
+    # Mirroring about the center along one of the axes leaves the bounding box exactly where it was
+    bounds = self._bounds
+    super().flip(axis, **kwargs)
+
+    if bounds is not None and not kwargs and np.count_nonzero(axis) == 1:
+      self._bounds = bounds
+
+    return self
+
+  # Everything below can move points around non-rigidly
+  def apply_points_function_about_point(self, *args, **kwargs):
+    super().apply_points_function_about_point(*args, **kwargs)
+    return self.invalidate_bounds()
+
+  def set_points(self, *args, **kwargs):
+    super().set_points(*args, **kwargs)
+    return self.invalidate_bounds()
+
+  def become(self, *args, **kwargs):
+    super().become(*args, **kwargs)
+    return self.invalidate_bounds()
+
+  def interpolate(self, *args, **kwargs):
+    super().interpolate(*args, **kwargs)
+    return self.invalidate_bounds()
+
+  def pointwise_become_partial(self, *args, **kwargs):
+    super().pointwise_become_partial(*args, **kwargs)
+    return self.invalidate_bounds()
+
+  def add(self, *mobjects):
+    super().add(*mobjects)
+    return self.invalidate_bounds()
+
+  def remove(self, *mobjects):
+    super().remove(*mobjects)
+    return self.invalidate_bounds()
+
+class SimpleTrain(TrainRoamingMixin, CachedBoundsMixin, VMobject):
+  def __init__(self, no_of_cars=1, no_of_tyre_groups=2, use_templates=True, **kwargs):
     super().__init__(**kwargs)
 
     self.train = VGroup()
     self.cars = VGroup()
     self.colors = ["#6a6a6a", "#f7f7f7"]
 
-    for idx in range(no_of_cars):
-      car = VGroup()
-      tyres = VGroup()
-      windows = VGroup()
-
-      # Create the other cars and add windows for them
-      if (idx != no_of_cars - 1):
-        car.add(Rectangle(height=1, width=3, fill_color=WHITE, fill_opacity=1)).set_color_by_gradient(self.colors)
-        window_a = Rectangle(height=car.height*.45, width=car.width*.35, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
-        window_b = Rectangle(height=car.height*.45, width=car.width*.35, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
-        windows.add(window_a, window_b).arrange_in_grid(1, buff=.35)
-        windows.move_to(car).shift(UP*0.1)
-
-      if (idx == no_of_cars - 1):
-        main_car = Rectangle(height=1.5, width=3, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
-        masked_section = Rectangle(height=main_car.height*.45, width=main_car.width*.5, color=None, fill_color=BLACK, fill_opacity=1)
-        masked_section.move_to(main_car, aligned_edge=(UP + RIGHT)).shift(UP*.05 + RIGHT*.02)
-
-        # Chimney
-        chimneys = VGroup()
-        chimney_one = Rectangle(height=main_car.height*.45, width=main_car.width*.125, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
-        chimney_two = Rectangle(height=main_car.height*.25, width=main_car.width*.1, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
-        chimneys.add(chimney_one, chimney_two).arrange_in_grid(1, buff=.3, row_alignments="d").move_to(masked_section, aligned_edge=DOWN)
-
-        # Windows
-        window_a = Rectangle(height=main_car.height*.35, width=main_car.width*.16, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
-        window_b = Rectangle(height=main_car.height*.35, width=main_car.width*.16, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
-        windows.add(window_a, window_b).arrange_in_grid(1, buff=.18)
-        windows.move_to(main_car).shift(UP*0.3 + LEFT * .76)
-
-        # Add the headlight
-        headlight = Rectangle(height=.3, width=0.15, color=GRAY_D, fill_color=GRAY_D, fill_opacity=1)\
-                .next_to(main_car, direction=RIGHT, buff=0.05)\
-                .shift(DOWN*.45)\
-                .set_z_index(-1)
-
-        car.add(main_car, masked_section, chimneys, headlight)
-
-      for _ in range(no_of_tyre_groups):
-        inner_tyre_size, outre_tyre_size = 0.12, 0.3
-
-        if (idx == no_of_cars-1):
-          outre_tyre_size, inner_tyre_size = 0.9, 0.45
-
-        sub_tyres_group = VGroup().add(self._create_tyre(VGroup(), outre_tyre_size, inner_tyre_size), self._create_tyre(VGroup(), outre_tyre_size, inner_tyre_size))
-
-        sub_tyres_group.arrange_in_grid(1, buff=.15)
-        tyres.add(sub_tyres_group)
-
-      tyres.arrange_in_grid(1, buff=0.50)\
-        .next_to(car, direction=DOWN, buff=(0 if idx == no_of_cars-1 else 0.15))\
-        .shift(((UP * 0.8 + LEFT * 0.1) if idx == no_of_cars-1 else UP * 0.35))\
-        .set_z_index(-1)\
-        .scale(car.width/tyres.width * 0.85)
-
-      # Add the belt for each car
-      if (idx != 0):
-        belt = Rectangle(height=.2, width=0.5, color=GRAY_C, fill_color=GRAY_C, fill_opacity=1)\
-                .next_to(car, direction=LEFT, buff=0.05)\
-                .shift(DOWN*.5)\
-                .set_z_index(-1)
-        car.add(belt)
-
-      car.add(tyres)
-      car.add(windows)
-      self.cars.add(car).arrange_in_grid(1, buff=0.0375, row_alignments="d")
-
+    if use_templates:
+      self._stamp_cars(no_of_cars, no_of_tyre_groups)
       self.train.add(self.cars)
 
+    else:
+      for idx in range(no_of_cars):
+        car = self._create_car(idx == no_of_cars - 1, idx != 0, no_of_tyre_groups)
+        self.cars.add(car).arrange_in_grid(1, buff=0.0375, row_alignments="d")
+
+        self.train.add(self.cars)
+
     self.add(self.train)
 
+  def _create_car(self, is_locomotive: bool, has_belt: bool, no_of_tyre_groups=2) -> VGroup:
+    """Builds (and lays out) a single car of the train from scratch"""
+    car = VGroup()
+    tyres = VGroup()
+    windows = VGroup()
+
+    # Create the other cars and add windows for them
+    if (not is_locomotive):
+      car.add(Rectangle(height=1, width=3, fill_color=WHITE, fill_opacity=1)).set_color_by_gradient(self.colors)
+      window_a = Rectangle(height=car.height*.45, width=car.width*.35, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
+      window_b = Rectangle(height=car.height*.45, width=car.width*.35, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
+      windows.add(window_a, window_b).arrange_in_grid(1, buff=.35)
+      windows.move_to(car).shift(UP*0.1)
+
+    if (is_locomotive):
+      main_car = Rectangle(height=1.5, width=3, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
+      masked_section = Rectangle(height=main_car.height*.45, width=main_car.width*.5, color=None, fill_color=BLACK, fill_opacity=1)
+      masked_section.move_to(main_car, aligned_edge=(UP + RIGHT)).shift(UP*.05 + RIGHT*.02)
+
+      # Chimney
+      chimneys = VGroup()
+      chimney_one = Rectangle(height=main_car.height*.45, width=main_car.width*.125, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
+      chimney_two = Rectangle(height=main_car.height*.25, width=main_car.width*.1, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
+      chimneys.add(chimney_one, chimney_two).arrange_in_grid(1, buff=.3, row_alignments="d").move_to(masked_section, aligned_edge=DOWN)
+
+      # Windows
+      window_a = Rectangle(height=main_car.height*.35, width=main_car.width*.16, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
+      window_b = Rectangle(height=main_car.height*.35, width=main_car.width*.16, color=GRAY_D, fill_color=GRAY_E, fill_opacity=1)
+      windows.add(window_a, window_b).arrange_in_grid(1, buff=.18)
+      windows.move_to(main_car).shift(UP*0.3 + LEFT * .76)
+
+      # Add the headlight
+      headlight = Rectangle(height=.3, width=0.15, color=GRAY_D, fill_color=GRAY_D, fill_opacity=1)\
+              .next_to(main_car, direction=RIGHT, buff=0.05)\
+              .shift(DOWN*.45)\
+              .set_z_index(-1)
+
+      car.add(main_car, masked_section, chimneys, headlight)
+
+    for _ in range(no_of_tyre_groups):
+      inner_tyre_size, outre_tyre_size = 0.12, 0.3
+
+      if (is_locomotive):
+        outre_tyre_size, inner_tyre_size = 0.9, 0.45
+
+      sub_tyres_group = VGroup().add(self._create_tyre(VGroup(), outre_tyre_size, inner_tyre_size), self._create_tyre(VGroup(), outre_tyre_size, inner_tyre_size))
+
+      sub_tyres_group.arrange_in_grid(1, buff=.15)
+      tyres.add(sub_tyres_group)
+
+    tyres.arrange_in_grid(1, buff=0.50)\
+      .next_to(car, direction=DOWN, buff=(0 if is_locomotive else 0.15))\
+      .shift(((UP * 0.8 + LEFT * 0.1) if is_locomotive else UP * 0.35))\
+      .set_z_index(-1)\
+      .scale(car.width/tyres.width * 0.85)
+
+    # Add the belt for each car
+    if (has_belt):
+      belt = Rectangle(height=.2, width=0.5, color=GRAY_C, fill_color=GRAY_C, fill_opacity=1)\
+              .next_to(car, direction=LEFT, buff=0.05)\
+              .shift(DOWN*.5)\
+              .set_z_index(-1)
+      car.add(belt)
+
+    car.add(tyres)
+    car.add(windows)
+
+    return car
+
+  def _stamp_cars(self, no_of_cars: int, no_of_tyre_groups=2):
+    """
+      Builds each kind of car (passenger/locomotive, with/without a belt) only once and stamps out shifted copies
+      of it, so long trains skip the gradients, grid arrangements and next_to's for every car. Cars end up exactly
+      where arranging them in a grid after every add would put them: left to right, bottom aligned, 0.0375 apart, and
+      the row centered on the center of the previous row and the new car (where it was built) taken together.
+    """
+    buff = 0.0375
+    templates = {}
+    cursor = 0
+    row_height = 0
+    # Bounding box the grid layout would have given the row so far
+    row_box = None
+
+    for idx in range(no_of_cars):
+      kind = (idx == no_of_cars - 1, idx != 0)
+
+      if kind not in templates:
+        template = self._create_car(*kind, no_of_tyre_groups)
+        templates[kind] = (template, template.get_corner(DL), template.get_corner(UR))
+
+      template, low, high = templates[kind]
+      self.cars.add(template.copy().shift(RIGHT * cursor - low))
+      cursor += high[0] - low[0] + buff
+      row_height = max(row_height, high[1] - low[1])
+
+      # arrange_in_grid moves the arranged row back onto the center everything had before it was arranged
+      if row_box is not None:
+        low, high = np.minimum(low, row_box[0]), np.maximum(high, row_box[1])
+      center = (low + high) / 2
+      half_size = np.array(((cursor - buff) / 2, row_height / 2, 0))
+      row_box = (center - half_size, center + half_size)
+
+    # The stamped row has its bottom left corner at the origin
+    if row_box is not None:
+      self.cars.shift(row_box[0])
+
   def _create_tyre(self, tyre_group, tyre_size=0.3, tyre_rim_size=0.12) -> VMobject:
     tyre = Circle(color=WHITE, radius=tyre_size, fill_color=WHITE, fill_opacity=1).set_color_by_gradient(self.colors)
     tyre_rim = Circle(color=LOGO_BLACK, radius=tyre_rim_size, fill_color=BLACK, fill_opacity=.75).move_to(tyre)
@@ -86,960 +234,1365 @@ class SimpleTrain(VMobject):
 
     return tyre_group
 
-class GojoFly(SVGMobject):
-  def __init__(self, file_name, color, **kwargs):
-    super().__init__(file_name, **kwargs)
-    self.fly = SVGMobject(file_name).set_color(color)
-    self.add(self.fly)
-    self.direction = 1
-    self.infinite_roam = False
-    self.roam_trips = 0
-    self._roam_count = 0
-    self.roam_current_trip = False
-
-  def get_obstacle_point_tracker(self, obstacle1: VMobject, obstacle2: VMobject) -> dict[int, float]:
-    """Gets the current points of the obstacles we actually need only the x coord"""
-    p1 = obstacle1.get_right()[0]
-    p2 = obstacle2.get_left()[0]
-
-    return {
-      -1: p1,
-      1: p2
-    }
-
-  def get_relevant_extreme(self):
-    """Gets the relevant coord of the fly mobject"""
-    p1 = self.fly.get_left()[0]
-    p2 = self.fly.get_right()[0]
-
-    return {
-      -1: p1,
-      1: p2
-    }
-
-  def set_infinite_roam(self, should_roam: bool):
-    """Sets the infinite roam property of the fly"""
-    self.infinite_roam = should_roam
-
-  def set_roam_trips(self, roam_trips):
-    self.roam_trips = roam_trips
-
-  def roam_update(self):
-    """Updates the number of trips that the fly has taken"""
-    self._roam_count += 1
-    if self._roam_count == self.roam_trips:
-      self.infinite_roam = True
-
-  def update_direction(self, dir: int):
-    """Updates the direction of the fly"""
-    self.direction = dir
+class GojoFly(FlyRoamingMixin, CachedBoundsMixin, VMobject):
+  # Scene units per second. The roaming used to move a fixed .0625 per frame, this is that at the 60 fps of -qh
+  DEFAULT_SPEED = 3.75
 
-  def restore_position(self):
-    return super().restore()
-
-  def set_force_roam_trip(self, roam_current_trip):
-    self.roam_current_trip = roam_current_trip
-
-  def roam(self, ob1: VMobject, ob2: VMobject, infiniteRoam=True, roam_trips=0):
-    """Allows the fly to roam horizontally, changing direction if a collision is detected"""
-    self.set_infinite_roam(infiniteRoam)
-    self.set_roam_trips(roam_trips)
-    # Add an updater to track the motion of the left and right trains
-    def obstacle_updater(mob: VMobject, dt):
-      # if self.direction == 1:
-      has_not_collided = (self.get_obstacle_point_tracker(ob1, ob2)[self.direction] - self.get_relevant_extreme()[self.direction]) * self.direction >= ((mob.width/2 - SMALL_BUFF) * self.direction)
-
-      has_collided = not has_not_collided
-
-      if (has_not_collided):
-        mob.move_to(
-          np.array((
-            mob.get_center()[0] + .0625 * self.direction,
-            mob.get_center()[1],
-            0
-          )),
-        )
+  mirrored = False
+  flap_frame = 0
 
-      elif has_collided and (self.infinite_roam or self.roam_current_trip):
-        self.flip()
-        self.update_direction(self.direction * -1)
-        self.set_force_roam_trip(False)
+  def __init__(self, file_name, color, speed=DEFAULT_SPEED, **kwargs):
+    # Pose sprites: the fly's content (its submobjects) in every (mirrored, flap frame) it has been shown in, each with
+    # the center it was at when it was last on screen. Switching poses just swaps which content is the submobjects.
+    # Set before the svg loads, the loading already goes through invalidate_bounds
+    self._poses: dict = {}
+    # (content, mirrored) every flap frame was added as, to rebuild the poses from once a transform drops them
+    self._flap_sources: list = []
+    super().__init__(**kwargs)
+    self.file_name = file_name
+    self.add(*load_compiled_svg(file_name).submobjects)
+    self.fly = load_compiled_svg(file_name).set_color(color)
+    self.add(self.fly)
+    self.init_roaming(speed)
 
-      else:
-        self.suspend_roaming()
+  def invalidate_bounds(self):
+    # Anything that moved the points other than a shift leaves the hidden poses behind, they get rebuilt when needed
+    self._poses = {}
+    return super().invalidate_bounds()
 
-    self.add_updater(obstacle_updater)
+  def add_flap_frames(self, *frames: VMobject):
+    """
+      Extra wing positions for the fly, each stretched over the fly as it is now and facing the way it faces now. Frame 0
+      is the fly itself, show the others with set_flap_frame
+    """
+    if not self._flap_sources:
+      self._flap_sources = [([mob.copy() for mob in self.submobjects], self.mirrored)]
 
-  def resume_roaming(self):
-    # self.set_infinite_roam(True)
-    self.resume_updating()
+    for frame in frames:
+      self._flap_sources.append(([frame.copy().replace(self, stretch=True)], self.mirrored))
 
-  def suspend_roaming(self):
-    """We need this to basically suspend running the updater function, but update a go-ahead flag to be used when the updates resume"""
-    self.set_force_roam_trip(True)
-    self.roam_update()
-    self.suspend_updating()
+    return self
 
-  def clear_all_updaters(self):
-    self.clear_updaters()
+  def _build_pose(self, mirrored: bool, flap_frame: int) -> list[Mobject]:
+    """The content of a pose that isn't cached, from the one on screen if it's the same frame, else from its source"""
+    if flap_frame == self.flap_frame:
+      content, source_mirrored = [mob.copy() for mob in self.submobjects], self.mirrored
+    else:
+      source, source_mirrored = self._flap_sources[flap_frame]
+      content = [mob.copy() for mob in source]
+      VGroup(*content).replace(self, stretch=True)
 
-class ComplexTrain(SVGMobject):
-  def __init__(self, file_name, color, direction, **kwargs):
-    super().__init__(file_name, **kwargs)
-    self.train = SVGMobject(file_name).set_color(color)
-    self.direction = direction
-    self.roaming_suspended = False
-    self.add(self.train)
+    if mirrored != source_mirrored:
+      # Mirroring about the fly's own center, so the pose covers exactly the same box as the one on screen
+      VGroup(*content).rotate(PI, axis=UP, about_point=self.get_center())
+
+    return content
 
-  def roam_before_fly_contact(self, fly: GojoFly, target: SVGMobject):
+  def set_pose(self, mirrored: bool, flap_frame: int | None = None):
     """
-      Allows the train to basically keep moving till it comes in contact with the fly
-      or till another of the target objects in the vicinity comes in contact with the fly.
+      Shows the fly mirrored (or not) and in the given flap frame, by swapping its content for the cached pose. The
+      pose only has to catch up with how far the fly moved since it was last shown, no point gets mirrored again
     """
-    def train_updater(mob: VMobject):
-      train_relevant_extreme = mob.get_right() if self.direction == 1 else mob.get_left()
-      fly_center = fly.get_center()
-      buff_contact = -fly.width/2 if self.direction == 1 else fly.width/2
+    flap_frame = self.flap_frame if flap_frame is None else flap_frame
+    if (mirrored, flap_frame) == (self.mirrored, self.flap_frame):
+      return self
+
+    center = self.get_center()
+    bounds = self._bounds
+    pose = self._poses.get((mirrored, flap_frame))
+
+    if pose is None:
+      content = self._build_pose(mirrored, flap_frame)
+    else:
+      content, pose_center = pose
+      if not np.allclose(pose_center, center):
+        for mob in content:
+          mob.shift(center - pose_center)
+
+    self._poses[(self.mirrored, self.flap_frame)] = (self.submobjects, center)
+    self.mirrored, self.flap_frame = mirrored, flap_frame
+    # Assigned directly, add/remove would throw every cached pose and the bounds away
+    self.submobjects = content
+    self.fly = content[-1]
+    self._bounds = bounds
+
+    return self
 
-      has_not_collided = (train_relevant_extreme[0] - fly_center[0]) * self.direction <= self.direction * buff_contact
+  def set_flap_frame(self, flap_frame: int):
+    return self.set_pose(self.mirrored, flap_frame)
 
-      if (has_not_collided):
-        mob.move_to((
-          np.array((
-            mob.get_center()[0] + .03125 * self.direction,
-            mob.get_center()[1],
-            0
-          ))
-        ))
+  def flip(self, axis=UP, **kwargs):
+    """Turning around horizontally is a pose swap, any other flip goes through the points"""
+    if kwargs or not np.array_equal(axis, UP):
+      return super().flip(axis, **kwargs)
 
-        if target.roaming_suspended:
-          target.resume_roaming()
+    return self.set_pose(not self.mirrored)
 
-      elif not has_not_collided:
-        target.pause_roaming()
+  def restore_position(self):
+    super().restore()
+    # become copies the saved content over, not which pose it was
+    self.mirrored, self.flap_frame = self.saved_state.mirrored, self.saved_state.flap_frame
+    self.fly = self.submobjects[-1]
+    return self
 
-    self.add_updater(train_updater)
+  def clear_all_updaters(self):
+    self.clear_updaters()
 
-  def pause_roaming(self):
-    """Pauses update of the train with every frame"""
-    self.roaming_suspended = True
-    self.suspend_updating()
+class ComplexTrain(TrainRoamingMixin, CachedBoundsMixin, VMobject):
+  # Scene units per second, .03125 per frame at the 60 fps of -qh like the roaming used to move
+  DEFAULT_SPEED = 1.875
 
-  def resume_roaming(self):
-    """Resumes update of the train with every frame"""
-    self.roaming_suspended = False
-    self.resume_updating()
+  def __init__(self, file_name, color, direction, speed=DEFAULT_SPEED, **kwargs):
+    super().__init__(**kwargs)
+    self.file_name = file_name
+    self.add(*load_compiled_svg(file_name).submobjects)
+    self.train = load_compiled_svg(file_name).set_color(color)
+    self.init_roaming(speed, direction)
+    self.add(self.train)
+
+class FlyTrainRoaming(FlyTrainEvents):
+  """
+    FlyTrainEvents on the scene clock. A single updater on the fly advances the scheduler (moving the trains too), and
+    whenever everything has stopped the fly's updating is suspended, so StaticWaitMixin can hold the frame.
+  """
+  def __init__(self, fly: GojoFly, left_train: TrainRoamingMixin, right_train: TrainRoamingMixin, **kwargs):
+    super().__init__(fly, left_train, right_train, **kwargs)
+
+    def roam_events_updater(mob: VMobject, dt):
+      if dt > 0:
+        self.scheduler.advance(dt)
+
+    self._updater = roam_events_updater
+    fly.add_updater(roam_events_updater)
+    self.bus.subscribe("idle", lambda time: fly.suspend_updating())
+    self.bus.subscribe("active", lambda time: fly.resume_updating())
+
+  def detach(self):
+    """Takes the roaming off the fly for good, e.g. to set off a fresh one from the starting positions"""
+    self.fly.remove_updater(self._updater)
+    self.fly.resume_updating()
+
+class GlyphCounter(VGroup):
+  """
+    Stand-in for DecimalNumber when the value changes on every frame. All the glyphs (digits, sign, decimal point and
+    unit) are typeset once in a single MathTex, and every slot keeps a copy of each glyph it could show. set_value only
+    swaps which of those cached glyphs are in the group, so nothing gets re-typeset or rebuilt per frame, and the
+    hidden ones aren't drawn at all. Give it its color up front, a glyph coming back in keeps the one it was made with.
+  """
+  # Size of the frame that tracks the counter's transforms, small enough to never stick out of the digits
+  FRAME_SIZE = 1e-3
+
+  def __init__(
+    self,
+    number=0,
+    num_decimal_places=2,
+    unit: str | None = None,
+    max_integer_digits=4,
+    font_size=DEFAULT_FONT_SIZE,
+    digit_buff_per_font_unit=0.001,
+    color=WHITE,
+    **kwargs
+  ):
+    super().__init__(**kwargs)
+    self.num_decimal_places = num_decimal_places
+    self.max_integer_digits = max_integer_digits
+
+    atlas = MathTex("-0123456789.", *([unit] if unit else []), font_size=font_size, color=color)
+    glyphs = dict(zip("-0123456789.", atlas[0]))
+    digit_width = max(glyphs[digit].width for digit in "0123456789")
+    buff = digit_buff_per_font_unit * font_size
+    advance = digit_width + buff
+
+    def place_glyph(char: str, x: float) -> VMobject:
+      """A copy of the glyph with its center at x, keeping the vertical position it was typeset at"""
+      glyph = glyphs[char].copy()
+      glyph.shift(RIGHT * (x - glyph.get_center()[0]))
+      return glyph
+
+    # Slots are laid out right to left from the decimal point, so the number stays right aligned as it grows
+    self.integer_slots = [
+      {digit: place_glyph(digit, -(max_integer_digits - idx) * advance + digit_width / 2) for digit in "0123456789"}
+      for idx in range(max_integer_digits)
+    ]
+    # One minus sign per possible number of integer digits, placed just left of the leftmost digit
+    self.sign_slots = [place_glyph("-", -(max_integer_digits - idx + 1) * advance + digit_width / 2) for idx in range(max_integer_digits)]
+    self.decimal_point = place_glyph(".", glyphs["."].width / 2)
+    point_width = self.decimal_point.width + buff if num_decimal_places else 0
+    self.decimal_slots = [
+      {digit: place_glyph(digit, point_width + idx * advance + digit_width / 2) for digit in "0123456789"}
+      for idx in range(num_decimal_places)
+    ]
+
+    # Hidden glyphs are out of the group, so they don't follow it around. This invisible frame does: it records every
+    # shift/scale/rotation of the counter, and a glyph is mapped through it whenever it's shown again
+    self._frame_origin = np.array((0, glyphs["0"].get_center()[1], 0))
+    self.placement_frame = VMobject(fill_opacity=0, stroke_opacity=0, stroke_width=0)
+    self.placement_frame.points = self._frame_origin + self.FRAME_SIZE * np.array((ORIGIN, RIGHT, UP, OUT))
+    self.add(self.placement_frame)
+
+    for glyph in [*self.sign_slots, *[glyph for slot in [*self.integer_slots, *self.decimal_slots] for glyph in slot.values()]]:
+      glyph.local_points = glyph.points.copy()
+
+    if num_decimal_places:
+      self.add(self.decimal_point)
+
+    if unit:
+      self.unit_sign = atlas[1]
+      self.unit_sign.shift(RIGHT * (point_width + num_decimal_places * advance + buff - self.unit_sign.get_left()[0]))
+      self.add(self.unit_sign)
+
+    # Everything starts hidden, set_value reveals whatever the number needs
+    self._visible = {}
+    self.number = None
+    self.set_value(number)
+
+  def _show_glyph(self, slot_key, glyph: VMobject | None):
+    """Takes out whatever glyph the slot was showing and puts the new one in (None leaves the slot empty)"""
+    current = self._visible.get(slot_key)
+    if current is glyph:
+      return
+
+    if current is not None:
+      self.remove(current)
+    if glyph is not None:
+      origin, *axes = self.placement_frame.points
+      basis = (np.array(axes) - origin) / self.FRAME_SIZE
+      glyph.points = origin + (glyph.local_points - self._frame_origin) @ basis
+      self.add(glyph)
+
+    self._visible[slot_key] = glyph
+
+  def set_value(self, number: float):
+    self.number = number
+    integer_part, _, decimal_part = f"{abs(number):.{self.num_decimal_places}f}".partition(".")
+    # Anything that doesn't fit just loses its leading digits
+    integer_part = integer_part[-self.max_integer_digits:]
+    first_digit = self.max_integer_digits - len(integer_part)
+
+    for idx, slot in enumerate(self.integer_slots):
+      self._show_glyph(("int", idx), slot[integer_part[idx - first_digit]] if idx >= first_digit else None)
+
+    for idx, slot in enumerate(self.decimal_slots):
+      self._show_glyph(("dec", idx), slot[decimal_part[idx]])
+
+    is_negative = number < 0 and float(f"{abs(number):.{self.num_decimal_places}f}") != 0
+    self._show_glyph("sign", self.sign_slots[first_digit] if is_negative else None)
+
+    return self
+
+  def get_value(self) -> float:
+    return self.number
+
+  def increment_value(self, delta_t=1):
+    return self.set_value(self.get_value() + delta_t)
+
+class SeriesTex(VGroup):
+  """
+    A sum that grows one term at a time: lhs = term_1 + term_2 + ... Each term is typeset once, on its own, and laid out
+    after the ones already there, so appending a term never re-typesets (or rebuilds) the rest of the sum.
+  """
+  def __init__(
+    self,
+    lhs: str,
+    get_term_tex,
+    separator="+",
+    tail="...",
+    font_size=DEFAULT_FONT_SIZE,
+    buff_per_font_unit=0.003,
+    color=WHITE,
+    **kwargs
+  ):
+    super().__init__(**kwargs)
+    self.get_term_tex = get_term_tex
+    self.separator = separator
+    self._font_size = font_size
+    self._color = color
+    self.buff = buff_per_font_unit * font_size
+    # The separator and tail are typeset once and copied, (template, offset of its center from the math axis)
+    self._typeset_cache = {}
+
+    # The lhs and its equals sign, the equals sign sits on the math axis every other piece gets aligned to
+    self.lhs = MathTex(lhs, "=", font_size=font_size, color=color)
+    self._equals_height = self.lhs[1].height
+    self.terms: list[VGroup] = []
+    self.tail = self._get_piece(tail, self.lhs.get_right()[0] + self.buff)
+
+    self.add(self.lhs, self.tail)
+
+  def _typeset(self, tex: str) -> tuple[VMobject, float]:
+    """Typesets the tex after an equals sign, whose center marks the math axis the tex has to sit on"""
+    typeset = MathTex("=", tex, font_size=self._font_size, color=self._color)
+    return typeset[1], typeset[1].get_center()[1] - typeset[0].get_center()[1]
+
+  def _get_piece(self, tex: str, left_x: float, cache=True) -> VMobject:
+    """The typeset tex, scaled like the rest of the sum, sitting on its math axis with its left edge at left_x"""
+    if not cache:
+      piece, axis_offset = self._typeset(tex)
+    else:
+      if tex not in self._typeset_cache:
+        self._typeset_cache[tex] = self._typeset(tex)
+
+      template, axis_offset = self._typeset_cache[tex]
+      piece = template.copy()
+
+    # The sum may have been scaled since it was created
+    scale = self.lhs[1].height / self._equals_height
+    piece.scale(scale)
+
+    return piece.move_to([left_x + piece.width / 2, self.lhs[1].get_center()[1] + axis_offset * scale, 0])
+
+  def append_term(self, term_no: int | None = None):
+    """Adds the next term (and the separator after it) where the tail is, and pushes the tail along"""
+    term_no = term_no or len(self.terms) + 1
+    left_x = self.tail.get_left()[0]
+
+    term = self._get_piece(self.get_term_tex(term_no), left_x, cache=False)
+    separator = self._get_piece(self.separator, term.get_right()[0] + self.buff)
+    self.terms.append(VGroup(term, separator))
+
+    self.remove(self.tail)
+    self.add(self.terms[-1], self.tail)
+    self.tail.shift(RIGHT * (separator.get_right()[0] + self.buff - left_x))
+
+    return self
+
+class StretchBrace(BraceBetweenPoints):
+  """
+    BraceBetweenPoints that can be moved to span two new points every frame without building a new brace. A brace's
+    points only ever move sideways as it gets wider (the curly ends stay put, the straight sections in between grow), so
+    the shape is cached once per sharpness and put_between rewrites the points in place from it.
+  """
+  # Brace.__init__'s default_min_width, below it the whole brace gets squeezed instead of its straight sections
+  MIN_WIDTH = 0.90552
+
+  # sharpness -> (x at the reference width, how many straight sections each point sits after, y, reference width)
+  _shapes = {}
+
+  def __init__(self, point_1, point_2, direction=ORIGIN, buff=0.2, sharpness=2, scale_factor=1.0, **kwargs):
+    super().__init__(point_1, point_2, direction=direction, buff=buff, sharpness=sharpness, **kwargs)
+
+    # The brace keeps facing the same way, whichever way the points end up moving
+    direction = np.array(direction, dtype=float)
+    if np.all(direction == 0):
+      direction = np.array([point_2[1] - point_1[1], point_1[0] - point_2[0], 0])
+
+    self.angle = -np.arctan2(*direction[:2]) + np.pi
+    self.sharpness = sharpness
+    self.scale_factor = scale_factor
+    self.shape_x, self.shape_k, self.shape_y, self.reference_width = self._get_shape(sharpness)
+
+    # Scratch buffers, so put_between doesn't allocate anything point sized
+    self._local_x = np.empty(len(self.points))
+    self._local_y = np.empty(len(self.points))
+    self._scratch = np.empty(len(self.points))
+
+    self.put_between(point_1, point_2)
+
+  @classmethod
+  def _get_shape(cls, sharpness: float):
+    """Lays out two braces in a local frame (left end at the origin, tip pointing down) to see how each point moves with the width"""
+    if sharpness not in cls._shapes:
+      reference_width = cls.MIN_WIDTH / sharpness + 1
+      reference = Brace(Line(ORIGIN, RIGHT * reference_width), direction=DOWN, buff=0, sharpness=sharpness)
+      wider = Brace(Line(ORIGIN, RIGHT * (reference_width + 1)), direction=DOWN, buff=0, sharpness=sharpness)
+
+      shape_k = np.round((wider.points[:, 0] - reference.points[:, 0]) * 2)
+      cls._shapes[sharpness] = (reference.points[:, 0].copy(), shape_k, reference.points[:, 1].copy(), reference_width)
+
+    return cls._shapes[sharpness]
+
+  def put_between(self, point_1, point_2):
+    """Stretches the brace in place so it spans the two points"""
+    cos, sin = np.cos(self.angle), np.sin(self.angle)
+    # The points in the brace's local frame, where it's a horizontal brace below them
+    x_1, x_2 = cos * point_1[0] + sin * point_1[1], cos * point_2[0] + sin * point_2[1]
+    y_1, y_2 = cos * point_1[1] - sin * point_1[0], cos * point_2[1] - sin * point_2[0]
+    left, bottom, width = min(x_1, x_2), min(y_1, y_2) - self.buff, abs(x_2 - x_1)
+
+    local_x, local_y, scratch = self._local_x, self._local_y, self._scratch
+    min_width = self.MIN_WIDTH / self.sharpness
+
+    if width >= min_width:
+      # Only the straight sections grow: half the extra width each
+      np.multiply(self.shape_k, (width - self.reference_width) / 2, out=local_x)
+      local_x += self.shape_x
+    else:
+      # Too narrow to have straight sections, the smallest brace is squeezed as a whole
+      np.multiply(self.shape_k, (min_width - self.reference_width) / 2, out=local_x)
+      local_x += self.shape_x
+      local_x *= width / min_width
+
+    local_x += left
+    np.add(self.shape_y, bottom, out=local_y)
+
+    if self.scale_factor != 1:
+      center_x, center_y = left + width / 2, bottom + self.shape_y.min() / 2
+      local_x -= center_x
+      local_x *= self.scale_factor
+      local_x += center_x
+      local_y -= center_y
+      local_y *= self.scale_factor
+      local_y += center_y
+
+    # Back to the scene's frame
+    points = self.points
+    np.multiply(local_x, cos, out=points[:, 0])
+    np.multiply(local_y, sin, out=scratch)
+    points[:, 0] -= scratch
+    np.multiply(local_x, sin, out=points[:, 1])
+    np.multiply(local_y, cos, out=scratch)
+    points[:, 1] += scratch
+
+    return self
 
 # Custom Count Animation
 class Count(Animation):
-  def __init__(self, number: DecimalNumber, start: float, end: float, **kwargs) -> None:
+  def __init__(self, number: GlyphCounter, start: float, end: float, **kwargs) -> None:
     # Pass number as the mobject of the animation
     super().__init__(number,  **kwargs)
     # Set start and end
     self.start = start
     self.end = end
 
+  def create_starting_mobject(self) -> Mobject:
+    # The value is all that changes, there's no need to copy every cached glyph
+    return self.mobject
+
   def interpolate_mobject(self, alpha: float) -> None:
-    # Set value of DecimalNumber according to alpha
+    # Set value of GlyphCounter according to alpha
     value = self.start + (alpha * (self.end - self.start))
     self.mobject.set_value(value)
 
-class Puzzle(MovingCameraScene):
+class DragPlayback(Animation):
+  """
+    Plays back a precomputed DragTrajectory, one mobject per tau. All the mobjects move from a single lookup into the
+    trajectory arrays per frame, positions are relative to where each mobject sat when the animation was created.
+  """
+  def __init__(self, mobjects: list[Mobject], trajectory: DragTrajectory, **kwargs) -> None:
+    self.mobjects = mobjects
+    self.trajectory = trajectory
+    self.origins = np.array([mob.get_center()[0] for mob in mobjects]) - trajectory.x[:, 0]
+
+    kwargs.setdefault("run_time", trajectory.duration)
+    kwargs.setdefault("rate_func", linear)
+    super().__init__(Group(*mobjects), **kwargs)
+
+  def create_starting_mobject(self) -> Mobject:
+    return self.mobject
+
+  def interpolate_mobject(self, alpha: float) -> None:
+    xs, _ = self.trajectory.sample(alpha * self.trajectory.duration)
+
+    for mob, x in zip(self.mobjects, self.origins + xs):
+      mob.shift(RIGHT * (x - mob.get_center()[0]))
+
+class StaticWaitMixin:
+  """
+    Scene mixin that renders a wait as one frozen frame whenever nothing on screen can move. Manim's own check treats
+    any mobject with a time based updater as moving, even while its updating is suspended (which is where GojoFly and
+    ComplexTrain sit between roaming legs), so every long hold ends up being rendered frame by frame.
+  """
+  def should_update_mobjects(self) -> bool:
+    wait_animation = self.animations[0]
+
+    if wait_animation.is_static_wait is None:
+      should_update = (
+        self.always_update_mobjects
+        or self.updaters
+        or wait_animation.stop_condition is not None
+        or any(self._has_active_time_based_updater(mob) for mob in self.mobjects)
+      )
+      wait_animation.is_static_wait = not should_update
+
+    return not wait_animation.is_static_wait
+
+  def _has_active_time_based_updater(self, mob: Mobject) -> bool:
+    """Whether updating the mobject for a frame could move anything. A suspended mobject doesn't update its submobjects either"""
+    if mob.updating_suspended:
+      return False
+
+    return mob.has_time_based_updater() or any(self._has_active_time_based_updater(submob) for submob in mob.submobjects)
+
+class Puzzle(TexBatchMixin, StaticWaitMixin, MovingCameraScene):
 
   CONFIG = {
     "easy_solution_font": "Times New Roman",
     "hard_solution_font": "Brush Script MT",
   }
 
+  # The sections of the video, in order. Every section builds its own entry state, so any of them can be rendered on
+  # its own: set PUZZLE_SECTIONS to a comma separated list of them (or use render_sections.py) instead of commenting
+  # the others out.
+  SECTIONS = ("intro", "easy_solution", "medium_solution", "complex_solution", "conclusion")
+  # What a plain render plays, the section that's being worked on
+  DEFAULT_SECTIONS = ("complex_solution",)
+
+  # Every asset the scene uses, by name. Nothing outside this list (thinking_man.svg, ...) is ever loaded
+  ASSETS = {
+    "gojo_fly": "./_2024YT/fly_2trains/assets/gojo_fly.svg",
+    "complex_train": "./_2024YT/fly_2trains/assets/complex_train.svg",
+    "easy_title": {"text": "The Easy Solution", "font": "Times New Roman"},
+    "medium_title": {"text": r'The "Not So Easy" Solution', "font": "Brush Script MT"},
+    "complex_title": {"text": r'Introducing a Real World Constraint', "font": "Brush Script MT"},
+  }
+
+  # Assets each section loads. They get prefetched in the background ahead of their section, and render_sections.py
+  # re-renders a section whenever one of them changes
+  SECTION_ASSETS = {
+    "intro": ["gojo_fly"],
+    "easy_solution": ["gojo_fly", "easy_title"],
+    "medium_solution": ["gojo_fly", "complex_train", "medium_title"],
+    "complex_solution": ["complex_title"],
+    "conclusion": [],
+  }
+
+  def get_sections(self) -> list[str]:
+    """The sections to render, DEFAULT_SECTIONS unless PUZZLE_SECTIONS says otherwise ("all" for every section)"""
+    sections = os.environ.get("PUZZLE_SECTIONS")
+    if not sections:
+      return list(self.DEFAULT_SECTIONS)
+
+    return list(self.SECTIONS) if sections == "all" else sections.split(",")
+
   def construct(self):
-    self.camera.frame.save_state()
+    self.initial_frame = self.camera.frame.copy()
+    self.frame_border = None
+
+    sections = self.get_sections()
+    self.assets = AssetManifest(self.ASSETS, self.SECTION_ASSETS)
+    self.assets.prefetch(sections)
 
-    #========== ANIMATE THE CREATION OF THE REQUIRED MOBJECTS ONTO THE SCENE. ==========#
-    track = Line(start=LEFT*12, end=RIGHT*12).shift(DOWN*2)
+    for section in sections:
+      self.next_section(section)
+      getattr(self, f"{section}_section")()
+
+    self.assets.report()
+
+  def enter_section(self):
+    """Every section (bar the conclusion, which carries on from the complex solution) starts on an empty scene, with the camera where it started"""
+    self.clear()
+    self.camera.frame.become(self.initial_frame)
+    self.camera.frame.save_state()
 
-    # self.play(Write(track))
+  def build_trains_setup(self):
+    """Builds the track, the trains and their annotations in their starting positions"""
+    self.track = Line(start=LEFT*12, end=RIGHT*12).shift(DOWN*2)
 
     # Create the left train
-    left_train = SimpleTrain(2)\
+    self.left_train = SimpleTrain(2)\
       .scale(0.5)\
-      .next_to(track, direction=UP, buff=0.01)\
+      .next_to(self.track, direction=UP, buff=0.01)\
       .shift(LEFT * 5)
 
     # Create the right train
-    right_train = SimpleTrain(2)\
+    self.right_train = SimpleTrain(2)\
       .scale(0.5)\
-      .next_to(track, direction=UP, buff=0.01)\
+      .next_to(self.track, direction=UP, buff=0.01)\
       .shift(RIGHT * 5)\
       .rotate(PI, axis=UP)
 
-    # self.play(
-    #   AnimationGroup(
-    #     Write(left_train),
-    #     Write(right_train),
-    #     lag_ratio=.5
-    #   ),
-    #   run_time=7
-    # )
-
     # Using a brace, show the initial distance between the two trains, then add an updater to track the changes
-    distance_brace = BraceBetweenPoints(left_train.get_right(), right_train.get_left()).next_to(track, direction=DOWN, buff=.2)
-    distance_between_trains = MathTex("100 \mathrm{km}").next_to(distance_brace, direction=DOWN, buff=.2).scale(.5)
+    self.distance_brace = BraceBetweenPoints(self.left_train.get_right(), self.right_train.get_left()).next_to(self.track, direction=DOWN, buff=.2)
+    self.distance_between_trains = MathTex("100 \mathrm{km}").next_to(self.distance_brace, direction=DOWN, buff=.2).scale(.5)
 
     # Add a vector to indicate the speed of each of the trains
-    left_train_velocity_vector = Arrow(start=LEFT, end=RIGHT).next_to(left_train, direction=UP, buff=.2).scale(.75, True)
-    right_train_velocity_vector = Arrow(start=RIGHT, end=LEFT).next_to(right_train, direction=UP, buff=.2).scale(.75, True)
+    self.left_train_velocity_vector = Arrow(start=LEFT, end=RIGHT).next_to(self.left_train, direction=UP, buff=.2).scale(.75, True)
+    self.right_train_velocity_vector = Arrow(start=RIGHT, end=LEFT).next_to(self.right_train, direction=UP, buff=.2).scale(.75, True)
+
+    left_train_velocity_label = MathTex("v_1 = 50 \, \mathrm{km/hr}").next_to(self.left_train_velocity_vector, direction=UP, buff=.1).scale(.5)
+    right_train_velocity_label = MathTex("v_2 = 50 \, \mathrm{km/hr}").next_to(self.right_train_velocity_vector, direction=UP, buff=.1).scale(.5)
+
+    self.left_train_velocity_annot = VGroup(self.left_train_velocity_vector, left_train_velocity_label)
+    self.right_train_velocity_annot = VGroup(self.right_train_velocity_vector, right_train_velocity_label)
 
-    left_train_velocity_label = MathTex("v_1 = 50 \, \mathrm{km/hr}").next_to(left_train_velocity_vector, direction=UP, buff=.1).scale(.5)
-    right_train_velocity_label = MathTex("v_2 = 50 \, \mathrm{km/hr}").next_to(right_train_velocity_vector, direction=UP, buff=.1).scale(.5)
+    # Save the initial states of the trains
+    self.left_train.save_state()
+    self.right_train.save_state()
 
-    left_train_velocity_annot = VGroup(left_train_velocity_vector, left_train_velocity_label)
-    right_train_velocity_annot = VGroup(right_train_velocity_vector, right_train_velocity_label)
+  def build_gojo_fly(self) -> GojoFly:
+    """The fly, already shrunk and sitting at the front of the left train"""
+    # HACK: we have to create a new gojo_fly object as animation with the one from the intro seems to be buggy
+    return GojoFly(self.assets.resolve("gojo_fly"), WHITE)\
+      .scale(0.15)\
+      .rotate(PI, axis=Y_AXIS)\
+      .next_to(self.left_train, direction=RIGHT, buff=0.1)\
+      .shift(UP * 0.125)
 
-    # self.play(
-    #   Create(distance_brace),
-    #   Write(distance_between_trains),
-    #   Write(left_train_velocity_annot),
-    #   Write(right_train_velocity_annot),
-    #   run_time=2
-    # )
+  #========== ANIMATE THE CREATION OF THE REQUIRED MOBJECTS ONTO THE SCENE. ==========#
+  def intro_section(self):
+    self.enter_section()
+    self.build_trains_setup()
+    track, left_train, right_train = self.track, self.left_train, self.right_train
+
+    self.play(Write(track))
+
+    self.play(
+      AnimationGroup(
+        Write(left_train),
+        Write(right_train),
+        lag_ratio=.5
+      ),
+      run_time=7
+    )
+
+    self.play(
+      Create(self.distance_brace),
+      Write(self.distance_between_trains),
+      Write(self.left_train_velocity_annot),
+      Write(self.right_train_velocity_annot),
+      run_time=2
+    )
 
     # Animate the creation of our fly, Gojo.
-    gojo_fly = GojoFly('./_2024YT/fly_2trains/assets/gojo_fly.svg', WHITE).rotate(PI, axis=Y_AXIS)
-    # self.play(
-    #   Write(gojo_fly),
-    #   gojo_fly.animate.scale(0.15).next_to(left_train, direction=RIGHT, buff=0.1),
-    #   run_time=2
-    # )
-
-    # # Make the fly oscillate at the starting position
-    # self.play(
-    #   gojo_fly.animate.shift(UP * 0.125),
-    #  )
-
-    # Save the initial states of the fly and trains
-    left_train.save_state()
-    right_train.save_state()
+    gojo_fly = GojoFly(self.assets.resolve("gojo_fly"), WHITE).rotate(PI, axis=Y_AXIS)
+    self.play(
+      Write(gojo_fly),
+      gojo_fly.animate.scale(0.15).next_to(left_train, direction=RIGHT, buff=0.1),
+      run_time=2
+    )
+
+    # Make the fly oscillate at the starting position
+    self.play(
+      gojo_fly.animate.shift(UP * 0.125),
+     )
+
     fly_initial_pos = gojo_fly.get_center()
-    #======================================================================================#
+    # The trains take the 10s they were animated over to get to the middle
+    train_speed = (5 - left_train.width/2) / 10
+
+    #========= Simulate the movement of the trains and the fly (loop a few times)  ========#
+    def puzzle_demo():
+      # Same events as the medium solution, the trains get held back by the fly and stop once they've met
+      left_train.init_roaming(train_speed, direction=1)
+      right_train.init_roaming(train_speed, direction=-1)
+      if gojo_fly.direction == -1:
+        gojo_fly.flip()
+        gojo_fly.update_direction(1)
+
+      roaming = FlyTrainRoaming(gojo_fly, left_train, right_train)
+      self.wait_until(lambda: roaming.stopped, max_time=12)
+      roaming.detach()
+      self.wait(0.3)
+
+      # Reset the fly and trains to their initial positions
+      self.play(
+        Restore(left_train),
+        Restore(right_train),
+      )
 
+      self.wait(0.3)
+
+    gojo_fly.set_infinite_roam(True)
+    # A fading trail behind the fly. It roams for close to a minute all told, most of it bouncing back and forth in a
+    # shrinking gap, which a plain TracedPath would keep every frame of
+    fly_trail = BoundedTracedPath(gojo_fly.get_center, stroke_color="#6a6a6a", dissipating_time=1.5)
+    # Added after the fly so it follows where the fly got to this frame, but drawn under it
+    self.add(fly_trail.set_z_index(-1))
+
+    for _ in range(5):
+      puzzle_demo()
+      gojo_fly.move_to(fly_initial_pos)
+      fly_trail.clear_trace()
+
+  #======================================================================================#
+
+  #============================== EASY SOLUTION SCENE ===================================#
+  def easy_solution_section(self):
+    self.enter_section()
+    self.build_trains_setup()
+    gojo_fly = self.build_gojo_fly()
+    track, left_train, right_train = self.track, self.left_train, self.right_train
+    distance_brace, distance_between_trains = self.distance_brace, self.distance_between_trains
+    left_train_velocity_annot, right_train_velocity_annot = self.left_train_velocity_annot, self.right_train_velocity_annot
+
+    # Fade in the "Easy Solution" text
+    easy_title = VGroup()
+    easy_text = Text(**self.assets.resolve("easy_title"))
+    easy_border = Rectangle(width=easy_text.width * 1.25, height=easy_text.height * 2.5)
+    easy_title.add(easy_text, easy_border)
 
-    # #========= Simulate the movement of the trains and the fly (loop a few times)  ========#
-    # def puzzle_demo():
-    #   self.play(
-    #     AnimationGroup(
-    #       left_train.animate(rate_func=linear).shift(RIGHT * 5 - np.array((left_train.width/2 + .03, 0.0, 0.0))),
-    #       right_train.animate(rate_func=linear).shift(LEFT * 5 + np.array((right_train.width/2 + .03, 0.0, 0.0))),
-    #       run_time=10,
-    #     )
-    #   )
-    #   self.wait(0.3)
+    self.play(
+      Write(easy_title),
+    )
 
-    #   # Reset the fly and trains to their initial positions
-    #   self.play(
-    #     Restore(left_train),
-    #     Restore(right_train),
-    #   )
+    self.play(
+      FadeOut(easy_title)
+    )
 
-    #   self.wait(0.3)
+    # Add necessary mobjects (fly, trains and braces) back to the scene
+    self.add(gojo_fly, left_train, right_train, track, distance_brace, distance_between_trains, left_train_velocity_annot, right_train_velocity_annot)
+    self.wait(2)
 
-    # gojo_fly.roam(left_train, right_train)
+    # zoom in on the fly and then fade out, with a flash
+    self.camera.frame.save_state()
 
-    # for _ in range(5):
-    #   puzzle_demo()
-    #   gojo_fly.move_to(fly_initial_pos)
-    #======================================================================================#
+    self.play(
+      AnimationGroup(
+        AnimationGroup(
+          FocusOn(gojo_fly),
+          self.camera.frame.animate.move_to(gojo_fly).set_height(gojo_fly.height * 5),
+          lag_ratio=.5
+        ),
+        AnimationGroup(
+          FadeOut(gojo_fly),
+          Flash(gojo_fly, num_lines=50, line_length=0.15, line_stroke_width=1, color=WHITE),
+          lag_ratio=.5
+        ),
+        lag_ratio=.75
+      )
+    )
 
-    # #============================== EASY SOLUTION SCENE ===================================#
-    # # Remove all the mobjects from the current scene
-    # self.clear()
+    self.play(self.camera.frame.animate.restore())
 
-    # HACK: we have to create a new gojo_fly object as animation with this current one seems to be buggy
-    gojo_fly = GojoFly('./_2024YT/fly_2trains/assets/gojo_fly.svg', WHITE)\
-      .scale(0.15)\
-      .rotate(PI, axis=Y_AXIS)\
-      .next_to(left_train, direction=RIGHT, buff=0.1)\
-      .shift(UP * 0.125)
-    # #----------------------------------------------------------------------------------------#
-
-    # # Fade in the "Easy Solution" text
-    # easy_title = VGroup()
-    # easy_text = Text("The Easy Solution", font="Times New Roman")
-    # easy_border = Rectangle(width=easy_text.width * 1.25, height=easy_text.height * 2.5)
-    # easy_title.add(easy_text, easy_border)
-
-    # self.play(
-    #   Write(easy_title),
-    # )
-
-    # self.play(
-    #   FadeOut(easy_title)
-    # )
-
-    # # Add necessary mobjects (fly, trains and braces) back to the scene
-    # self.add(gojo_fly, left_train, right_train, track, distance_brace, distance_between_trains, left_train_velocity_annot, right_train_velocity_annot)
-    # self.wait(2)
-
-    # # zoom in on the fly and then fade out, with a flash
-    # self.camera.frame.save_state()
-
-    # self.play(
-    #   AnimationGroup(
-    #     AnimationGroup(
-    #       FocusOn(gojo_fly),
-    #       self.camera.frame.animate.move_to(gojo_fly).set_height(gojo_fly.height * 5),
-    #       lag_ratio=.5
-    #     ),
-    #     AnimationGroup(
-    #       FadeOut(gojo_fly),
-    #       Flash(gojo_fly, num_lines=50, line_length=0.15, line_stroke_wdith=1, color=WHITE),
-    #       lag_ratio=.5
-    #     ),
-    #     lag_ratio=.75
-    #   )
-    # )
-
-    # self.play(self.camera.frame.animate.restore())
-
-    # self.wait(16)
-
-    # self.play(
-    #   Uncreate(distance_brace),
-    #   Unwrite(distance_between_trains),
-    # )
-
-    # # Display two braces that track the distance covered of the left and right trains
-    # initial_left_train_pos = left_train.saved_state.get_right()
-    # initial_right_train_pos = right_train.saved_state.get_left()
-
-    # left_train_brace = BraceBetweenPoints(initial_left_train_pos, (initial_left_train_pos[0] + .15, initial_left_train_pos[1], initial_left_train_pos[2])).shift(DOWN*.3).scale(.85)
-    # right_train_brace = BraceBetweenPoints((initial_right_train_pos[0] - .15, initial_right_train_pos[1], initial_right_train_pos[2]), initial_right_train_pos).shift(DOWN*.3).scale(.85)
-    # left_train_distance_covered = DecimalNumber(number=0, num_decimal_places=0, unit="km", font_size=24).next_to(left_train_brace, direction=DOWN, buff=.1)
-    # right_train_distance_covered = DecimalNumber(number=0, num_decimal_places=0, unit="km", font_size=24).next_to(right_train_brace, direction=DOWN, buff=.1)
-
-    # def left_train_distance_updater(mob: DecimalNumber):
-    #   # Get the distance between the starting pos. and the current pos. of the left train
-    #   scaled_left_distance = abs((left_train.get_right()[0] - initial_left_train_pos[0]) / (initial_left_train_pos[0]) * 50)
-    #   mob.set_value(scaled_left_distance)
-    #   mob.next_to(left_train_brace, direction=DOWN)
-
-    #   # # Update the brace in the process too
-    #   # left_train_brace.become(BraceBetweenPoints(initial_left_train_pos, left_train.get_right())).next_to(track, direction=DOWN, buff=.2)
-
-    # def right_train_distance_updater(mob: DecimalNumber):
-    #   # Get the distance between the starting pos. and the current pos. of the right train
-    #   scaled_right_distance = abs((right_train.get_left()[0] - initial_right_train_pos[0]) / (initial_right_train_pos[0]) * 50)
-    #   mob.set_value(scaled_right_distance)
-    #   mob.next_to(right_train_brace, direction=DOWN)
-
-    #   # # Update the brace in the process too
-    #   # right_train_brace.become(BraceBetweenPoints(initial_right_train_pos, right_train.get_left())).next_to(track, direction=DOWN, buff=.2)
-
-    # def left_train_brace_updater(mob: BraceBetweenPoints):
-    #   # Update the brace in the process too
-    #   mob.become(BraceBetweenPoints(initial_left_train_pos, left_train.get_right())).shift(DOWN*.3).scale(.85)
-
-    # def right_train_brace_updater(mob: BraceBetweenPoints):
-    #   # Update the brace in the process too
-    #   mob.become(BraceBetweenPoints(right_train.get_left(), initial_right_train_pos)).shift(DOWN*.3).scale(.85)
-
-    # self.play(
-    #   Create(left_train_brace),
-    #   Create(right_train_brace),
-    #   Write(left_train_distance_covered),
-    #   Write(right_train_distance_covered),
-    # )
-
-    # left_train_brace.add_updater(left_train_brace_updater)
-    # right_train_brace.add_updater(right_train_brace_updater)
-    # left_train_distance_covered.add_updater(left_train_distance_updater)
-    # right_train_distance_covered.add_updater(right_train_distance_updater)
-
-    # # Add a line at the center of the scene (the collision point)
-    # collision_demarcation = Line(start=ORIGIN, end=DOWN * 2)
-    # point_one = Dot(ORIGIN, radius=.075)
-    # point_two = Dot(DOWN*2, radius=.075)
-    # points_group = VGroup(point_one, point_two)
-
-    # self.play(
-    #   AnimationGroup(
-    #     AnimationGroup(
-    #       left_train.animate(rate_func=linear).shift(RIGHT * 5 - np.array((left_train.width/2 + .03, 0.0, 0.0))),
-    #       right_train.animate(rate_func=linear).shift(LEFT * 5 + np.array((right_train.width/2 + .03, 0.0, 0.0))),
-    #       # Count(elapsed_time, 0, 2, rate_functions=linear),
-    #       run_time=10,
-    #     ),
-    #     AnimationGroup(
-    #       Write(points_group),
-    #       Write(collision_demarcation),
-    #       lag_ratio=1
-    #     ),
-    #     lag_ratio=.75
-    #   )
-    # )
-    # self.wait(2)
-
-    # #===================== Animation of the Easy Solution at the top right of the screen ========================#
-    # self.camera.frame.save_state()
-    # # Create the bounding box for the calculation at the right hand of the screen
-    # easy_calculation_bounding_box = Square(side_length=5).move_to(UR * 4)
-
-    # easy_method_title = Title("Distance-Speed-Time Relationship")\
-    #   .scale_to_fit_width(easy_calculation_bounding_box.width * 0.85)\
-    #   .move_to(easy_calculation_bounding_box)\
-    #   .align_to(easy_calculation_bounding_box, direction=UP)\
-    #   .shift(DOWN*.15)
-
-    # train_distance_formula_text = MathTex(r"distance = speed \times time").move_to(easy_calculation_bounding_box).scale(.75)
-    # train_distance_formula_symbol = MathTex(r"d_{\text{train}} = v_{\text{train}} \times t").move_to(easy_calculation_bounding_box).scale(.75)
-
-    # self.play(
-    #   self.camera.frame.animate.set_height(
-    #     easy_calculation_bounding_box.height * 1.2
-    #   )
-    # )
-
-    # self.play(
-    #   Write(easy_calculation_bounding_box),
-    #   Write(easy_method_title),
-    #   self.camera.frame.animate.move_to(easy_calculation_bounding_box)
-    # )
-
-    # # Write the distance formula
-    # self.play(
-    #   Write(train_distance_formula_text)
-    # )
-
-    # self.play(
-    #   Transform(train_distance_formula_text, train_distance_formula_symbol)
-    # )
-
-    # self.play(
-    #   train_distance_formula_text.animate.shift(UP * 1.5),
-    # )
-
-    # time_formula_symbol = MathTex(r"t = \frac{d_{\text{train}}}{v_{\text{train}}}").move_to(train_distance_formula_text.get_center()).scale(.75)
-
-    # time_taken_substituted = MathTex(r"\Rightarrow t = \frac{50 km}{50 km/hr}").move_to(easy_calculation_bounding_box).scale(.75)
-
-    # time_taken = MathTex(r"t = 1 hr").next_to(time_taken_substituted, direction=DOWN).shift(DOWN * .5).scale(.75)
-
-    # fly_distance_formula_symbol = MathTex(r"d_{\text{fly}} = v_{\text{fly}} \times time")\
-    #     .move_to(train_distance_formula_text.get_center())\
-    #     .scale(.75)
-
-    # fly_distance_covered_substituted = MathTex(r"\Rightarrow d_{\text{fly}} = 100km/hr \times 1hr")\
-    #   .move_to(easy_calculation_bounding_box)\
-    #   .scale(.75)
-
-    # fly_distance_covered = MathTex(r"d_{\text{fly}} = 100km")\
-    #   .next_to(fly_distance_covered_substituted, direction=DOWN)\
-    #   .shift(DOWN * .5)\
-    #   .scale(.75)
-
-    # self.play(Transform(train_distance_formula_text, time_formula_symbol))
-    # self.wait(0.5)
-
-    # self.play(
-    #   Write(time_taken_substituted)
-    # )
-
-    # self.play(
-    #   AnimationGroup(
-    #     Write(time_taken),
-    #     Circumscribe(time_taken),
-    #     lag_ratio=1
-    #   )
-    # )
-
-    # self.wait(7)
-
-    # self.play(
-    #   FadeOut(time_taken_substituted, time_taken)
-    # )
-
-    # self.remove(time_taken_substituted, time_taken)
-
-    # # Calculation for the actual distance covered by the fly
-    # self.play(
-    #   AnimationGroup(
-    #     Transform(train_distance_formula_text, fly_distance_formula_symbol),
-    #     Write(fly_distance_covered_substituted),
-    #     Write(fly_distance_covered),
-    #     lag_ratio=1
-    #   )
-    # )
-
-    # self.play(
-    #   self.camera.frame.animate.restore()
-    # )
-
-    # self.play(
-    #   FadeOut(
-    #     track,
-    #     left_train,
-    #     right_train,
-    #     collision_demarcation,
-    #   )
-    # )
-
-    # self.clear()
-    # #=====================================================================================================#
-
-    # #============================= THE "NOT SO EASY" SOLUTION SCENE ====================================#
-    # medium_title = VGroup()
-    # medium_text = Text(r'The "Not So Easy" Solution', font="Brush Script MT")
-    # medium_border = Rectangle(width=medium_text.width * 1.25, height=medium_text.height * 2.5)
-    # medium_title.add(medium_text, medium_border)
-
-    # self.play(
-    #   AnimationGroup(
-    #     Write(medium_title),
-    #     lag_ratio=.75
-    #   ),
-    # )
-
-    # self.play(
-    #   FadeOut(medium_title),
-    #   run_time=.5
-    # )
-
-    # self.play(
-    #   self.camera.frame.animate.set_width(track.width * .95),
-    #   FadeIn(track.shift(DOWN).set_color("#6a6a6a")),
-    #   run_time=.5
-    # )
-
-    # # Animate the creation of the complex trains.
-    # left_complex_train = ComplexTrain('./_2024YT/fly_2trains/assets/complex_train.svg', WHITE, direction=1)\
-    #   .scale(0.2)\
-    #   .rotate(PI, UP)\
-    #   .next_to(track, direction=UP, buff=0.02)\
-    #   .set_z_index(2)
-
-    # right_complex_train = ComplexTrain('./_2024YT/fly_2trains/assets/complex_train.svg', WHITE, direction=-1)\
-    #   .scale(0.2)\
-    #   .next_to(track, direction=UP, buff=0.02)\
-    #   .set_z_index(2)
-
-    # self.play(
-    #   AnimationGroup(
-    #     Write(left_complex_train.shift(LEFT * left_complex_train.width * 1.6)),
-    #     Write(right_complex_train.shift(RIGHT * right_complex_train.width * 1.6)),
-    #     lag_ratio=.75
-    #   ),
-    #   run_time=2
-    # )
-
-    # # Set the initital position of the Gojo Fly to be at the left complex train, then show the creation
-    # gojo_fly.next_to(left_complex_train, direction=RIGHT, buff=0.025)
-
-    # self.camera.frame.save_state()
-
-    # self.play(
-    #   AnimationGroup(
-    #     self.camera.frame.animate.move_to(gojo_fly).set_height(gojo_fly.height * 3),
-    #     Write(gojo_fly),
-    #     lag_ratio=1
-    #   )
-    # )
-
-    # # TODO: Create a method that allows the fly to oscillate in place.
-    # self.play(
-    #   self.camera.frame.animate.restore()
-    # )
-
-    # left_train_velocity_annot.next_to(left_complex_train, direction=UP)
-    # right_train_velocity_annot.next_to(right_complex_train, direction=UP)
-    # left_train_velocity_vector.scale(1.33 * 0.5, True)
-    # right_train_velocity_vector.scale(1.33 * 0.5, True)
-
-    # gojo_fly_velocity_vector = Arrow(start=LEFT, end=RIGHT).next_to(gojo_fly, direction=UP, buff=.1).scale(.75, True)
-    # gojo_fly_velocity_label = MathTex("v_1 = 100 \, \mathrm{km/hr}").next_to(gojo_fly_velocity_vector, direction=UP, buff=.1).scale(.5)
-    # gojo_fly_velocity_annot = VGroup(gojo_fly_velocity_vector, gojo_fly_velocity_label)
-
-    # self.play(
-    #   Write(gojo_fly_velocity_annot),
-    #   Write(left_train_velocity_annot),
-    #   Write(right_train_velocity_annot)
-    # )
-
-    # # Create box at the top of the screen for doing the calculations
-    # self.play(
-    #   self.camera.frame.animate.shift(UP * 1.5)
-    # )
-
-    # solution_demarcation = Line(start=UP * 6.5, end=DOWN * 0.5)
-    # self.play(
-    #   Write(solution_demarcation)
-    # )
-
-    # total_fly_distance_covered = MathTex(r"S_{\tiny \text{fly total}} =\ ?")\
-    #     .next_to(solution_demarcation, direction=LEFT, buff=2)\
-    #     .align_to(solution_demarcation, direction=UP)\
-    #     .shift(DOWN * 0.65)
-
-    # def get_distance_relationship_for_current_leg(leg_no="n"):
-    #   s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
-    #   s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
-    #   s_train = r"{{ s_{\tiny \text{train}_" + f"{leg_no}" + r"} }}"
-    #   return MathTex(rf"{s_leg} = {s_fly} + {s_train}")
-
-    # def get_mildly_simplified_distance_relationship_for_current_leg(leg_no="n"):
-    #   s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
-    #   s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
-    #   s_train = r"{{ \frac{1}{2}s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
-    #   return MathTex(rf"{s_leg} = {s_fly} + {s_train}")
-
-    # def get_overly_simplified_distance_relationship_for_current_leg(leg_no="n"):
-    #   s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
-    #   s_simplified = r"{{ \frac{3}{2}s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
-    #   s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
-    #   s_rearranged = r"{{ \frac{2}{3}s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
-
-    #   return MathTex(rf"{s_leg} = {s_simplified} \\ {s_fly} = {s_rearranged}")
-
-    # # This is a very impure function, but lol, what do I know about functional programming
-    # def append_to_partial_sum(leg_no=1):
-    #   partial_sum = ''
-    #   for i in range(leg_no):
-    #     partial_sum += r"{{ \frac{2}{3}s_{\tiny \text{leg}_" + f"{i + 1}" + r"} }}" + r" + "
-
-    #   result = r"S_{\tiny \text{fly total}} = " + partial_sum + r"..."
-
-    #   return MathTex(result)\
-    #     .next_to(solution_demarcation, direction=LEFT, buff=2)\
-    #     .align_to(solution_demarcation, direction=UP)\
-    #     .shift(DOWN * 0.65)
-
-    # total_distance_relationship_per_leg = get_distance_relationship_for_current_leg()\
-    #     .next_to(solution_demarcation, direction=RIGHT, buff=2)\
-    #     .align_to(solution_demarcation, direction=UP)\
-    #     .shift(DOWN * 0.65)
-
-    # self.play(
-    #   Write(total_fly_distance_covered)
-    # )
-
-    # self.play(
-    #   Write(
-    #     total_distance_relationship_per_leg
-    #   )
-    # )
-
-    # # Remove the velocity vectors from the scene
-    # self.play(
-    #   Unwrite(gojo_fly_velocity_annot),
-    #   Unwrite(left_train_velocity_annot),
-    #   Unwrite(right_train_velocity_annot)
-    # )
-
-    # self.remove(gojo_fly_velocity_annot, left_train_velocity_annot, right_train_velocity_annot)
-
-    # #----------------------------- The animation of the first two leg trips -------------------------------------------------#
-    # # Add a brace to illustrate the distance covered by the train
-    # # Add a brace to illustrate the distance covered by the fly
-    # initial_left_train_pos = left_complex_train.get_right()
-    # initial_right_train_pos = right_complex_train.get_left()
-    # initial_fly_pos = gojo_fly.get_left() if gojo_fly.direction == 1 else gojo_fly.get_right()
-
-    # # Add markers to show the reference distance between the trains
-    # left_train_marker = Dot(initial_left_train_pos, color=GRAY).shift(DOWN * 0.5)
-    # right_train_marker = Dot(initial_right_train_pos, color=GRAY).shift(DOWN * 0.5)
-
-    # self.play(
-    #   Write(left_train_marker),
-    #   Write(right_train_marker),
-    # )
-
-    # #----------------------------- Display the total available initial distance -------------------------------------------------#
-    # distance_brace = BraceBetweenPoints(left_complex_train.get_right(), right_complex_train.get_left()).next_to(track, direction=DOWN, buff=.2)
-    # distance_between_trains = MathTex(r"s_{\text{leg.1}}").next_to(distance_brace, direction=DOWN, buff=.2)
-
-    # self.play(
-    #   Write(distance_brace),
-    #   Write(distance_between_trains)
-    # )
-
-    # self.play(
-    #   Unwrite(distance_brace),
-    #   Unwrite(distance_between_trains)
-    # )
-
-    # self.wait(9)
-    # #----------------------------------------------------------------------------------------------------------------------------#
-
-    # gojo_fly.roam(left_complex_train, right_complex_train, infiniteRoam=False, roam_trips=3)
-    # left_complex_train.roam_before_fly_contact(gojo_fly.fly, right_complex_train)
-    # right_complex_train.roam_before_fly_contact(gojo_fly.fly, left_complex_train)
-
-    # #============================ Visual illustration of the distance covered by the train and the fly ==========================#
-    # self.play(
-    #   self.camera.frame.animate.scale(1),
-    #   run_time=8
-    # )
-
-    # left_train_brace = BraceBetweenPoints(initial_left_train_pos, left_complex_train.get_right()).shift(DOWN*.25)
-    # # left_complex_train_annot = MathTex(r"s_{\text{left train leg 1}}").next_to(left_train_brace, direction=DOWN, buff=.2)
-
-    # right_train_brace = BraceBetweenPoints(right_complex_train.get_left(), initial_right_train_pos).shift(DOWN*.25)
-    # right_complex_train_annot = MathTex(r"s_{\text{right train leg 1}}").next_to(right_train_brace, direction=DOWN, buff=.2)
-
-    # # Distance covered by the fly
-    # fly_distance_brace = BraceBetweenPoints(initial_fly_pos, gojo_fly.get_center(), direction=UP).shift(UP)
-    # fly_distance_annot = MathTex(r"s_{\text{fly\_leg\_1}}").next_to(fly_distance_brace, direction=DOWN, buff=.2)
-
-    # self.play(
-    #   Write(right_train_brace),
-    #   Write(right_complex_train_annot),
-    #   Write(fly_distance_brace),
-    #   Write(fly_distance_annot)
-    # )
-
-    # # Show that the total distance of this leg is equal to the distance covered by the fly + distance
-    # # covered by the approaching train.
-    # self.play(
-    #   Indicate(right_train_brace)
-    # )
-
-    # self.play(
-    #   Indicate(fly_distance_brace)
-    # )
-
-    # self.play(
-    #   Unwrite(right_complex_train_annot),
-    #   Unwrite(fly_distance_annot)
-    # )
-
-    # self.wait(3)
-
-    # self.play(
-    #   right_train_brace.animate.next_to(fly_distance_brace, direction=LEFT, buff=0)\
-    #     .shift(DOWN*0.5 + RIGHT*right_train_brace.width),
-    # )
-
-    # self.wait(4)
-
-    # # Show that the distance covered by the left train is equal to that covered by the right train
-    # self.play(
-    #   Write(left_train_brace),
-    #   run_time=.3
-    # )
-
-    # self.play(
-    #   Indicate(left_train_brace)
-    # )
-
-    # # Honestly this could be more declarative, but at this point I am so tired of working on this project and I just
-    # # want to try and wrap it up so I am going to leave things procedural
-    # # besides what's the point of abstracting it into a method and trying to be declarative when the animation is only
-    # # going to be repeated twice? Exactly
-
-    # partial_sum = MathTex('')
-
-    # for i in range(1, 4):
-    #   current_distance_relationship = get_distance_relationship_for_current_leg(i)\
-    #             .next_to(total_distance_relationship_per_leg, direction=DOWN, buff=.5)
-
-    #   mildly_simplified_current_distance_relationship = get_mildly_simplified_distance_relationship_for_current_leg(i)\
-    #             .next_to(current_distance_relationship, direction=DOWN, buff=.5)
-
-    #   overly_simplified_distance_relationship = get_overly_simplified_distance_relationship_for_current_leg(i)\
-    #             .next_to(mildly_simplified_current_distance_relationship, direction=DOWN, buff=.5)
-
-    #   # To be displayed at the side of the equations in each leg
-    #   train_simplified_distance_relationship = MathTex(r"{{ s_{\tiny \text{train}_" + f"{i}" + r"} }}" + "=" + r"{{ \frac{1}{3}s_{\tiny \text{leg}_" + f"{i}" + r"} }}")
-    #   train_simplified_distance_relationship.next_to(overly_simplified_distance_relationship)
-
-    #   # Run-time for the animation of the equations
-    #   equation_run_time = 1 if i == 1 else .1
-
-    #   self.play(
-    #     Write(current_distance_relationship),
-    #     run_time=equation_run_time
-    #   )
-
-    #   self.play(
-    #     TransformMatchingTex(
-    #       current_distance_relationship,
-    #       mildly_simplified_current_distance_relationship
-    #     ),
-    #     run_time=equation_run_time
-    #   )
-
-    #   self.play(
-    #     Write(overly_simplified_distance_relationship),
-    #     run_time=equation_run_time
-    #   )
-
-    #   self.play(
-    #     Write(train_simplified_distance_relationship),
-    #     run_time=equation_run_time
-    #   )
-
-    #   partial_sum = append_to_partial_sum(i)
-
-    #   self.play(
-    #     AnimationGroup(
-    #       Unwrite(total_fly_distance_covered),
-    #       Transform(
-    #         overly_simplified_distance_relationship,
-    #         partial_sum,
-    #         replace_mobject_with_target_in_scene=True
-    #       ),
-    #       lag_ratio=.95
-    #     ),
-    #     run_time=equation_run_time
-    #   )
-
-    #   # Move the train relationship to the occupy the previously occupied fly relationship space.
-    #   self.play(
-    #     train_simplified_distance_relationship
-    #       .animate
-    #       .next_to(
-    #         mildly_simplified_current_distance_relationship,
-    #         direction=DOWN,
-    #         buff=.25
-    #       ),
-    #     run_time=equation_run_time
-    #   )
-
-    #   # Update the positions of the markers
-    #   left_train_pos = left_complex_train.get_right()
-    #   right_train_pos = right_complex_train.get_left()
-
-    #   self.play(
-    #     left_train_marker.animate.move_to(left_train_pos).shift(DOWN * 0.5),
-    #     right_train_marker.animate.move_to(right_train_pos).shift(DOWN * 0.5)
-    #   )
-
-    #   self.play(
-    #     Unwrite(left_train_brace),
-    #     Unwrite(right_train_brace),
-    #     Unwrite(fly_distance_brace),
-    #   )
-
-    #   if i == 1:
-    #     self.wait(13)
-
-    #   distance_brace.become(BraceBetweenPoints(left_train_pos, right_train_pos)).next_to(track, direction=DOWN, buff=.2)
-    #   distance_between_trains = MathTex(r"s_{\text{leg" + f"{i+1}" + "}}").next_to(distance_brace, direction=DOWN, buff=.2)
-
-    #   if i != 3:
-    #     # Briefly display the total available distance and then unwrite
-    #     self.play(
-    #       Write(distance_brace),
-    #       Write(distance_between_trains),
-    #     )
-
-    #     self.play(
-    #       Unwrite(distance_brace),
-    #       Unwrite(distance_between_trains),
-    #     )
-
-    #     # Now visually show that the total available distance is actually one-third of the previous
-    #     # This part is actually being replicated from before, like the clown that I am
-    #     left_train_brace = BraceBetweenPoints(initial_left_train_pos, left_train_pos).shift(DOWN*.25)
-    #     right_train_brace = BraceBetweenPoints(right_train_pos, initial_right_train_pos).shift(DOWN*.25)
-    #     available_distance_brace = BraceBetweenPoints(left_train_pos, right_train_pos).shift(DOWN*.25)
-
-    #     self.play(
-    #       Write(left_train_brace),
-    #       Write(right_train_brace)
-    #     )
-
-    #     self.play(
-    #       Write(available_distance_brace),
-    #       run_time=.3
-    #     )
-
-    #     self.play(
-    #       Indicate(available_distance_brace),
-    #     )
-
-    #     self.play(
-    #       Unwrite(left_train_brace),
-    #       Unwrite(right_train_brace),
-    #       Unwrite(available_distance_brace),
-    #     )
-
-    #     # Now update the initial positions of the trains for the new leg
-    #     initial_left_train_pos = left_train_pos
-    #     initial_right_train_pos = right_train_pos
-
-
-    #     # Resume the roaming
-    #     gojo_fly.resume_roaming()
-    #     left_complex_train.resume_roaming()
-    #     right_complex_train.resume_roaming()
-
-    #   self.play(
-    #     self.camera.frame.animate.scale(1),
-    #     run_time=(4/i)
-    #   )
-
-    #   # Remove expressions for the previous leg
-    #   self.play(
-    #     Unwrite(partial_sum) if i != 3 else partial_sum.animate.scale(1),
-    #     Unwrite(mildly_simplified_current_distance_relationship),
-    #     Unwrite(train_simplified_distance_relationship),
-    #   )
-
-    # self.play(
-    #   Indicate(partial_sum),
-    # )
-
-    # self.wait(23)
-
-    # # Shift demarcation to create more room for the equation
-    # self.play(
-    #   AnimationGroup(
-    #     Unwrite(total_distance_relationship_per_leg),
-    #     solution_demarcation.animate.shift(RIGHT * 3),
-    #     lag_ratio=1
-    #   )
-    # )
-
-    # simplified_partial_sum = MathTex(r"= {{ \frac{2}{3}s_{\tiny \text{leg}_1} +\
-    #                                   \frac{1}{3}(\frac{2}{3}s_{\tiny \text{leg}_1}) +\
-    #                                  \frac{1}{3}(\frac{1}{3})(\frac{2}{3}s_{\tiny \text{leg}_1}) +\
-    #                                  ... + \frac{1}{3}^{n-1}\frac{2}{3}s_{\tiny \text{leg}_1}}}"
-    #                                  ).next_to(partial_sum, direction=DOWN, buff=.5)\
-    #                                   .shift(RIGHT * 2.5)
-
-    # self.play(
-    #   Write(simplified_partial_sum)
-    # )
-
-    # infinite_geometric_sum = MathTex(
-    #   r"\sum_{n=1}^\infty ar^n = \frac{a}{1 - r}, \quad \text{for } |r| < 1 \
-    #   \\ \text{where } a = \frac{2}{3} \cdot s_{\text{leg}_1}, \quad r = \frac{1}{3} \
-    #   \\ s_{\text{leg}_1} = 100\, \tiny \text{km}"
-    # ).next_to(solution_demarcation, direction=RIGHT, buff=1)\
-    #     .align_to(solution_demarcation, direction=UP)\
-    #     .shift(DOWN * 0.65)
+    self.wait(16)
+
+    self.play(
+      Uncreate(distance_brace),
+      Unwrite(distance_between_trains),
+    )
+
+    # Display two braces that track the distance covered of the left and right trains
+    initial_left_train_pos = left_train.saved_state.get_right()
+    initial_right_train_pos = right_train.saved_state.get_left()
+
+    left_train_brace = StretchBrace(initial_left_train_pos, (initial_left_train_pos[0] + .15, initial_left_train_pos[1], initial_left_train_pos[2]), buff=.5, scale_factor=.85)
+    right_train_brace = StretchBrace((initial_right_train_pos[0] - .15, initial_right_train_pos[1], initial_right_train_pos[2]), initial_right_train_pos, buff=.5, scale_factor=.85)
+    left_train_distance_covered = GlyphCounter(number=0, num_decimal_places=0, unit="km", font_size=24).next_to(left_train_brace, direction=DOWN, buff=.1)
+    right_train_distance_covered = GlyphCounter(number=0, num_decimal_places=0, unit="km", font_size=24).next_to(right_train_brace, direction=DOWN, buff=.1)
+
+    def left_train_distance_updater(mob: GlyphCounter):
+      # Get the distance between the starting pos. and the current pos. of the left train
+      scaled_left_distance = abs((left_train.get_right()[0] - initial_left_train_pos[0]) / (initial_left_train_pos[0]) * 50)
+      mob.set_value(scaled_left_distance)
+      mob.next_to(left_train_brace, direction=DOWN)
+
+      # # Update the brace in the process too
+      # left_train_brace.become(BraceBetweenPoints(initial_left_train_pos, left_train.get_right())).next_to(track, direction=DOWN, buff=.2)
+
+    def right_train_distance_updater(mob: GlyphCounter):
+      # Get the distance between the starting pos. and the current pos. of the right train
+      scaled_right_distance = abs((right_train.get_left()[0] - initial_right_train_pos[0]) / (initial_right_train_pos[0]) * 50)
+      mob.set_value(scaled_right_distance)
+      mob.next_to(right_train_brace, direction=DOWN)
+
+      # # Update the brace in the process too
+      # right_train_brace.become(BraceBetweenPoints(initial_right_train_pos, right_train.get_left())).next_to(track, direction=DOWN, buff=.2)
+
+    def left_train_brace_updater(mob: StretchBrace):
+      # Update the brace in the process too
+      mob.put_between(initial_left_train_pos, left_train.get_right())
+
+    def right_train_brace_updater(mob: StretchBrace):
+      # Update the brace in the process too
+      mob.put_between(right_train.get_left(), initial_right_train_pos)
+
+    self.play(
+      Create(left_train_brace),
+      Create(right_train_brace),
+      Write(left_train_distance_covered),
+      Write(right_train_distance_covered),
+    )
+
+    left_train_brace.add_updater(left_train_brace_updater)
+    right_train_brace.add_updater(right_train_brace_updater)
+    left_train_distance_covered.add_updater(left_train_distance_updater)
+    right_train_distance_covered.add_updater(right_train_distance_updater)
+
+    # Add a line at the center of the scene (the collision point)
+    collision_demarcation = Line(start=ORIGIN, end=DOWN * 2)
+    point_one = Dot(ORIGIN, radius=.075)
+    point_two = Dot(DOWN*2, radius=.075)
+    points_group = VGroup(point_one, point_two)
+
+    self.play(
+      AnimationGroup(
+        AnimationGroup(
+          left_train.animate(rate_func=linear).shift(RIGHT * 5 - np.array((left_train.width/2 + .03, 0.0, 0.0))),
+          right_train.animate(rate_func=linear).shift(LEFT * 5 + np.array((right_train.width/2 + .03, 0.0, 0.0))),
+          # Count(elapsed_time, 0, 2, rate_functions=linear),
+          run_time=10,
+        ),
+        AnimationGroup(
+          Write(points_group),
+          Write(collision_demarcation),
+          lag_ratio=1
+        ),
+        lag_ratio=.75
+      )
+    )
+    self.wait(2)
+
+    #===================== Animation of the Easy Solution at the top right of the screen ========================#
+    self.camera.frame.save_state()
+    # Create the bounding box for the calculation at the right hand of the screen
+    easy_calculation_bounding_box = Square(side_length=5).move_to(UR * 4)
+
+    easy_method_title = Title("Distance-Speed-Time Relationship")\
+      .scale_to_fit_width(easy_calculation_bounding_box.width * 0.85)\
+      .move_to(easy_calculation_bounding_box)\
+      .align_to(easy_calculation_bounding_box, direction=UP)\
+      .shift(DOWN*.15)
+
+    train_distance_formula_text = MathTex(r"distance = speed \times time").move_to(easy_calculation_bounding_box).scale(.75)
+    train_distance_formula_symbol = MathTex(r"d_{\text{train}} = v_{\text{train}} \times t").move_to(easy_calculation_bounding_box).scale(.75)
+
+    self.play(
+      self.camera.frame.animate.set_height(
+        easy_calculation_bounding_box.height * 1.2
+      )
+    )
+
+    self.play(
+      Write(easy_calculation_bounding_box),
+      Write(easy_method_title),
+      self.camera.frame.animate.move_to(easy_calculation_bounding_box)
+    )
+
+    # Write the distance formula
+    self.play(
+      Write(train_distance_formula_text)
+    )
+
+    self.play(
+      Transform(train_distance_formula_text, train_distance_formula_symbol)
+    )
+
+    self.play(
+      train_distance_formula_text.animate.shift(UP * 1.5),
+    )
+
+    time_formula_symbol = MathTex(r"t = \frac{d_{\text{train}}}{v_{\text{train}}}").move_to(train_distance_formula_text.get_center()).scale(.75)
+
+    time_taken_substituted = MathTex(r"\Rightarrow t = \frac{50 km}{50 km/hr}").move_to(easy_calculation_bounding_box).scale(.75)
+
+    time_taken = MathTex(r"t = 1 hr").next_to(time_taken_substituted, direction=DOWN).shift(DOWN * .5).scale(.75)
+
+    fly_distance_formula_symbol = MathTex(r"d_{\text{fly}} = v_{\text{fly}} \times time")\
+        .move_to(train_distance_formula_text.get_center())\
+        .scale(.75)
+
+    fly_distance_covered_substituted = MathTex(r"\Rightarrow d_{\text{fly}} = 100km/hr \times 1hr")\
+      .move_to(easy_calculation_bounding_box)\
+      .scale(.75)
+
+    fly_distance_covered = MathTex(r"d_{\text{fly}} = 100km")\
+      .next_to(fly_distance_covered_substituted, direction=DOWN)\
+      .shift(DOWN * .5)\
+      .scale(.75)
+
+    self.play(Transform(train_distance_formula_text, time_formula_symbol))
+    self.wait(0.5)
+
+    self.play(
+      Write(time_taken_substituted)
+    )
+
+    self.play(
+      AnimationGroup(
+        Write(time_taken),
+        Circumscribe(time_taken),
+        lag_ratio=1
+      )
+    )
+
+    self.wait(7)
+
+    self.play(
+      FadeOut(time_taken_substituted, time_taken)
+    )
+
+    self.remove(time_taken_substituted, time_taken)
+
+    # Calculation for the actual distance covered by the fly
+    self.play(
+      AnimationGroup(
+        Transform(train_distance_formula_text, fly_distance_formula_symbol),
+        Write(fly_distance_covered_substituted),
+        Write(fly_distance_covered),
+        lag_ratio=1
+      )
+    )
+
+    self.play(
+      self.camera.frame.animate.restore()
+    )
+
+    self.play(
+      FadeOut(
+        track,
+        left_train,
+        right_train,
+        collision_demarcation,
+      )
+    )
+  #=====================================================================================================#
+
+  #============================= THE "NOT SO EASY" SOLUTION SCENE ====================================#
+  def medium_solution_section(self):
+    self.enter_section()
+    self.build_trains_setup()
+    gojo_fly = self.build_gojo_fly()
+    track = self.track
+    left_train_velocity_vector, right_train_velocity_vector = self.left_train_velocity_vector, self.right_train_velocity_vector
+    left_train_velocity_annot, right_train_velocity_annot = self.left_train_velocity_annot, self.right_train_velocity_annot
+
+    medium_title = VGroup()
+    medium_text = Text(**self.assets.resolve("medium_title"))
+    medium_border = Rectangle(width=medium_text.width * 1.25, height=medium_text.height * 2.5)
+    medium_title.add(medium_text, medium_border)
+
+    self.play(
+      AnimationGroup(
+        Write(medium_title),
+        lag_ratio=.75
+      ),
+    )
+
+    self.play(
+      FadeOut(medium_title),
+      run_time=.5
+    )
+
+    self.play(
+      self.camera.frame.animate.set_width(track.width * .95),
+      FadeIn(track.shift(DOWN).set_color("#6a6a6a")),
+      run_time=.5
+    )
+
+    # Animate the creation of the complex trains.
+    left_complex_train = ComplexTrain(self.assets.resolve("complex_train"), WHITE, direction=1)\
+      .scale(0.2)\
+      .rotate(PI, UP)\
+      .next_to(track, direction=UP, buff=0.02)\
+      .set_z_index(2)
+
+    right_complex_train = ComplexTrain(self.assets.resolve("complex_train"), WHITE, direction=-1)\
+      .scale(0.2)\
+      .next_to(track, direction=UP, buff=0.02)\
+      .set_z_index(2)
+
+    self.play(
+      AnimationGroup(
+        Write(left_complex_train.shift(LEFT * left_complex_train.width * 1.6)),
+        Write(right_complex_train.shift(RIGHT * right_complex_train.width * 1.6)),
+        lag_ratio=.75
+      ),
+      run_time=2
+    )
+
+    # Set the initital position of the Gojo Fly to be at the left complex train, then show the creation
+    gojo_fly.next_to(left_complex_train, direction=RIGHT, buff=0.025)
+
+    self.camera.frame.save_state()
+
+    self.play(
+      AnimationGroup(
+        self.camera.frame.animate.move_to(gojo_fly).set_height(gojo_fly.height * 3),
+        Write(gojo_fly),
+        lag_ratio=1
+      )
+    )
+
+    # TODO: Create a method that allows the fly to oscillate in place.
+    self.play(
+      self.camera.frame.animate.restore()
+    )
+
+    left_train_velocity_annot.next_to(left_complex_train, direction=UP)
+    right_train_velocity_annot.next_to(right_complex_train, direction=UP)
+    left_train_velocity_vector.scale(1.33 * 0.5, True)
+    right_train_velocity_vector.scale(1.33 * 0.5, True)
 
-    # self.play(Write(infinite_geometric_sum))
+    gojo_fly_velocity_vector = Arrow(start=LEFT, end=RIGHT).next_to(gojo_fly, direction=UP, buff=.1).scale(.75, True)
+    gojo_fly_velocity_label = MathTex("v_1 = 100 \, \mathrm{km/hr}").next_to(gojo_fly_velocity_vector, direction=UP, buff=.1).scale(.5)
+    gojo_fly_velocity_annot = VGroup(gojo_fly_velocity_vector, gojo_fly_velocity_label)
 
-    # final_expression = MathTex(r"= \frac{\frac{2}{3} \times 100}{1 - \frac{1}{3}} ").next_to(simplified_partial_sum, direction=DOWN, buff=1)
-
-    # final_medium_answer = MathTex(r"100km").next_to(final_expression, direction=DOWN, buff=1)
+    self.play(
+      Write(gojo_fly_velocity_annot),
+      Write(left_train_velocity_annot),
+      Write(right_train_velocity_annot)
+    )
+
+    # Create box at the top of the screen for doing the calculations
+    self.play(
+      self.camera.frame.animate.shift(UP * 1.5)
+    )
+
+    solution_demarcation = Line(start=UP * 6.5, end=DOWN * 0.5)
+    self.play(
+      Write(solution_demarcation)
+    )
 
-    # self.play(Write(final_expression))
-
-    # self.play(
-    #   Write(final_medium_answer),
-    # )
+    total_fly_distance_covered = MathTex(r"S_{\tiny \text{fly total}} =\ ?")\
+        .next_to(solution_demarcation, direction=LEFT, buff=2)\
+        .align_to(solution_demarcation, direction=UP)\
+        .shift(DOWN * 0.65)
+
+    def get_distance_relationship_for_current_leg(leg_no="n"):
+      s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
+      s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
+      s_train = r"{{ s_{\tiny \text{train}_" + f"{leg_no}" + r"} }}"
+      return MathTex(rf"{s_leg} = {s_fly} + {s_train}")
+
+    def get_mildly_simplified_distance_relationship_for_current_leg(leg_no="n"):
+      s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
+      s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
+      s_train = r"{{ \frac{1}{2}s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
+      return MathTex(rf"{s_leg} = {s_fly} + {s_train}")
+
+    def get_overly_simplified_distance_relationship_for_current_leg(leg_no="n"):
+      s_leg = r"{{ s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
+      s_simplified = r"{{ \frac{3}{2}s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
+      s_fly = r"{{ s_{\tiny \text{fly}_" + f"{leg_no}" + r"} }}"
+      s_rearranged = r"{{ \frac{2}{3}s_{\tiny \text{leg}_" + f"{leg_no}" + r"} }}"
+
+      return MathTex(rf"{s_leg} = {s_simplified} \\ {s_fly} = {s_rearranged}")
+
+    # Every leg's term is only typeset once, each leg just appends its own term and shows a copy of the sum so far
+    series = SeriesTex(
+      r"S_{\tiny \text{fly total}}",
+      lambda leg_no: r"\frac{2}{3}s_{\tiny \text{leg}_" + f"{leg_no}" + r"}"
+    )
 
-    # self.play(
-    #   Indicate(final_medium_answer)
-    # ),
+    # This is a very impure function, but lol, what do I know about functional programming
+    def append_to_partial_sum(leg_no=1):
+      while len(series.terms) < leg_no:
+        series.append_term()
 
-    # self.wait(1)
+      return series.copy()\
+        .next_to(solution_demarcation, direction=LEFT, buff=2)\
+        .align_to(solution_demarcation, direction=UP)\
+        .shift(DOWN * 0.65)
 
-    # self.clear()
+    total_distance_relationship_per_leg = get_distance_relationship_for_current_leg()\
+        .next_to(solution_demarcation, direction=RIGHT, buff=2)\
+        .align_to(solution_demarcation, direction=UP)\
+        .shift(DOWN * 0.65)
 
-    # =============================== THE "COMPLEX" SOLUTION SCENE ======================================#
-    complex_text = Text(r'Introducing a Real World Constraint', font="Brush Script MT")
+    self.play(
+      Write(total_fly_distance_covered)
+    )
+
+    self.play(
+      Write(
+        total_distance_relationship_per_leg
+      )
+    )
+
+    # Remove the velocity vectors from the scene
+    self.play(
+      Unwrite(gojo_fly_velocity_annot),
+      Unwrite(left_train_velocity_annot),
+      Unwrite(right_train_velocity_annot)
+    )
+
+    self.remove(gojo_fly_velocity_annot, left_train_velocity_annot, right_train_velocity_annot)
+
+    #----------------------------- The animation of the first two leg trips -------------------------------------------------#
+    # Add a brace to illustrate the distance covered by the train
+    # Add a brace to illustrate the distance covered by the fly
+    initial_left_train_pos = left_complex_train.get_right()
+    initial_right_train_pos = right_complex_train.get_left()
+    initial_fly_pos = gojo_fly.get_left() if gojo_fly.direction == 1 else gojo_fly.get_right()
+
+    # Add markers to show the reference distance between the trains
+    left_train_marker = Dot(initial_left_train_pos, color=GRAY).shift(DOWN * 0.5)
+    right_train_marker = Dot(initial_right_train_pos, color=GRAY).shift(DOWN * 0.5)
+
+    self.play(
+      Write(left_train_marker),
+      Write(right_train_marker),
+    )
+
+    #----------------------------- Display the total available initial distance -------------------------------------------------#
+    distance_brace = BraceBetweenPoints(left_complex_train.get_right(), right_complex_train.get_left()).next_to(track, direction=DOWN, buff=.2)
+    distance_between_trains = MathTex(r"s_{\text{leg.1}}").next_to(distance_brace, direction=DOWN, buff=.2)
+
+    self.play(
+      Write(distance_brace),
+      Write(distance_between_trains)
+    )
+
+    self.play(
+      Unwrite(distance_brace),
+      Unwrite(distance_between_trains)
+    )
+
+    self.wait(9)
+    #----------------------------------------------------------------------------------------------------------------------------#
+
+    # Three legs, stopping at a train after each one till roaming.resume()
+    gojo_fly.set_infinite_roam(False)
+    gojo_fly.set_roam_trips(3)
+    roaming = FlyTrainRoaming(gojo_fly, left_complex_train, right_complex_train)
+
+    #============================ Visual illustration of the distance covered by the train and the fly ==========================#
+    self.play(
+      self.camera.frame.animate.scale(1),
+      run_time=8
+    )
+
+    left_train_brace = BraceBetweenPoints(initial_left_train_pos, left_complex_train.get_right()).shift(DOWN*.25)
+    # left_complex_train_annot = MathTex(r"s_{\text{left train leg 1}}").next_to(left_train_brace, direction=DOWN, buff=.2)
+
+    right_train_brace = BraceBetweenPoints(right_complex_train.get_left(), initial_right_train_pos).shift(DOWN*.25)
+    right_complex_train_annot = MathTex(r"s_{\text{right train leg 1}}").next_to(right_train_brace, direction=DOWN, buff=.2)
+
+    # Distance covered by the fly
+    fly_distance_brace = BraceBetweenPoints(initial_fly_pos, gojo_fly.get_center(), direction=UP).shift(UP)
+    fly_distance_annot = MathTex(r"s_{\text{fly\_leg\_1}}").next_to(fly_distance_brace, direction=DOWN, buff=.2)
+
+    self.play(
+      Write(right_train_brace),
+      Write(right_complex_train_annot),
+      Write(fly_distance_brace),
+      Write(fly_distance_annot)
+    )
+
+    # Show that the total distance of this leg is equal to the distance covered by the fly + distance
+    # covered by the approaching train.
+    self.play(
+      Indicate(right_train_brace)
+    )
+
+    self.play(
+      Indicate(fly_distance_brace)
+    )
+
+    self.play(
+      Unwrite(right_complex_train_annot),
+      Unwrite(fly_distance_annot)
+    )
+
+    self.wait(3)
+
+    self.play(
+      right_train_brace.animate.next_to(fly_distance_brace, direction=LEFT, buff=0)\
+        .shift(DOWN*0.5 + RIGHT*right_train_brace.width),
+    )
+
+    self.wait(4)
+
+    # Show that the distance covered by the left train is equal to that covered by the right train
+    self.play(
+      Write(left_train_brace),
+      run_time=.3
+    )
+
+    self.play(
+      Indicate(left_train_brace)
+    )
+
+    # Honestly this could be more declarative, but at this point I am so tired of working on this project and I just
+    # want to try and wrap it up so I am going to leave things procedural
+    # besides what's the point of abstracting it into a method and trying to be declarative when the animation is only
+    # going to be repeated twice? Exactly
+
+    partial_sum = MathTex('')
+
+    for i in range(1, 4):
+      current_distance_relationship = get_distance_relationship_for_current_leg(i)\
+                .next_to(total_distance_relationship_per_leg, direction=DOWN, buff=.5)
+
+      mildly_simplified_current_distance_relationship = get_mildly_simplified_distance_relationship_for_current_leg(i)\
+                .next_to(current_distance_relationship, direction=DOWN, buff=.5)
+
+      overly_simplified_distance_relationship = get_overly_simplified_distance_relationship_for_current_leg(i)\
+                .next_to(mildly_simplified_current_distance_relationship, direction=DOWN, buff=.5)
+
+      # To be displayed at the side of the equations in each leg
+      train_simplified_distance_relationship = MathTex(r"{{ s_{\tiny \text{train}_" + f"{i}" + r"} }}" + "=" + r"{{ \frac{1}{3}s_{\tiny \text{leg}_" + f"{i}" + r"} }}")
+      train_simplified_distance_relationship.next_to(overly_simplified_distance_relationship)
+
+      # Run-time for the animation of the equations
+      equation_run_time = 1 if i == 1 else .1
+
+      self.play(
+        Write(current_distance_relationship),
+        run_time=equation_run_time
+      )
+
+      self.play(
+        TransformMatchingTex(
+          current_distance_relationship,
+          mildly_simplified_current_distance_relationship
+        ),
+        run_time=equation_run_time
+      )
+
+      self.play(
+        Write(overly_simplified_distance_relationship),
+        run_time=equation_run_time
+      )
+
+      self.play(
+        Write(train_simplified_distance_relationship),
+        run_time=equation_run_time
+      )
+
+      partial_sum = append_to_partial_sum(i)
+
+      self.play(
+        AnimationGroup(
+          Unwrite(total_fly_distance_covered),
+          Transform(
+            overly_simplified_distance_relationship,
+            partial_sum,
+            replace_mobject_with_target_in_scene=True
+          ),
+          lag_ratio=.95
+        ),
+        run_time=equation_run_time
+      )
+
+      # Move the train relationship to the occupy the previously occupied fly relationship space.
+      self.play(
+        train_simplified_distance_relationship
+          .animate
+          .next_to(
+            mildly_simplified_current_distance_relationship,
+            direction=DOWN,
+            buff=.25
+          ),
+        run_time=equation_run_time
+      )
+
+      # Update the positions of the markers
+      left_train_pos = left_complex_train.get_right()
+      right_train_pos = right_complex_train.get_left()
+
+      self.play(
+        left_train_marker.animate.move_to(left_train_pos).shift(DOWN * 0.5),
+        right_train_marker.animate.move_to(right_train_pos).shift(DOWN * 0.5)
+      )
+
+      self.play(
+        Unwrite(left_train_brace),
+        Unwrite(right_train_brace),
+        Unwrite(fly_distance_brace),
+      )
+
+      if i == 1:
+        self.wait(13)
+
+      distance_brace.become(BraceBetweenPoints(left_train_pos, right_train_pos)).next_to(track, direction=DOWN, buff=.2)
+      distance_between_trains = MathTex(r"s_{\text{leg" + f"{i+1}" + "}}").next_to(distance_brace, direction=DOWN, buff=.2)
+
+      if i != 3:
+        # Briefly display the total available distance and then unwrite
+        self.play(
+          Write(distance_brace),
+          Write(distance_between_trains),
+        )
+
+        self.play(
+          Unwrite(distance_brace),
+          Unwrite(distance_between_trains),
+        )
+
+        # Now visually show that the total available distance is actually one-third of the previous
+        # This part is actually being replicated from before, like the clown that I am
+        left_train_brace = BraceBetweenPoints(initial_left_train_pos, left_train_pos).shift(DOWN*.25)
+        right_train_brace = BraceBetweenPoints(right_train_pos, initial_right_train_pos).shift(DOWN*.25)
+        available_distance_brace = BraceBetweenPoints(left_train_pos, right_train_pos).shift(DOWN*.25)
+
+        self.play(
+          Write(left_train_brace),
+          Write(right_train_brace)
+        )
+
+        self.play(
+          Write(available_distance_brace),
+          run_time=.3
+        )
+
+        self.play(
+          Indicate(available_distance_brace),
+        )
+
+        self.play(
+          Unwrite(left_train_brace),
+          Unwrite(right_train_brace),
+          Unwrite(available_distance_brace),
+        )
+
+        # Now update the initial positions of the trains for the new leg
+        initial_left_train_pos = left_train_pos
+        initial_right_train_pos = right_train_pos
+
+
+        # Resume the roaming
+        roaming.resume()
+
+      self.play(
+        self.camera.frame.animate.scale(1),
+        run_time=(4/i)
+      )
+
+      # Remove expressions for the previous leg
+      self.play(
+        Unwrite(partial_sum) if i != 3 else partial_sum.animate.scale(1),
+        Unwrite(mildly_simplified_current_distance_relationship),
+        Unwrite(train_simplified_distance_relationship),
+      )
+
+    self.play(
+      Indicate(partial_sum),
+    )
+
+    self.wait(23)
+
+    # Shift demarcation to create more room for the equation
+    self.play(
+      AnimationGroup(
+        Unwrite(total_distance_relationship_per_leg),
+        solution_demarcation.animate.shift(RIGHT * 3),
+        lag_ratio=1
+      )
+    )
+
+    simplified_partial_sum = MathTex(r"= {{ \frac{2}{3}s_{\tiny \text{leg}_1} +\
+                                      \frac{1}{3}(\frac{2}{3}s_{\tiny \text{leg}_1}) +\
+                                     \frac{1}{3}(\frac{1}{3})(\frac{2}{3}s_{\tiny \text{leg}_1}) +\
+                                     ... + \frac{1}{3}^{n-1}\frac{2}{3}s_{\tiny \text{leg}_1}}}"
+                                     ).next_to(partial_sum, direction=DOWN, buff=.5)\
+                                      .shift(RIGHT * 2.5)
+
+    self.play(
+      Write(simplified_partial_sum)
+    )
+
+    infinite_geometric_sum = MathTex(
+      r"\sum_{n=1}^\infty ar^n = \frac{a}{1 - r}, \quad \text{for } |r| < 1 \
+      \\ \text{where } a = \frac{2}{3} \cdot s_{\text{leg}_1}, \quad r = \frac{1}{3} \
+      \\ s_{\text{leg}_1} = 100\, \tiny \text{km}"
+    ).next_to(solution_demarcation, direction=RIGHT, buff=1)\
+        .align_to(solution_demarcation, direction=UP)\
+        .shift(DOWN * 0.65)
+
+    self.play(Write(infinite_geometric_sum))
+
+    final_expression = MathTex(r"= \frac{\frac{2}{3} \times 100}{1 - \frac{1}{3}} ").next_to(simplified_partial_sum, direction=DOWN, buff=1)
+
+    final_medium_answer = MathTex(r"100km").next_to(final_expression, direction=DOWN, buff=1)
+
+    self.play(Write(final_expression))
+
+    self.play(
+      Write(final_medium_answer),
+    )
+
+    self.play(
+      Indicate(final_medium_answer)
+    ),
+
+    self.wait(1)
+
+  # =============================== THE "COMPLEX" SOLUTION SCENE ======================================#
+  def complex_solution_section(self):
+    self.enter_section()
+
+    complex_text = Text(**self.assets.resolve("complex_title"))
 
     self.play(
       Write(complex_text),
@@ -1235,10 +1788,19 @@ class Puzzle(MovingCameraScene):
       run_time=.5
     )
 
+    # There and back like before, but under quadratic drag: the fly coasts 2 units to a wall, bounces off it and coasts
+    # back, slowing down all the way. v0 tau ln(1 + t/tau) = 4 at t = 4, so it's back where it started right on time
+    drag_trajectory = integrate_drag_bounces(
+      1,
+      v0=4 / np.log(5),
+      gap=2,
+      train_speed=0,
+      duration=4,
+      frame_rate=config.frame_rate,
+    )
+
     self.play(
-      simplified_gojo.animate.shift(RIGHT * 2),
-      rate_func=there_and_back,
-      run_time=4
+      DragPlayback([simplified_gojo], drag_trajectory)
     )
 
     self.play(
@@ -1327,47 +1889,70 @@ class Puzzle(MovingCameraScene):
       run_time=10
     )
 
-    # #=============================== CONCLUSION SCENE ======================================#
-    # self.play(frame_border.animate.set_fill(GRAY_C, 1))
-    # self.play(frame_border.animate.set_color(GRAY_C))
-
-    # other_hidden_complexity_examples = [
-    #   {
-    #     "topic": "The n-body problem",
-    #     "run_time": 3,
-    #   },
-    #   {
-    #     "topic": "Conway's game of life",
-    #     "run_time": 3,
-    #   },
-    #   {
-    #     "topic": "Fermat's Last Theorem",
-    #     "run_time": 3,
-    #   },
-    # ]
-
-    # for example in other_hidden_complexity_examples:
-    #   example_mobject = Tex(fr'{example["topic"]}').scale(.85)
-
-    #   self.play(
-    #     FadeIn(
-    #       example_mobject,
-    #       shift=DOWN,
-    #     )
-    #   )
-
-    #   self.play(
-    #     example_mobject.animate.shift(UP * 2.5)
-    #   )
-
-    #   self.wait(example["run_time"])
-
-    #   self.play(
-    #     FadeOut(
-    #       example_mobject,
-    #       shift=UP
-    #     )
-    #   )
+    # The conclusion carries on inside these frames
+    self.frame_border = frame_border
+    self.inner_border = inner_border
+
+  def build_conclusion_entry_state(self):
+    """The frames the complex solution leaves on screen, for when the conclusion is rendered on its own"""
+    self.frame_border = Rectangle(width=self.camera.frame_width, height=self.camera.frame_height, color=BLUE_D).set_fill(BLUE_E, 1)
+
+    left_point = self.frame_border.get_critical_point(LEFT) + RIGHT * .5
+    right_point = self.frame_border.get_critical_point(RIGHT) + LEFT * .5
+    self.inner_border = Rectangle(width=(right_point - left_point)[0], height=0.005, color=LOGO_WHITE)\
+      .stretch_to_fit_height(self.camera.frame_height * 0.85)\
+      .set_fill(BLACK, 1)
+
+    self.add(self.frame_border, self.inner_border)
+
+  #=============================== CONCLUSION SCENE ======================================#
+  def conclusion_section(self):
+    if self.frame_border is None:
+      self.enter_section()
+      self.build_conclusion_entry_state()
+
+    frame_border = self.frame_border
+
+    self.play(frame_border.animate.set_fill(GRAY_C, 1))
+    self.play(frame_border.animate.set_color(GRAY_C))
+
+    other_hidden_complexity_examples = [
+      {
+        "topic": "The n-body problem",
+        "run_time": 3,
+      },
+      {
+        "topic": "Conway's game of life",
+        "run_time": 3,
+      },
+      {
+        "topic": "Fermat's Last Theorem",
+        "run_time": 3,
+      },
+    ]
+
+    for example in other_hidden_complexity_examples:
+      example_mobject = Tex(fr'{example["topic"]}').scale(.85)
+
+      self.play(
+        FadeIn(
+          example_mobject,
+          shift=DOWN,
+        )
+      )
+
+      self.play(
+        example_mobject.animate.shift(UP * 2.5)
+      )
+
+      self.wait(example["run_time"])
+
+      self.play(
+        FadeOut(
+          example_mobject,
+          shift=UP
+        )
+      )
 
     # Day 3: TODO: Work on the Hard Solution
 
@@ -1378,3 +1963,65 @@ class Puzzle(MovingCameraScene):
     # Day 6: TODO: Finishihng touches and edit the animations
 
     # Day 7: TODO: Edit it Adobe After EFfects
+
+class ManyFlies(MovingCameraScene):
+  """
+    The puzzle with a whole swarm of flies between the trains instead of one. Set MANY_FLIES to change how many, the
+    swarm is drawn as glyphs while the camera is close and as a point cloud once it pulls out.
+  """
+  FLY_COUNT = 10000
+
+  def build_world(self, left_train: VMobject, right_train: VMobject, fly_count: int, fly_width: float, seed=0) -> TrackWorld:
+    """Flies scattered across the gap between the trains, heading either way, at the speed of the one in the video"""
+    rng = np.random.default_rng(seed)
+    gap_left, gap_right = left_train.get_right()[0] + fly_width / 2, right_train.get_left()[0] - fly_width / 2
+
+    return TrackWorld(
+      rng.uniform(gap_left, gap_right, fly_count),
+      GojoFly.DEFAULT_SPEED,
+      rng.choice((-1, 1), fly_count),
+      fly_width,
+      [left_train.get_left()[0], right_train.get_left()[0]],
+      [left_train.get_right()[0], right_train.get_right()[0]],
+      [ComplexTrain.DEFAULT_SPEED, -ComplexTrain.DEFAULT_SPEED],
+    )
+
+  def construct(self):
+    fly_count = int(os.environ.get("MANY_FLIES", self.FLY_COUNT))
+    track = Line(start=LEFT*12, end=RIGHT*12).shift(DOWN*2).set_color("#6a6a6a")
+
+    left_train = load_compiled_svg(Puzzle.ASSETS["complex_train"]).set_color(WHITE)\
+      .scale(0.2)\
+      .rotate(PI, UP)\
+      .next_to(track, direction=UP, buff=0.02)\
+      .shift(LEFT * 5)
+    right_train = load_compiled_svg(Puzzle.ASSETS["complex_train"]).set_color(WHITE)\
+      .scale(0.2)\
+      .next_to(track, direction=UP, buff=0.02)\
+      .shift(RIGHT * 5)
+
+    fly_height = 0.15
+    world = self.build_world(left_train, right_train, fly_count, fly_width=fly_height * 1.2)
+    swarm = FlySwarm(
+      world,
+      load_compiled_svg(Puzzle.ASSETS["gojo_fly"]),
+      y=left_train.get_center()[1],
+      y_spread=left_train.height * .8,
+      fly_height=fly_height,
+      # Like the GojoFly of the video, colored over but every part of the glyph still its own shape and opacity
+      color=WHITE,
+      camera_frame=self.camera.frame,
+      obstacles=[left_train, right_train],
+    )
+
+    # The trains are part of the swarm, it moves them
+    self.add(track, swarm)
+    self.camera.frame.move_to(left_train.get_right()).set_height(fly_height * 20)
+    self.wait()
+
+    # Runs till the trains meet, with every fly squashed somewhere in between
+    meeting_time = (right_train.get_left()[0] - left_train.get_right()[0]) / (2 * ComplexTrain.DEFAULT_SPEED)
+    swarm.start_swarming()
+    self.play(self.camera.frame.animate.move_to(ORIGIN).set_width(track.width * .95), run_time=2)
+    self.wait(max(meeting_time - 2, 0) + 1)
+    swarm.stop_swarming()
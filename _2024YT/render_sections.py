@@ -0,0 +1,179 @@
+import argparse
+import ast
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Renders the sections of the Puzzle scene in parallel (one manim process per section) and stitches them back
+# together into the final video without re-encoding. A section is only re-rendered when its own code, the code it
+# shares with every other section or one of its assets changed since the last run.
+# Usage (from the project root):
+#   python _2024YT/render_sections.py [-q h] [-j 4] [--sections intro easy_solution] [--force]
+
+SCENE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCENE_DIR)
+SCENE_FILE = os.path.join(SCENE_DIR, "puzzle.py")
+SCENE_NAME = "Puzzle"
+SECTIONS_MEDIA_DIR = os.path.join(PROJECT_ROOT, "media", "sections")
+MANIFEST_PATH = os.path.join(SECTIONS_MEDIA_DIR, "manifest.json")
+
+def _hash_file(path: str) -> str:
+  with open(path, "rb") as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+def get_local_modules(path: str) -> list[str]:
+  """Every module next to path that it imports, directly or through the ones it imports, in the order they're found"""
+  found = []
+  pending = [path]
+
+  while pending:
+    with open(pending.pop()) as f:
+      tree = ast.parse(f.read())
+
+    for node in ast.walk(tree):
+      if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+        names = [node.module]
+      elif isinstance(node, ast.Import):
+        names = [alias.name for alias in node.names]
+      else:
+        continue
+
+      for name in names:
+        module_path = os.path.join(os.path.dirname(path), f"{name.split('.')[0]}.py")
+        if os.path.exists(module_path) and module_path != path and module_path not in found:
+          found.append(module_path)
+          pending.append(module_path)
+
+  return found
+
+def read_scene_layout(scene_file=SCENE_FILE, scene_name=SCENE_NAME) -> tuple[list[str], dict[str, list], dict[str, str], str]:
+  """
+    Reads the sections, their assets and the source of every section method straight out of the scene file (no manim
+    import needed). Also returns the "shared" source: the scene file minus the section methods, plus the local modules
+    it imports (all the way down), since a change in any of those can affect every section.
+  """
+  with open(scene_file) as f:
+    source = f.read()
+
+  tree = ast.parse(source)
+  scene_class = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == scene_name)
+  class_attributes = {
+    node.targets[0].id: node.value
+    for node in scene_class.body
+    if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+  }
+
+  sections = list(ast.literal_eval(class_attributes["SECTIONS"]))
+  assets = ast.literal_eval(class_attributes["ASSETS"])
+  section_assets = {
+    section: [assets[name] for name in names]
+    for section, names in ast.literal_eval(class_attributes["SECTION_ASSETS"]).items()
+  }
+  section_sources = {
+    node.name[:-len("_section")]: ast.get_source_segment(source, node)
+    for node in scene_class.body
+    if isinstance(node, ast.FunctionDef) and node.name[:-len("_section")] in sections
+  }
+
+  shared_source = source
+  for section_source in section_sources.values():
+    shared_source = shared_source.replace(section_source, "")
+
+  # Local modules pulled in by the scene (asset_manifest, fly_simulation, ...), and the ones those pull in
+  for module_path in get_local_modules(scene_file):
+    shared_source += _hash_file(module_path)
+
+  return sections, section_assets, section_sources, shared_source
+
+def get_section_hash(section: str, quality: str, section_assets: dict, section_sources: dict, shared_source: str) -> str:
+  digest = hashlib.sha256()
+  digest.update(quality.encode())
+  digest.update(shared_source.encode())
+  digest.update(section_sources[section].encode())
+
+  for asset in section_assets.get(section, []):
+    # Files are hashed by content, anything else (text titles) by its spec
+    digest.update((_hash_file(os.path.join(PROJECT_ROOT, asset)) if isinstance(asset, str) else repr(asset)).encode())
+
+  return digest.hexdigest()
+
+def render_section(section: str, quality: str) -> str:
+  """Renders a single section in its own manim process, returns the path of the rendered video"""
+  media_dir = os.path.join(SECTIONS_MEDIA_DIR, section)
+  env = {**os.environ, "PUZZLE_SECTIONS": section}
+
+  subprocess.run(
+    ["manim", "render", f"-q{quality}", "--media_dir", media_dir, "-o", section, SCENE_FILE, SCENE_NAME],
+    cwd=PROJECT_ROOT,
+    env=env,
+    check=True,
+  )
+
+  videos = glob.glob(os.path.join(media_dir, "videos", "**", f"{section}.mp4"), recursive=True)
+  if not videos:
+    raise FileNotFoundError(f"manim did not produce a video for the {section} section")
+
+  return max(videos, key=os.path.getmtime)
+
+def stitch_sections(videos: list[str], output: str):
+  """Joins the section videos back to back with ffmpeg's concat demuxer, copying the streams (no re-encode)"""
+  concat_list = os.path.join(SECTIONS_MEDIA_DIR, "concat.txt")
+  with open(concat_list, "w") as f:
+    f.writelines(f"file '{os.path.abspath(video)}'\n" for video in videos)
+
+  subprocess.run(
+    ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", concat_list, "-c", "copy", output],
+    check=True,
+  )
+
+def render_sections(sections=None, quality="h", jobs=None, output=None, force=False) -> str:
+  all_sections, section_assets, section_sources, shared_source = read_scene_layout()
+  sections = sections or all_sections
+
+  os.makedirs(SECTIONS_MEDIA_DIR, exist_ok=True)
+  manifest = {}
+  if os.path.exists(MANIFEST_PATH):
+    with open(MANIFEST_PATH) as f:
+      manifest = json.load(f)
+
+  hashes = {section: get_section_hash(section, quality, section_assets, section_sources, shared_source) for section in sections}
+  stale = [
+    section for section in sections
+    if force
+      or manifest.get(section, {}).get("hash") != hashes[section]
+      or not os.path.exists(manifest.get(section, {}).get("video", ""))
+  ]
+
+  print(f"Up to date: {', '.join(s for s in sections if s not in stale) or '-'}")
+  print(f"Rendering: {', '.join(stale) or '-'}")
+
+  with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+    for section, video in zip(stale, pool.map(lambda section: render_section(section, quality), stale)):
+      manifest[section] = {"hash": hashes[section], "video": video}
+
+      with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+  output = output or os.path.join(SECTIONS_MEDIA_DIR, f"{SCENE_NAME}.mp4")
+  stitch_sections([manifest[section]["video"] for section in sections], output)
+  print(f"Stitched {len(sections)} sections into {output}")
+
+  return output
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Render the Puzzle scene section by section, in parallel")
+  parser.add_argument("-q", "--quality", default="h", choices=("l", "m", "h", "p", "k"), help="manim quality flag")
+  parser.add_argument("-j", "--jobs", type=int, default=None, help="number of sections rendered at once (defaults to the cpu count)")
+  parser.add_argument("--sections", nargs="+", default=None, help="only render (and stitch) these sections")
+  parser.add_argument("-o", "--output", default=None, help="where the stitched video goes")
+  parser.add_argument("--force", action="store_true", help="re-render every section, changed or not")
+  args = parser.parse_args()
+
+  if shutil.which("ffmpeg") is None:
+    raise SystemExit("ffmpeg is needed to stitch the sections together")
+
+  render_sections(args.sections, args.quality, args.jobs, args.output, args.force)
@@ -0,0 +1,262 @@
+import heapq
+import itertools
+from collections import defaultdict
+
+import numpy as np
+
+# Event driven roaming for the fly and the trains. Instead of every object polling the others' geometry every frame
+# (and pausing/resuming each other from their updaters), the objects move at constant velocities between events, and
+# a scheduler predicts when the next "contact" or "separation" happens from the gaps and closing speeds. Between
+# events a frame is just a shift of whatever is moving, and once everything stops there's nothing left to do at all.
+# Like fly_roaming, nothing in here knows about manim: the movers only need shift (and the fly its roaming mixin).
+
+class EventBus:
+  """Named events, and whoever listens to them"""
+  def __init__(self):
+    self._handlers = defaultdict(list)
+
+  def subscribe(self, event: str, handler):
+    self._handlers[event].append(handler)
+    return handler
+
+  def unsubscribe(self, event: str, handler):
+    self._handlers[event].remove(handler)
+
+  def emit(self, event: str, **payload):
+    for handler in list(self._handlers[event]):
+      handler(**payload)
+
+class Mover:
+  """Something moving along x at a constant velocity between events"""
+  def __init__(self, mob, velocity=0.0):
+    self.mob = mob
+    self.velocity = velocity
+    self.conditions: list["Condition"] = []
+
+  @property
+  def is_moving(self) -> bool:
+    return self.velocity != 0
+
+class Condition:
+  """
+    A gap between movers. "contact" fires when it closes to 0, "separation" when it opens up from 0 again. gap is
+    measured off the objects themselves, rate is how fast it closes at the current velocities.
+  """
+  def __init__(self, name: str, movers: list[Mover], gap, rate):
+    self.name = name
+    self.movers = movers
+    self.gap = gap
+    self.rate = rate
+    self.touching = gap() <= 1e-9
+    # Bumped on every reschedule, so the queue can drop the predictions that no longer hold
+    self.version = 0
+
+  def predict(self) -> float:
+    """Time from now till the condition next fires at the current velocities, inf if it never does"""
+    gap, rate = self.gap(), self.rate()
+
+    if self.touching:
+      # Still overlapping (gap < 0) while moving apart, it separates once the gap is back to 0
+      return max(gap / rate, 0.0) if rate < 0 else np.inf
+
+    return max(gap / rate, 0.0) if rate > 0 else np.inf
+
+class EventScheduler:
+  """
+    Advances time frame by frame, but only does work at the predicted events: every mover gets moved to the exact time
+    of each event before it fires, so nothing depends on the frame rate.
+  """
+  # A runaway chain of events (a fly squeezed to nothing between two trains) can't hang a frame
+  MAX_EVENTS_PER_ADVANCE = 1000
+
+  def __init__(self, bus: EventBus | None = None):
+    self.bus = bus or EventBus()
+    self.time = 0.0
+    self.movers: list[Mover] = []
+    self.conditions: list[Condition] = []
+    self._queue: list[tuple] = []
+    self._counter = itertools.count()
+
+  @property
+  def is_idle(self) -> bool:
+    return not any(mover.is_moving for mover in self.movers)
+
+  def add_mover(self, mob, velocity=0.0) -> Mover:
+    mover = Mover(mob, velocity)
+    self.movers.append(mover)
+    return mover
+
+  def add_condition(self, name: str, movers: list[Mover], gap, rate) -> Condition:
+    condition = Condition(name, movers, gap, rate)
+    self.conditions.append(condition)
+    for mover in movers:
+      mover.conditions.append(condition)
+
+    self.schedule(condition)
+    return condition
+
+  def schedule(self, condition: Condition):
+    condition.version += 1
+    delay = condition.predict()
+    if delay < np.inf:
+      heapq.heappush(self._queue, (self.time + delay, next(self._counter), condition.version, condition))
+
+  def set_velocity(self, mover: Mover, velocity: float):
+    """Changes a mover's velocity right now, and re-predicts everything that depends on it"""
+    was_idle = self.is_idle
+    mover.velocity = velocity
+
+    for condition in mover.conditions:
+      self.schedule(condition)
+
+    if was_idle and not self.is_idle:
+      self.bus.emit("active", time=self.time)
+
+  def _move(self, dt: float):
+    if dt <= 0:
+      return
+
+    for mover in self.movers:
+      if mover.is_moving:
+        mover.mob.shift(np.array((mover.velocity * dt, 0.0, 0.0)))
+
+  def advance(self, dt: float):
+    """Moves everything dt forward in time, firing the events that fall inside the frame in order"""
+    end = self.time + dt
+    fired = 0
+
+    while self._queue and self._queue[0][0] <= end and fired < self.MAX_EVENTS_PER_ADVANCE:
+      time, _, version, condition = heapq.heappop(self._queue)
+      if version != condition.version:
+        continue
+
+      self._move(time - self.time)
+      self.time = time
+      condition.touching = not condition.touching
+      fired += 1
+
+      version = condition.version
+      self.bus.emit("contact" if condition.touching else "separation", condition=condition, time=time)
+      # The handlers might have re-predicted it already
+      if condition.version == version:
+        self.schedule(condition)
+
+    self._move(end - self.time)
+    self.time = end
+
+    if self.is_idle:
+      self.bus.emit("idle", time=self.time)
+
+class FlyTrainEvents:
+  """
+    The fly roaming between two trains, as events. The fly turns around on contact with a train (or, out of roam trips,
+    stops there and waits for resume), and a train touching the fly holds both trains back until they separate.
+    Same rules as FlyRoamingMixin.roam_step and TrainRoamingMixin.roam_step, the fly and the trains keep their roaming
+    state (direction, roam trips, ...) so the scene can read it as before.
+  """
+  def __init__(self, fly, left_train, right_train, min_leg=1e-3, bus: EventBus | None = None):
+    self.scheduler = EventScheduler(bus)
+    self.bus = self.scheduler.bus
+    self.fly, self.left_train, self.right_train = fly, left_train, right_train
+    # Once the fly has less than this to go between bounces the trains have as good as met
+    self.min_leg = min_leg
+    self.stopped = False
+    self.fly_suspended = False
+    self._last_train_gap = None
+
+    self.fly_mover = self.scheduler.add_mover(fly, fly.speed * fly.direction)
+    self.train_movers = {
+      train: self.scheduler.add_mover(train, train.speed * train.direction)
+      for train in (left_train, right_train)
+    }
+
+    self.fly_condition = self.scheduler.add_condition(
+      "fly",
+      [self.fly_mover, *self.train_movers.values()],
+      gap=lambda: fly.get_clearance(left_train, right_train),
+      rate=self.get_fly_closing_speed,
+    )
+    self.train_conditions = {
+      train: self.scheduler.add_condition(
+        "train",
+        [mover, self.fly_mover],
+        gap=lambda train=train: train.get_clearance(fly),
+        rate=lambda mover=mover, train=train: (mover.velocity - self.fly_mover.velocity) * train.direction,
+      )
+      for train, mover in self.train_movers.items()
+    }
+
+    self.bus.subscribe("contact", self.on_contact)
+    self.bus.subscribe("separation", self.on_separation)
+
+  def get_fly_closing_speed(self) -> float:
+    target = self.right_train if self.fly.direction == 1 else self.left_train
+    return (self.fly_mover.velocity - self.train_movers[target].velocity) * self.fly.direction
+
+  def get_train_gap(self) -> float:
+    return self.right_train.get_left()[0] - self.left_train.get_right()[0]
+
+  def get_trains_held_back(self) -> bool:
+    return self.stopped or any(condition.touching for condition in self.train_conditions.values())
+
+  def set_trains_moving(self, moving: bool):
+    for train, mover in self.train_movers.items():
+      self.scheduler.set_velocity(mover, train.speed * train.direction if moving else 0.0)
+
+  def turn_fly_around(self):
+    fly = self.fly
+    fly.flip()
+    fly.update_direction(fly.direction * -1)
+    fly.set_force_roam_trip(False)
+
+    # Heading for the other train now, not touching it
+    self.fly_condition.touching = False
+    self.scheduler.set_velocity(self.fly_mover, fly.speed * fly.direction)
+
+    # A wide fly can keep the trains held back for good, bouncing on the spot. Once they stop closing in between two
+    # bounces they're as close as they'll get
+    train_gap = self.get_train_gap()
+    stalled = self._last_train_gap is not None and self._last_train_gap - train_gap < self.min_leg
+    self._last_train_gap = train_gap
+
+    if self.fly_condition.gap() < self.min_leg or stalled:
+      self.stop()
+
+  def on_contact(self, condition: Condition, time: float):
+    if condition is self.fly_condition:
+      fly = self.fly
+      self.bus.emit("fly_contact", time=time, direction=fly.direction)
+
+      if fly.infinite_roam or fly.roam_current_trip:
+        self.turn_fly_around()
+      else:
+        # Out of roam trips: wait at the train, the next resume turns the fly around
+        fly.set_force_roam_trip(True)
+        fly.roam_update()
+        self.fly_suspended = True
+        self.scheduler.set_velocity(self.fly_mover, 0.0)
+        self.bus.emit("leg_end", time=time)
+
+    elif condition in self.train_conditions.values():
+      self.set_trains_moving(False)
+
+  def on_separation(self, condition: Condition, time: float):
+    if condition in self.train_conditions.values() and not self.get_trains_held_back():
+      self.set_trains_moving(True)
+
+  def resume(self):
+    """Sets off the next leg after the fly stopped at a train"""
+    if self.stopped or not self.fly_suspended:
+      return
+
+    self.fly_suspended = False
+    self.turn_fly_around()
+    if not self.get_trains_held_back():
+      self.set_trains_moving(True)
+
+  def stop(self):
+    """Everything stops for good, the trains have met"""
+    self.stopped = True
+    self.scheduler.set_velocity(self.fly_mover, 0.0)
+    self.set_trains_moving(False)
+    self.bus.emit("meet", time=self.scheduler.time)
@@ -0,0 +1,343 @@
+from manim import *
+import ast
+import inspect
+import json
+from contextlib import contextmanager
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils.tex_file_writing import compile_tex, tex_hash
+
+# One TeX run for every MathTex/Tex of a scene, instead of a latex + dvisvgm pair per expression.
+#
+# Manim caches each compiled expression as media/Tex/<hash of the full tex document>.svg and only compiles the ones
+# missing from there. The pre-pass below (run in the scene's setup, before construct) collects the expressions the
+# scene is going to create, typesets all the missing ones as the pages of one multi-page document, converts every page
+# with a single dvisvgm call and files each page under the name manim would have given it. By the time construct
+# runs, every MathTex is a cache hit.
+#
+# Expressions are collected from two places:
+#   - every MathTex/Tex call in the scene's module whose arguments are plain string literals (built through manim
+#     itself, so the tex is exactly what the scene will ask for)
+#   - a per scene manifest of every expression the previous renders of the scene actually created, which covers the
+#     ones built from f-strings and loop variables
+#
+# A scene split into sections (render_sections.py renders them in parallel processes) only pre-compiles the
+# expressions of the sections it's rendering, and the manifest remembers which section created what.
+
+TEX_CLASSES = {"SingleStringMathTex", "MathTex", "Tex"}
+
+# The default template is a standalone document, asking it for one page per standalone environment is all it takes
+STANDALONE_CLASS = re.compile(r"\\documentclass\[([^\]]*)\]\{standalone\}")
+
+# A lock older than this was left behind by a process that died holding it
+STALE_LOCK_SECONDS = 60
+
+class _CollectedTex(Exception):
+  """Raised by the collector instead of compiling anything, with the tex document the mobject asked for"""
+
+def _get_template_info(tex_template) -> dict:
+  return {
+    "body": tex_template.body,
+    "placeholder": tex_template.placeholder_text,
+    "tex_compiler": tex_template.tex_compiler,
+    "output_format": tex_template.output_format,
+  }
+
+def _get_texcode(expression: str, environment: str | None, tex_template) -> str:
+  """The full tex document manim writes (and hashes) for the expression, see tex_file_writing.generate_tex_file"""
+  if environment is not None:
+    return tex_template.get_texcode_for_expression_in_env(expression, environment)
+
+  return tex_template.get_texcode_for_expression(expression)
+
+def _get_page(texcode: str, template: dict) -> str:
+  """What the expression put in place of the template's placeholder"""
+  prefix, suffix = template["body"].split(template["placeholder"], 1)
+  return texcode[len(prefix):len(texcode) - len(suffix)]
+
+def get_tex_svg_path(texcode: str) -> Path:
+  return config.get_dir("tex_dir") / f"{tex_hash(texcode)}.svg"
+
+@contextmanager
+def _tex_to_svg_file_as(replacement):
+  """Has every MathTex/Tex created inside the block go through replacement instead of manim's tex_to_svg_file"""
+  original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+  tex_mobject.tex_to_svg_file = replacement
+
+  try:
+    yield original_tex_to_svg_file
+  finally:
+    tex_mobject.tex_to_svg_file = original_tex_to_svg_file
+
+def _get_literal_call(node: ast.Call) -> tuple[list[str], dict] | None:
+  """The call's (args, kwargs) if every argument is a literal and the positional ones are strings, None otherwise"""
+  if any(isinstance(arg, ast.Starred) for arg in node.args) or any(keyword.arg is None for keyword in node.keywords):
+    return None
+
+  try:
+    args = [ast.literal_eval(arg) for arg in node.args]
+    kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in node.keywords}
+  except ValueError:
+    return None
+
+  return (args, kwargs) if all(isinstance(arg, str) for arg in args) else None
+
+@contextmanager
+def _file_lock(path: Path):
+  """Holds path as a lock file, so the parallel section renders take turns (works the same on every OS)"""
+  path.parent.mkdir(parents=True, exist_ok=True)
+
+  while True:
+    try:
+      fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+      break
+    except FileExistsError:
+      try:
+        if time.time() - path.stat().st_mtime > STALE_LOCK_SECONDS:
+          path.unlink()
+      except FileNotFoundError:
+        pass
+      time.sleep(.05)
+
+  try:
+    yield
+  finally:
+    os.close(fd)
+    path.unlink()
+
+def collect_static_tex(module, functions: set[str] | None = None) -> list[tuple[dict, str]]:
+  """
+    (template, texcode) of every MathTex/Tex call in the module that only takes literals, the tex strings being string
+    literals. Nothing in the module gets evaluated, the literals are handed to the manim class of the same name. With
+    functions, only the calls inside functions of those names count.
+  """
+  tree = ast.parse(inspect.getsource(module))
+  if functions is None:
+    roots = [tree]
+  else:
+    roots = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and node.name in functions]
+
+  collected = []
+
+  def collect(expression, environment=None, tex_template=None):
+    tex_template = tex_template or config["tex_template"]
+    raise _CollectedTex(_get_template_info(tex_template), _get_texcode(expression, environment, tex_template))
+
+  with _tex_to_svg_file_as(collect):
+    for node in (node for root in roots for node in ast.walk(root)):
+      if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in TEX_CLASSES):
+        continue
+
+      # Built from locals (f-strings, loop variables, ...), the manifest picks these up after the first render
+      call = _get_literal_call(node)
+      if call is None:
+        continue
+
+      args, kwargs = call
+      try:
+        getattr(tex_mobject, node.func.id)(*args, **kwargs)
+      except _CollectedTex as collected_tex:
+        collected.append(collected_tex.args)
+      except Exception:
+        # Arguments manim doesn't take, the scene would fail on them anyway
+        pass
+
+  return collected
+
+def compile_tex_batch(texcodes: list[str], template: dict) -> bool:
+  """
+    Typesets the tex documents (all sharing the template) as the pages of one document and files each page where
+    manim looks for it. Returns False if the template can't be batched or anything fails, in which case manim just
+    compiles those expressions one by one like it always does.
+  """
+  prefix, suffix = template["body"].split(template["placeholder"], 1)
+  if not STANDALONE_CLASS.search(prefix):
+    return False
+
+  tex_dir = config.get_dir("tex_dir")
+  tex_dir.mkdir(parents=True, exist_ok=True)
+
+  # Sections render in parallel processes that may batch the same expressions, keep their scratch files apart
+  stem = f"batch_{tex_hash(''.join(texcodes))}_{os.getpid()}"
+  batch_file = tex_dir / f"{stem}.tex"
+
+  batch_prefix = STANDALONE_CLASS.sub(lambda match: f"\\documentclass[{match[1]},multi=true]{{standalone}}", prefix, count=1)
+  pages = [f"\\begin{{standalone}}{_get_page(texcode, template)}\\end{{standalone}}" for texcode in texcodes]
+  batch_file.write_text(batch_prefix + "\n".join(pages) + suffix, encoding="utf-8")
+
+  try:
+    dvi_file = compile_tex(batch_file, template["tex_compiler"], template["output_format"])
+  except ValueError:
+    return False
+
+  conversion = subprocess.run(
+    [
+      "dvisvgm",
+      *(["--pdf"] if template["output_format"] == ".pdf" else []),
+      "--page=1-",
+      "--no-fonts",
+      "--verbosity=0",
+      f"--output={(tex_dir / stem).as_posix()}-%p.svg",
+      dvi_file.as_posix(),
+    ],
+    stdout=subprocess.DEVNULL,
+  )
+
+  page_files = {int(path.stem.rsplit("-", 1)[1]): path for path in tex_dir.glob(f"{stem}-*.svg")}
+  # A failed conversion can still leave every page behind, some of them cut short
+  batched = conversion.returncode == 0 and len(page_files) == len(texcodes)
+
+  if batched:
+    for page_no, texcode in enumerate(texcodes, start=1):
+      page_files[page_no].replace(get_tex_svg_path(texcode))
+  else:
+    for path in page_files.values():
+      path.unlink()
+
+  batch_file.unlink()
+  if not config["no_latex_cleanup"]:
+    # Only this batch's leftovers (.dvi, .log, ...), the other sections might still be compiling theirs
+    for path in tex_dir.glob(f"{stem}.*"):
+      path.unlink()
+
+  return batched
+
+class TexBatchMixin:
+  """
+    Scene mixin that compiles every expression the scene will need in one TeX run before construct, and keeps a
+    manifest of the expressions (and of what compiling one on its own costs) for the next render.
+  """
+  def get_tex_manifest_path(self) -> Path:
+    return config.get_dir("media_dir") / "tex_batches" / f"{type(self).__name__}.json"
+
+  def get_tex_sections(self) -> list[str] | None:
+    """The sections this render plays (each one a <section>_section method), None if the scene isn't split into any"""
+    return self.get_sections() if hasattr(self, "get_sections") else None
+
+  def load_tex_manifest(self) -> dict:
+    path = self.get_tex_manifest_path()
+    if not path.exists():
+      return {"templates": [], "expressions": [], "single_compile": [0.0, 0]}
+
+    manifest = json.loads(path.read_text())
+    # Manifests from before the sections were kept track of have no section, they count for every section
+    manifest["expressions"] = [[*entry, None][:3] for entry in manifest["expressions"]]
+    return manifest
+
+  def save_tex_manifest(self):
+    """
+      Swaps the expressions of the sections just rendered for the ones they created this time, so expressions that
+      aren't used any more drop out. The manifest is shared by every section render, hence the lock.
+    """
+    path = self.get_tex_manifest_path()
+
+    with _file_lock(path.with_suffix(".lock")):
+      manifest = self.load_tex_manifest()
+      templates = manifest["templates"]
+      sections = self.get_tex_sections()
+      # Entries are [template index, page, section], only the sections that weren't rendered keep theirs
+      expressions = {
+        tuple(entry) for entry in manifest["expressions"]
+        if sections is not None and entry[2] is not None and entry[2] not in sections
+      }
+
+      for template, texcode, section in self.tex_expressions:
+        if template not in templates:
+          templates.append(template)
+        expressions.add((templates.index(template), _get_page(texcode, template), section))
+
+      manifest["expressions"] = sorted(expressions, key=lambda entry: (entry[0], entry[1], entry[2] or ""))
+      manifest["single_compile"] = [a + b for a, b in zip(manifest["single_compile"], self.single_compile)]
+
+      scratch = path.with_suffix(f".{os.getpid()}.tmp")
+      scratch.write_text(json.dumps(manifest, indent=2))
+      scratch.replace(path)
+
+  def setup(self):
+    super().setup()
+    self.tex_expressions: list[tuple[dict, str, str | None]] = []
+    self.tex_section = None
+    self.single_compile = [0.0, 0]
+
+    self.precompile_tex()
+
+  def render(self, *args, **kwargs):
+    # Only this scene's render goes through the recording, and manim's own tex_to_svg_file is back once it's done,
+    # however construct ended
+    with _tex_to_svg_file_as(self._record_tex) as original_tex_to_svg_file:
+      self._original_tex_to_svg_file = original_tex_to_svg_file
+      return super().render(*args, **kwargs)
+
+  def next_section(self, name="unnamed", *args, **kwargs):
+    self.tex_section = name
+    super().next_section(name, *args, **kwargs)
+
+  def tear_down(self):
+    self.save_tex_manifest()
+    super().tear_down()
+
+  def _record_tex(self, expression, environment=None, tex_template=None):
+    """Notes down every expression the render creates, and times the ones that still had to be compiled on their own"""
+    original_tex_to_svg_file = self._original_tex_to_svg_file
+    tex_template = tex_template or config["tex_template"]
+    texcode = _get_texcode(expression, environment, tex_template)
+    self.tex_expressions.append((_get_template_info(tex_template), texcode, self.tex_section))
+
+    if get_tex_svg_path(texcode).exists():
+      return original_tex_to_svg_file(expression, environment, tex_template)
+
+    start = time.perf_counter()
+    svg_file = original_tex_to_svg_file(expression, environment, tex_template)
+    self.single_compile[0] += time.perf_counter() - start
+    self.single_compile[1] += 1
+
+    return svg_file
+
+  def precompile_tex(self):
+    """The pre-pass: batch compiles every known expression of the scene that isn't in manim's tex cache yet"""
+    manifest = self.load_tex_manifest()
+    sections = self.get_tex_sections()
+    expressions = collect_static_tex(
+      sys.modules[type(self).__module__],
+      None if sections is None else {f"{section}_section" for section in sections},
+    )
+
+    for template_idx, page, section in manifest["expressions"]:
+      if sections is not None and section not in sections:
+        continue
+
+      template = manifest["templates"][template_idx]
+      prefix, suffix = template["body"].split(template["placeholder"], 1)
+      expressions.append((template, prefix + page + suffix))
+
+    # Group whatever is missing by template, every template is its own document
+    missing: dict[str, tuple[dict, list[str]]] = {}
+    for template, texcode in expressions:
+      if not get_tex_svg_path(texcode).exists():
+        texcodes = missing.setdefault(json.dumps(template, sort_keys=True), (template, []))[1]
+        if texcode not in texcodes:
+          texcodes.append(texcode)
+
+    if not missing:
+      return
+
+    start = time.perf_counter()
+    batched = sum(len(texcodes) for template, texcodes in missing.values() if compile_tex_batch(texcodes, template))
+    batch_time = time.perf_counter() - start
+
+    report = f"TeX pre-pass: compiled {batched} expressions in {len(missing)} TeX run(s), {batch_time:.2f}s"
+    total_time, count = manifest["single_compile"]
+    if count:
+      # What the same expressions would have cost one by one, going by the previous renders of the scene
+      one_by_one = batched * total_time / count
+      report += f" (~{one_by_one:.2f}s one by one, saved ~{one_by_one - batch_time:.2f}s)"
+    else:
+      report += " (the one by one cost is measured on the expressions this render still compiles on its own)"
+
+    print(report)
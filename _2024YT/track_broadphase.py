@@ -0,0 +1,270 @@
+import argparse
+import time
+
+import numpy as np
+
+# Many flies bouncing among many moving obstacles (trains) on one track, for the "what if there were lots of flies"
+# variant of the video. Like fly_simulation, nothing in here knows about manim: everything is an x interval in scene
+# units and velocities are in scene units per second.
+#
+# Finding who touches whom is a 1D sweep and prune: sort the intervals by their left end once, and each interval can
+# only overlap the ones whose left end comes before its right end, a searchsorted away. That's O(n log n) for the sort
+# plus the number of actual contacts, instead of checking every fly against every obstacle.
+# Usage (from the project root):
+#   python _2024YT/track_broadphase.py [--flies 10 100 1000] [--obstacles 2 8 32]
+
+def _expand_ranges(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+  """(k, index) for every index in starts[k] .. ends[k]-1, without a python loop"""
+  counts = np.maximum(ends - starts, 0)
+  owners = np.repeat(np.arange(len(starts)), counts)
+  # Offset of every index within its run
+  offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+  return owners, np.repeat(starts, counts) + offsets
+
+def sweep_and_prune(lefts, rights) -> tuple[np.ndarray, np.ndarray]:
+  """Every pair of overlapping (or touching) intervals of one set, as two index arrays (i, j)"""
+  lefts, rights = np.asarray(lefts, dtype=float), np.asarray(rights, dtype=float)
+  order = np.argsort(lefts, kind="stable")
+
+  # Interval k (in sorted order) overlaps k+1 .. ends[k]-1, the ones that start before it ends
+  ends = np.searchsorted(lefts[order], rights[order], side="right")
+  first, second = _expand_ranges(np.arange(1, len(order) + 1), ends)
+
+  return order[first], order[second]
+
+def sweep_and_prune_between(lefts_a, rights_a, lefts_b, rights_b) -> tuple[np.ndarray, np.ndarray]:
+  """
+    Every overlapping (or touching) pair of an interval of a and one of b, as (index in a, index in b). Pairs within a
+    set are never generated, so a thousand flies crowding the same gap cost nothing on top of their actual contacts.
+  """
+  lefts_a, rights_a = np.asarray(lefts_a, dtype=float), np.asarray(rights_a, dtype=float)
+  lefts_b, rights_b = np.asarray(lefts_b, dtype=float), np.asarray(rights_b, dtype=float)
+  order_a, order_b = np.argsort(lefts_a, kind="stable"), np.argsort(lefts_b, kind="stable")
+  sorted_a, sorted_b = lefts_a[order_a], lefts_b[order_b]
+
+  # Overlapping intervals always have one starting inside the other: b's that start inside an a (ties go here) ...
+  a_owner, b_inside = _expand_ranges(
+    np.searchsorted(sorted_b, sorted_a, side="left"),
+    np.searchsorted(sorted_b, rights_a[order_a], side="right"),
+  )
+  # ... and a's that start inside a b, strictly after it, so no pair is found twice
+  b_owner, a_inside = _expand_ranges(
+    np.searchsorted(sorted_a, sorted_b, side="right"),
+    np.searchsorted(sorted_a, rights_b[order_b], side="right"),
+  )
+
+  return (
+    np.concatenate((order_a[a_owner], order_a[a_inside])),
+    np.concatenate((order_b[b_inside], order_b[b_owner])),
+  )
+
+def brute_force_pairs(lefts_a, rights_a, lefts_b=None, rights_b=None) -> tuple[np.ndarray, np.ndarray]:
+  """The O(n*m) version of the sweeps above, for checking them (and for seeing what they save)"""
+  within = lefts_b is None
+  lefts_a, rights_a = np.asarray(lefts_a, dtype=float), np.asarray(rights_a, dtype=float)
+  lefts_b, rights_b = (lefts_a, rights_a) if within else (np.asarray(lefts_b, dtype=float), np.asarray(rights_b, dtype=float))
+  overlaps = (lefts_a[:, None] <= rights_b[None, :]) & (lefts_b[None, :] <= rights_a[:, None])
+
+  return np.nonzero(np.triu(overlaps, k=1) if within else overlaps)
+
+class TrackWorld:
+  """
+    N flies and M obstacles on one track. Obstacles move at constant speed until they run into each other, then both
+    stop (the trains meeting). Like the fly in the video, a fly keeps its speed and just turns around when it hits an
+    obstacle, and a fly with no room left to turn around in is pinned in its gap. Flies go straight through each other.
+  """
+  def __init__(self, fly_x, fly_speed, fly_direction, fly_width, obstacle_left, obstacle_right, obstacle_v):
+    self.fly_x = np.array(fly_x, dtype=float)
+    self.fly_speed = np.broadcast_to(np.asarray(fly_speed, dtype=float), self.fly_x.shape).copy()
+    self.fly_direction = np.broadcast_to(np.asarray(fly_direction, dtype=int), self.fly_x.shape).copy()
+    self.fly_half_width = np.broadcast_to(np.asarray(fly_width, dtype=float) / 2, self.fly_x.shape).copy()
+    self.obstacle_left = np.array(obstacle_left, dtype=float)
+    self.obstacle_right = np.array(obstacle_right, dtype=float)
+    self.obstacle_v = np.array(obstacle_v, dtype=float)
+    self.pinned = np.zeros(len(self.fly_x), dtype=bool)
+    # The two obstacles each pinned fly is stuck between
+    self.pinned_between = np.zeros((len(self.fly_x), 2), dtype=int)
+    self.bounces = np.zeros(len(self.fly_x), dtype=int)
+    self.distance = np.zeros(len(self.fly_x))
+    self.time = 0.0
+
+  @property
+  def fly_count(self) -> int:
+    return len(self.fly_x)
+
+  def get_contacts(self):
+    """(fly, obstacle) index pairs currently touching, through the sweep and prune"""
+    return sweep_and_prune_between(
+      self.fly_x - self.fly_half_width,
+      self.fly_x + self.fly_half_width,
+      self.obstacle_left,
+      self.obstacle_right,
+    )
+
+  def get_obstacle_contacts(self):
+    """(obstacle, obstacle) index pairs currently overlapping"""
+    return sweep_and_prune(self.obstacle_left, self.obstacle_right)
+
+  def step_obstacles(self, dt: float):
+    self.obstacle_left += self.obstacle_v * dt
+    self.obstacle_right += self.obstacle_v * dt
+
+    a, b = self.get_obstacle_contacts()
+    if not len(a):
+      return
+
+    # Back both off to where they just touched, splitting the overlap between the two, and stop them
+    a_first = self.obstacle_left[a] <= self.obstacle_left[b]
+    a, b = np.where(a_first, a, b), np.where(a_first, b, a)
+    overlap = (self.obstacle_right[a] - self.obstacle_left[b]) / 2
+    np.subtract.at(self.obstacle_left, a, overlap)
+    np.subtract.at(self.obstacle_right, a, overlap)
+    np.add.at(self.obstacle_left, b, overlap)
+    np.add.at(self.obstacle_right, b, overlap)
+    self.obstacle_v[a] = 0
+    self.obstacle_v[b] = 0
+
+  def get_penetrating(self, fly, obstacle) -> np.ndarray:
+    """Which of the (fly, obstacle) contacts are actually inside each other, not just touching"""
+    return (
+      (self.fly_x[fly] - self.fly_half_width[fly] < self.obstacle_right[obstacle] - 1e-9)
+      & (self.fly_x[fly] + self.fly_half_width[fly] > self.obstacle_left[obstacle] + 1e-9)
+    )
+
+  def step_flies(self, dt: float):
+    # Pinned flies ride along in the middle of their gap
+    pinned = np.nonzero(self.pinned)[0]
+    left_of, right_of = self.pinned_between[pinned].T
+    self.fly_x[pinned] = (self.obstacle_right[left_of] + self.obstacle_left[right_of]) / 2
+
+    moving = ~self.pinned
+    step = self.fly_speed * dt * moving
+    self.fly_x += step * self.fly_direction
+    self.distance += step
+
+    fly, obstacle = self.get_contacts()
+    keep = moving[fly]
+    fly, obstacle = fly[keep], obstacle[keep]
+    if not len(fly):
+      return
+
+    # A fly touching two obstacles at once is squeezed between them
+    squeezed = np.bincount(fly, minlength=self.fly_count) > 1
+    if squeezed.any():
+      self.pin_flies(fly[squeezed[fly]], obstacle[squeezed[fly]])
+      fly, obstacle = fly[~squeezed[fly]], obstacle[~squeezed[fly]]
+
+    # Which face of the obstacle the fly ran into, by which side of the obstacle's center it's on
+    center = (self.obstacle_left[obstacle] + self.obstacle_right[obstacle]) / 2
+    side = np.where(self.fly_x[fly] < center, -1, 1)
+    half_width = self.fly_half_width[fly]
+    face = np.where(side == -1, self.obstacle_left[obstacle] - half_width, self.obstacle_right[obstacle] + half_width)
+
+    # Mirror whatever went past the face back in front of it and turn around. A fly that's already heading away (the
+    # obstacle caught up with it) just gets pushed out
+    approaching = self.fly_direction[fly] * side < 0
+    self.fly_x[fly] = np.where(approaching, 2 * face - self.fly_x[fly], face)
+    self.fly_direction[fly] = np.where(approaching, side, self.fly_direction[fly])
+    self.bounces[fly] += approaching
+
+    # Mirrored into the obstacle on the other side: the gap is narrower than the fly gets in a frame, it's stuck
+    # between the obstacle it bounced off and the one it ended up in
+    hit_fly, hit_obstacle = self.get_contacts()
+    inside = self.get_penetrating(hit_fly, hit_obstacle) & ~self.pinned[hit_fly]
+    if inside.any():
+      stuck = np.zeros(self.fly_count, dtype=bool)
+      stuck[hit_fly[inside]] = True
+      self.pin_flies(
+        np.concatenate((hit_fly[inside], fly[stuck[fly]])),
+        np.concatenate((hit_obstacle[inside], obstacle[stuck[fly]])),
+      )
+
+  def pin_flies(self, fly, obstacle):
+    """
+      Stops flies in the middle of the gap they're stuck in, given (fly, obstacle) pairs of the obstacles each one ran
+      into. The gap is between the leftmost and the rightmost of those.
+    """
+    center = (self.obstacle_left + self.obstacle_right) / 2
+    order = np.lexsort((center[obstacle], fly))
+    fly, obstacle = fly[order], obstacle[order]
+    flies, first = np.unique(fly, return_index=True)
+    last = np.append(first[1:], len(fly)) - 1
+    left_of, right_of = obstacle[first], obstacle[last]
+
+    self.fly_x[flies] = (self.obstacle_right[left_of] + self.obstacle_left[right_of]) / 2
+    self.pinned_between[flies] = np.stack((left_of, right_of), axis=1)
+    self.pinned[flies] = True
+
+  def step(self, dt: float):
+    """One frame: the obstacles move first, then the flies, like the updaters in the scene"""
+    self.step_obstacles(dt)
+    self.step_flies(dt)
+    self.time += dt
+    return self
+
+  def run(self, duration: float, frame_rate=60):
+    for _ in range(int(round(duration * frame_rate))):
+      self.step(1 / frame_rate)
+    return self
+
+def build_track_world(
+  fly_count: int,
+  obstacle_count=2,
+  gap=10.0,
+  fly_speed=3.75,
+  train_speed=1.875,
+  train_length=1.0,
+  fly_width=0.05,
+  seed=0,
+) -> TrackWorld:
+  """
+    obstacle_count trains spread along the track, every other one heading the other way so they pair up head on,
+    with the flies scattered across the gaps heading either way
+  """
+  rng = np.random.default_rng(seed)
+  starts = np.arange(obstacle_count) * (gap + train_length)
+  directions = np.where(np.arange(obstacle_count) % 2 == 0, 1, -1)
+
+  # Drop each fly in a random gap between two trains
+  gaps = rng.integers(0, max(obstacle_count - 1, 1), fly_count)
+  fly_x = starts[gaps] + train_length + fly_width / 2 + rng.uniform(0, 1, fly_count) * (gap - fly_width)
+
+  return TrackWorld(
+    fly_x,
+    fly_speed,
+    rng.choice((-1, 1), fly_count),
+    fly_width,
+    starts,
+    starts + train_length,
+    train_speed * directions,
+  )
+
+def benchmark_broadphase(fly_counts=(10, 100, 1000), obstacle_counts=(2, 8, 32), frames=120):
+  """Per-frame step time of the world, and the pair search alone against the brute force one"""
+  print(f"{'flies':>8}{'obstacles':>11}{'frame':>12}{'sweep':>12}{'brute':>12}")
+  for fly_count in fly_counts:
+    for obstacle_count in obstacle_counts:
+      world = build_track_world(fly_count, obstacle_count)
+
+      start = time.perf_counter()
+      world.run(frames / 60)
+      frame_time = (time.perf_counter() - start) / frames
+
+      intervals = (world.fly_x - world.fly_half_width, world.fly_x + world.fly_half_width, world.obstacle_left, world.obstacle_right)
+      timings = []
+      for find_pairs in (sweep_and_prune_between, brute_force_pairs):
+        start = time.perf_counter()
+        find_pairs(*intervals)
+        timings.append(time.perf_counter() - start)
+
+      print(f"{fly_count:>8}{obstacle_count:>11}" + "".join(f"{t * 1000:>10.3f}ms" for t in (frame_time, *timings)))
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark the fly/obstacle broadphase")
+  parser.add_argument("--flies", type=int, nargs="+", default=[10, 100, 1000])
+  parser.add_argument("--obstacles", type=int, nargs="+", default=[2, 8, 32])
+  parser.add_argument("--frames", type=int, default=120)
+  args = parser.parse_args()
+
+  benchmark_broadphase(args.flies, args.obstacles, args.frames)
@@ -0,0 +1,55 @@
+from manim import *
+import argparse
+import time
+import tracemalloc
+
+from puzzle import SimpleTrain
+
+# How long SimpleTrain(n) takes to build (and how much memory it needs), with and without car templates.
+# Usage (from the project root):
+#   python _2024YT/train_benchmark.py [--sizes 1 10 100 500] [--mode both|templates|layout]
+
+DEFAULT_SIZES = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+
+def measure_simple_train(no_of_cars: int, use_templates: bool) -> tuple[float, float]:
+  """Returns the construction time (s) and the peak memory allocated while constructing (MB) of SimpleTrain(n)"""
+  start = time.perf_counter()
+  SimpleTrain(no_of_cars, use_templates=use_templates)
+  elapsed = time.perf_counter() - start
+
+  # Built once more for the memory, tracing every allocation would throw the timing off
+  tracemalloc.start()
+  SimpleTrain(no_of_cars, use_templates=use_templates)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  return elapsed, peak / 2**20
+
+def benchmark_simple_train(sizes=DEFAULT_SIZES, modes=(False, True)):
+  """Prints construction time and memory per train length for each construction mode"""
+  header = f"{'cars':>6}" + "".join(f"{label:>26}" for label in [("templates" if mode else "layout") for mode in modes])
+  print(header)
+  print(f"{'':>6}" + "".join(f"{'time':>14}{'peak mem':>12}" for _ in modes))
+  print("-" * len(header))
+
+  results = {}
+  for no_of_cars in sizes:
+    row = f"{no_of_cars:>6}"
+
+    for use_templates in modes:
+      elapsed, peak = measure_simple_train(no_of_cars, use_templates)
+      results[(no_of_cars, use_templates)] = (elapsed, peak)
+      row += f"{elapsed * 1000:>12.1f}ms{peak:>10.2f}MB"
+
+    print(row)
+
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark SimpleTrain construction")
+  parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="train lengths (number of cars) to build")
+  parser.add_argument("--mode", choices=("both", "templates", "layout"), default="both", help="construction mode(s) to measure")
+  args = parser.parse_args()
+
+  modes = {"both": (False, True), "templates": (True,), "layout": (False,)}[args.mode]
+  benchmark_simple_train(args.sizes, modes)
@@ -1,6 +1,7 @@
 from manim import *
 import random
 import math
+from lsystem import L_SYSTEMS, fit_anchors
 
 class NextTo(Scene):
   def construct(self):
@@ -292,21 +293,81 @@ class InscribedTriangle(Scene):
 # I wasn't able to do the maze task successfully, I shall return to it later
 
 # Hilbert's curve
+def hilbert_d2xy(order: int) -> tuple[np.ndarray, np.ndarray]:
+  """
+    Grid cell (x, y) of every distance d along the Hilbert curve of the given order, for all 4^order of them at once.
+    The classic d2xy, looping over the order (the 2 bits of d per level) instead of over the points.
+  """
+  t = np.arange(4 ** order, dtype=np.int64)
+  x = np.zeros_like(t)
+  y = np.zeros_like(t)
+
+  s = 1
+  while s < 2 ** order:
+    rx = 1 & (t // 2)
+    ry = 1 & (t ^ rx)
+
+    # Rotate the quadrant the right way round: reflected if rx, and then transposed, wherever ry is 0
+    reflect = (ry == 0) & (rx == 1)
+    x = np.where(reflect, s - 1 - x, x)
+    y = np.where(reflect, s - 1 - y, y)
+    x, y = np.where(ry == 0, y, x), np.where(ry == 0, x, y)
+
+    x += s * rx
+    y += s * ry
+    t //= 4
+    s *= 2
+
+  return x, y
+
+def get_hilbert_anchors(order: int, side_length=4.0) -> np.ndarray:
+  """(4^order, 3) anchors of the curve, centered on a square of side_length. Order 1 is the LEFT + DOWN, LEFT + UP, ... cup"""
+  x, y = hilbert_d2xy(order)
+  cells = 2 ** order
+
+  anchors = np.zeros((len(x), 3))
+  anchors[:, 0] = (x + .5) * side_length / cells - side_length / 2
+  anchors[:, 1] = (y + .5) * side_length / cells - side_length / 2
+  return anchors
+
 class Path(Polygram):
+  """
+    A polyline whose anchors are a strided view of its bezier points, (n, 3) without a copy. They're sliced out of the
+    points on every lookup, never cached, so they can't drift from the points however the path (or a group holding
+    it) gets transformed, or reversed.
+  """
   def __init__(self, points, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.set_points_as_corners(points)
-
-  def get_important_points(self):
-      """Returns the important points of the curve."""
-      # shot explanation: Manim uses quadratic Bézier curves to create paths
-      # > each curve is determined by 4 points - 2 anchor and 2 control
-      # > VMobject's builtin self.points returns *all* points
-      # > we, however, only care about the anchors
-      # > see https://en.wikipedia.org/wiki/Bézier_curve for more details
-      return list(self.get_start_anchors()) + [self.get_end_anchors()[-1]]
+    super().__init__(*args, **kwargs)
+    self.set_anchors(points)
+
+  def set_anchors(self, anchors):
+    anchors = np.asarray(anchors, dtype=float)
+    self.set_points_as_corners(anchors)
+    # Manim uses cubic Bézier curves: 4 points a curve, 2 anchors and 2 handles, each curve starting where the last
+    # ended, so the end of the last curve is off the stride of the others. A zero length curve on both end anchors
+    # puts every anchor on it (the last point of each curve), whichever way round the points are
+    ends = [np.repeat(anchors[[index]], self.n_points_per_cubic_curve, axis=0) for index in (0, -1)]
+    self.points = np.concatenate((ends[0], self.points, ends[1]))
+    return self
+
+  def get_anchors(self) -> np.ndarray:
+    n = self.n_points_per_cubic_curve
+    return self.points[n - 1:-n:n]
+
+  def get_important_points(self) -> np.ndarray:
+    """Returns the important points (the anchors) of the curve."""
+    return self.get_anchors()
+
+  def get_reversed_anchors(self) -> np.ndarray:
+    return self.get_anchors()[::-1]
 
 class HilbertCurve(Scene):
+  # Up to MAX_STORYTELLING_ORDER the curve is built the way the video tells it, every order from copies of the one
+  # before. Past that (or with STORYTELLING off) it comes straight out of get_hilbert_anchors as a single path
+  ORDER = 5
+  STORYTELLING = True
+  MAX_STORYTELLING_ORDER = 6
+
   def construct(self):
     # initial path to be passed to the hilbert_generator
     points = [LEFT + DOWN, LEFT + UP, RIGHT + UP, RIGHT + DOWN]
@@ -323,6 +384,12 @@ class HilbertCurve(Scene):
     animation_label.shift(UP * 2.75)
     self.play(FadeIn(animation_label, shift=DOWN * 1.5))
 
+    if not self.STORYTELLING or self.ORDER > self.MAX_STORYTELLING_ORDER:
+      # Thinner the deeper it goes, or the stroke fills the whole square in
+      curve = Path(get_hilbert_anchors(self.ORDER, side_length=5), color=WHITE, stroke_width=min(DEFAULT_STROKE_WIDTH, 2 ** (7 - self.ORDER)))
+      self.play(Create(curve), run_time=path_run_time * 1.4 ** self.ORDER)
+      return
+
     def hilbert_generator(n: int, points):
       nonlocal path_run_time
       nonlocal buff_dist
@@ -366,19 +433,15 @@ class HilbertCurve(Scene):
       )
 
       # Now swap the starting and ending points of both the bottom left and bottom right path mobjects
-      pp_bottom_left = path_bottom_left.get_important_points()
-      pp_bottom_left.reverse()
-      # pp_bottom_left[0], pp_bottom_left[-1] = pp_bottom_left[-1], pp_bottom_left[0]
-      pp_bottom_right = path_bottom_right.get_important_points()
-      pp_bottom_right.reverse()
-      # pp_bottom_right[0], pp_bottom_right[-1] = pp_bottom_right[-1], pp_bottom_right[0]
+      pp_bottom_left = path_bottom_left.get_reversed_anchors()
+      pp_bottom_right = path_bottom_right.get_reversed_anchors()
 
       # Retrieve the path points for the top left and top right
-      pp_top_left = path.get_important_points()
-      pp_top_right = path_top_right.get_important_points()
+      pp_top_left = path.get_anchors()
+      pp_top_right = path_top_right.get_anchors()
 
       # concatenate them
-      path_points = pp_bottom_left + pp_top_left + pp_top_right + pp_bottom_right
+      path_points = np.concatenate((pp_bottom_left, pp_top_left, pp_top_right, pp_bottom_right))
 
       # Reduce the buff distance for the next execution
       buff_dist *= 0.5
@@ -388,7 +451,34 @@ class HilbertCurve(Scene):
 
       hilbert_generator(n-1, path_points)
 
-    hilbert_generator(5, points)
+    hilbert_generator(self.ORDER, points)
+
+class DeepHilbertCurve(HilbertCurve):
+  # About a million segments, in one go
+  ORDER = 10
+  STORYTELLING = False
+
+class LSystemCurves(Scene):
+  # curve -> (depth, label), every one of them a single Path straight out of the turtle
+  CURVES = {
+    "koch": (6, "Koch snowflake"),
+    "dragon": (16, "Dragon curve"),
+    "peano": (5, "Peano curve"),
+    "sierpinski": (9, "Sierpi\\'nski arrowhead"),
+    "hilbert": (8, "Hilbert's Curve"),
+  }
+
+  def construct(self):
+    for name, (depth, label) in self.CURVES.items():
+      animation_label = Tex(label).shift(UP * 3.25)
+      anchors = fit_anchors(L_SYSTEMS[name].get_anchors(depth), 6, 5.5)
+      # Thinner the more segments there are to squeeze in
+      curve = Path(anchors + DOWN * .5, color=WHITE, stroke_width=min(DEFAULT_STROKE_WIDTH, 400 / np.sqrt(len(anchors))))
+
+      self.play(FadeIn(animation_label, shift=DOWN * 1.5))
+      self.play(Create(curve), run_time=4)
+      self.wait()
+      self.play(FadeOut(curve, animation_label))
 
 class StarrySky(Scene):
   def construct(self):
@@ -464,6 +554,101 @@ class MovingCameraExample(MovingCameraScene):
     self.play(self.camera.frame.animate.restore())
 
 
+# The golden (well, Fibonacci) spiral: a quarter arc through every square, each one starting where the last ended
+def get_quarter_arcs(start_point, centers) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """(centers, radii, start angles) of the counterclockwise quarter arcs about each center in turn, from start_point on"""
+  centers = np.array(centers, dtype=float)
+  radii = np.empty(len(centers))
+  angles = np.empty(len(centers))
+
+  point = np.array(start_point, dtype=float)
+  for i, center in enumerate(centers):
+    offset = point - center
+    radii[i] = np.hypot(offset[0], offset[1])
+    angles[i] = np.arctan2(offset[1], offset[0])
+    point = center + radii[i] * np.array((np.cos(angles[i] + PI / 2), np.sin(angles[i] + PI / 2), 0))
+
+  return centers, radii, angles
+
+def sample_quarter_arcs(arcs, t) -> np.ndarray:
+  """Points at t (0 at the start, 1 per arc, len(arcs) at the very end) along the arcs, t can be an array"""
+  centers, radii, angles = arcs
+  t = np.asarray(t, dtype=float)
+  index = np.clip(np.floor(t).astype(int), 0, len(radii) - 1)
+  angle = angles[index] + (t - index) * PI / 2
+
+  return centers[index] + radii[index, None] * np.stack((np.cos(angle), np.sin(angle), np.zeros_like(angle)), axis=-1)
+
+def get_quarter_arc_points(arcs) -> np.ndarray:
+  """Bezier points of the arcs, one cubic curve per quarter arc (the usual 4/3 tan(pi/8) handles)"""
+  centers, radii, angles = arcs
+  handle = 4 / 3 * np.tan(PI / 8)
+
+  def unit(angle):
+    return np.stack((np.cos(angle), np.sin(angle), np.zeros_like(angle)), axis=-1)
+
+  start, end = unit(angles), unit(angles + PI / 2)
+  points = np.empty((len(radii), 4, 3))
+  points[:, 0] = centers + radii[:, None] * start
+  points[:, 1] = points[:, 0] + radii[:, None] * handle * unit(angles + PI / 2)
+  points[:, 3] = centers + radii[:, None] * end
+  points[:, 2] = points[:, 3] + radii[:, None] * handle * start
+
+  return points.reshape((-1, 3))
+
+class CameraSpline:
+  """
+    Where the camera frame is (center and width) over time, a Catmull-Rom spline through keyframes spaced evenly in
+    time. Widths are splined in log space, so a steady zoom stays steady.
+  """
+  def __init__(self, duration: float, centers, widths):
+    self.duration = duration
+    self.values = np.column_stack((np.asarray(centers, dtype=float), np.log(np.asarray(widths, dtype=float))))
+
+    # Tangents (per keyframe step), one sided at the ends
+    padded = np.concatenate((2 * self.values[:1] - self.values[1:2], self.values, 2 * self.values[-1:] - self.values[-2:-1]))
+    self.tangents = (padded[2:] - padded[:-2]) / 2
+
+  def sample(self, t: float) -> tuple[np.ndarray, float]:
+    position = np.clip(t / self.duration, 0, 1) * (len(self.values) - 1)
+    i = min(int(position), len(self.values) - 2)
+    u = position - i
+
+    # Cubic hermite basis
+    h00, h10, h01, h11 = 2*u**3 - 3*u**2 + 1, u**3 - 2*u**2 + u, -2*u**3 + 3*u**2, u**3 - u**2
+    value = h00 * self.values[i] + h10 * self.tangents[i] + h01 * self.values[i + 1] + h11 * self.tangents[i + 1]
+
+    return value[:3], float(np.exp(value[3]))
+
+class SpiralCameraMove(Animation):
+  """
+    Draws the spiral arc by arc, a dot at its tip, with the camera on a precomputed spline. One animation for the whole
+    spiral: no updaters, and the curve is a slice of the finished one instead of a trace growing a point per frame.
+  """
+  def __init__(self, spiral: VMobject, dot: Mobject, frame: Mobject, arcs, camera_path: CameraSpline, **kwargs) -> None:
+    self.full_spiral = spiral.copy()
+    self.dot = dot
+    self.frame = frame
+    self.arcs = arcs
+    self.camera_path = camera_path
+
+    kwargs.setdefault("run_time", camera_path.duration)
+    kwargs.setdefault("rate_func", linear)
+    # The frame is part of the animation so MovingCameraScene sees it moving, and doesn't bake the squares into a
+    # static background taken where the frame started
+    super().__init__(Group(spiral, dot, frame), **kwargs)
+
+  def create_starting_mobject(self) -> Mobject:
+    return self.mobject
+
+  def interpolate_mobject(self, alpha: float) -> None:
+    spiral, dot, _ = self.mobject.submobjects
+    spiral.pointwise_become_partial(self.full_spiral, 0, alpha)
+    dot.move_to(sample_quarter_arcs(self.arcs, alpha * len(self.arcs[1])))
+
+    center, width = self.camera_path.sample(alpha * self.camera_path.duration)
+    self.frame.scale_to_fit_width(width).move_to(center)
+
 class Fibonacci(MovingCameraScene):
   def construct(self):
     annotated_squares = VGroup()
@@ -536,16 +721,6 @@ class Fibonacci(MovingCameraScene):
     starting_dot = Dot().move_to(starting_point)
     moving_dot = Dot().move_to(starting_point)
 
-    def follow_dot(camera: Camera):
-      """An updater which continually makes the camera follow the movement of a point"""
-      camera.move_to(moving_dot.get_center())
-
-    self.camera.frame.add_updater(follow_dot)
-    self.add(self.camera.frame)
-
-    path = TracedPath(moving_dot.get_center)
-    self.add(path)
-
     self.play(
       AnimationGroup(
         self.camera.frame.animate.restore().move_to(starting_point),
@@ -554,24 +729,29 @@ class Fibonacci(MovingCameraScene):
       )
     )
 
-    for p in square_anchors:
-      self.play(
-        Rotate(moving_dot, about_point=p, angle=PI/2),
-        self.camera.frame.animate.scale(1.12),
-        rate_func=linear
-      )
+    # The whole spiral up front: a quarter arc (and a second) per square
+    arcs = get_quarter_arcs(starting_point, square_anchors)
+    spiral = VMobject(stroke_width=2).set_points(get_quarter_arc_points(arcs))
+
+    # The camera follows the tip of the spiral, zooming out by 1.12 every quarter arc. Keyframes a few times per arc
+    # are plenty for the spline, it goes through them smoothly
+    keyframes = np.linspace(0, len(square_anchors), 4 * len(square_anchors) + 1)
+    camera_path = CameraSpline(
+      len(square_anchors),
+      sample_quarter_arcs(arcs, keyframes),
+      self.camera.frame.width * 1.12 ** keyframes,
+    )
 
-    self.wait()
+    self.play(SpiralCameraMove(spiral, moving_dot, self.camera.frame, arcs, camera_path))
 
-    # cleanup
-    self.camera.frame.clear_updaters()
+    self.wait()
 
     self.play(
       AnimationGroup(
         self.camera.frame.animate.set_height(annotated_squares.height * 1.5).move_to(annotated_squares),
       )
       # FadeOut(annotated_squares),
-      # Unwrite(path),
+      # Unwrite(spiral),
     )
 
 # PLOTTING AND 3D SCENES
@@ -0,0 +1,139 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+# L-systems: an axiom and a set of rewrite rules, expanded a number of times and then read by a turtle that draws a
+# step for every draw symbol and turns by a fixed angle on + and -. Hilbert, Peano, dragon, Koch, Sierpiński... are
+# all a line or two of rules. Like get_hilbert_anchors in darwin.py, the result is a single (n, 3) anchor buffer to
+# build one Path from, and nothing in here knows about manim.
+#
+# Both halves run at C speed: a rewrite is one str.translate over the whole string (every symbol replaced at once),
+# and the turtle is a couple of cumulative sums over the symbols, one for the headings and one for the positions.
+# Usage (from the project root):
+#   python lsystem.py [--curves dragon hilbert] [--max-segments 4000000]
+
+class LSystem:
+  """
+    Symbols with a rule get replaced on every iteration, the rest are kept as they are. draw are the symbols the turtle
+    steps forward on, + turns it left by angle (degrees) and - turns it right, anything else it ignores.
+  """
+  def __init__(self, axiom: str, rules: dict[str, str], angle: float, draw="F", heading=0.0):
+    self.axiom = axiom
+    self.rules = rules
+    self.angle = angle
+    self.draw = draw
+    self.heading = heading
+
+    self._table = str.maketrans(rules)
+    # Every symbol used anywhere, for counting them without expanding
+    self.symbols = sorted(set(axiom).union(*rules, *rules.values()))
+
+  def expand(self, depth: int) -> str:
+    symbols = self.axiom
+    for _ in range(depth):
+      symbols = symbols.translate(self._table)
+
+    return symbols
+
+  def get_symbol_counts(self, depth: int) -> dict[str, int]:
+    """How many of every symbol the expansion will have, from the rules alone (a matrix power, no string needed)"""
+    index = {symbol: i for i, symbol in enumerate(self.symbols)}
+    growth = np.zeros((len(self.symbols), len(self.symbols)), dtype=object)
+    for symbol in self.symbols:
+      for produced in self.rules.get(symbol, symbol):
+        growth[index[produced], index[symbol]] += 1
+
+    counts = np.array([self.axiom.count(symbol) for symbol in self.symbols], dtype=object)
+    for _ in range(depth):
+      counts = growth.dot(counts)
+
+    return dict(zip(self.symbols, (int(count) for count in counts)))
+
+  def get_segment_count(self, depth: int) -> int:
+    counts = self.get_symbol_counts(depth)
+    return sum(counts.get(symbol, 0) for symbol in self.draw)
+
+  def interpret(self, symbols: str, step=1.0) -> np.ndarray:
+    """(segments + 1, 3) turtle positions, starting at the origin"""
+    codes = np.frombuffer(symbols.encode("ascii"), dtype=np.uint8)
+
+    turns = np.zeros(256, dtype=np.int8)
+    turns[ord("+")], turns[ord("-")] = 1, -1
+    is_draw = np.zeros(256, dtype=bool)
+    is_draw[[ord(symbol) for symbol in self.draw]] = True
+
+    # Heading of every symbol as a whole number of turns, only the ones at the draw symbols matter
+    drawn = is_draw[codes]
+    headings = np.cumsum(turns[codes], dtype=np.int32)[drawn]
+
+    directions = round(360 / self.angle)
+    if np.isclose(directions * self.angle, 360):
+      # The turtle can only ever face one of a handful of directions: look the steps up (and keep them exact, a
+      # 90 degree curve lands on whole numbers)
+      angles = np.radians(self.heading + self.angle * np.arange(directions))
+      unit_steps = np.round(np.stack((np.cos(angles), np.sin(angles)), axis=1), 12)
+      steps = unit_steps[headings % directions]
+    else:
+      angles = np.radians(self.heading + self.angle * headings)
+      steps = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+    anchors = np.zeros((len(steps) + 1, 3))
+    np.cumsum(steps * step, axis=0, out=anchors[1:, :2])
+    return anchors
+
+  def get_anchors(self, depth: int, step=1.0) -> np.ndarray:
+    return self.interpret(self.expand(depth), step)
+
+def fit_anchors(anchors: np.ndarray, width: float, height: float) -> np.ndarray:
+  """The anchors scaled (keeping their aspect ratio) and centered to fit inside width x height"""
+  low, high = anchors.min(axis=0), anchors.max(axis=0)
+  size = high - low
+  scale = min(width / size[0] if size[0] else np.inf, height / size[1] if size[1] else np.inf)
+
+  return (anchors - (low + high) / 2) * scale
+
+L_SYSTEMS = {
+  "koch": LSystem("F--F--F", {"F": "F+F--F+F"}, 60),
+  "dragon": LSystem("FX", {"X": "X+YF+", "Y": "-FX-Y"}, 90),
+  "peano": LSystem("X", {"X": "XFYFX+F+YFXFY-F-XFYFX", "Y": "YFXFY-F-XFYFX+F+YFXFY"}, 90),
+  # The arrowhead curve, both of its symbols draw
+  "sierpinski": LSystem("A", {"A": "B-A-B", "B": "A+B+A"}, 60, draw="AB"),
+  # Same curve (and orientation) as get_hilbert_anchors in darwin.py
+  "hilbert": LSystem("A", {"A": "+BF-AFA-FB+", "B": "-AF+BFB+FA-"}, 90),
+}
+
+def benchmark_l_systems(names=tuple(L_SYSTEMS), max_segments=4_000_000):
+  """Expansion and turtle time, and peak memory, of every curve at every depth up to max_segments"""
+  print(f"{'curve':<12}{'depth':>6}{'symbols':>12}{'segments':>12}{'expand':>12}{'turtle':>12}{'peak':>10}")
+  for name in names:
+    system = L_SYSTEMS[name]
+    depth = 1
+    while system.get_segment_count(depth) <= max_segments:
+      start = time.perf_counter()
+      symbols = system.expand(depth)
+      expanded = time.perf_counter()
+      anchors = system.interpret(symbols)
+      interpreted = time.perf_counter()
+      del symbols, anchors
+
+      # Once more for the memory, tracing every allocation would throw the timings off
+      tracemalloc.start()
+      anchors = system.get_anchors(depth)
+      _, peak = tracemalloc.get_traced_memory()
+      tracemalloc.stop()
+
+      print(
+        f"{name:<12}{depth:>6}{sum(system.get_symbol_counts(depth).values()):>12}{len(anchors) - 1:>12}"
+        f"{(expanded - start) * 1000:>10.2f}ms{(interpreted - expanded) * 1000:>10.2f}ms{peak / 2 ** 20:>8.1f}MB"
+      )
+      depth += 1
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark the L-system expansion and turtle")
+  parser.add_argument("--curves", nargs="+", default=list(L_SYSTEMS), choices=list(L_SYSTEMS))
+  parser.add_argument("--max-segments", type=float, default=4e6)
+  args = parser.parse_args()
+
+  benchmark_l_systems(args.curves, int(args.max_segments))
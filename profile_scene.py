@@ -0,0 +1,251 @@
+from manim import *
+import argparse
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.scene.scene_file_writer import SceneFileWriter
+
+# Where the render time of a scene goes. Every play/wait gets a span, and inside it the time is split into the
+# updaters (one row per updater function, obstacle_updater, follow_dot, ...), interpolating the animations,
+# rasterizing the frame and encoding it. LaTeX compilation, svg parsing and pango text rendering get their own spans
+# wherever they happen. The spans are written out as a Chrome trace (open it in chrome://tracing or ui.perfetto.dev)
+# and summed up in a table of the top hot spots.
+#
+# Either mix ProfiledSceneMixin into a scene (before the scene class), or profile any scene as is from the project root:
+#   python profile_scene.py darwin.py Fibonacci [-q l] [--top 20] [--trace fibonacci.trace.json]
+#   python profile_scene.py _2024YT/puzzle.py Puzzle -q l
+
+def get_updater_name(updater) -> str:
+  """obstacle_updater for a named function, where it was written for a lambda"""
+  name = getattr(updater, "__name__", type(updater).__name__)
+  code = getattr(updater, "__code__", None)
+  if name == "<lambda>" and code is not None:
+    return f"<lambda> {os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+
+  return name
+
+def get_play_name(args) -> str:
+  """play(Write, FadeIn, animate), by the kind of every animation passed in"""
+  kinds = [
+    "animate" if type(arg).__name__ == "_AnimationBuilder" else type(arg).__name__
+    for arg in args
+  ]
+  if len(kinds) > 4:
+    kinds = kinds[:4] + [f"+{len(kinds) - 4}"]
+
+  return f"play({', '.join(kinds)})"
+
+class SceneProfiler:
+  """
+    Records nested spans of wall time. Spans are kept as Chrome trace "complete" events, and every span knows how much
+    of its time went into the spans inside it, so the summary can rank by self time.
+  """
+  def __init__(self):
+    self.events: list[dict] = []
+    self._stack: list[list] = []
+    self._patches: list[tuple[object, str, object, bool]] = []
+    self.origin = time.perf_counter()
+
+  def begin(self, name: str, category: str, args: dict | None = None):
+    self._stack.append([name, category, time.perf_counter(), 0.0, args])
+
+  def end(self):
+    name, category, start, child_time, args = self._stack.pop()
+    duration = time.perf_counter() - start
+    if self._stack:
+      self._stack[-1][3] += duration
+
+    event = {
+      "name": name,
+      "cat": category,
+      "ph": "X",
+      "ts": (start - self.origin) * 1e6,
+      "dur": duration * 1e6,
+      "pid": os.getpid(),
+      "tid": 1,
+      "self": (duration - child_time) * 1e6,
+    }
+    if args:
+      event["args"] = args
+    self.events.append(event)
+
+  def patch(self, owner, attr: str, category: str, get_name=None):
+    """Wraps owner.attr so every call is a span, until uninstall"""
+    original = getattr(owner, attr)
+    profiler = self
+
+    def wrapper(*args, **kwargs):
+      profiler.begin(get_name(*args, **kwargs) if get_name else attr, category)
+      try:
+        return original(*args, **kwargs)
+      finally:
+        profiler.end()
+
+    wrapper.__wrapped__ = original
+    # An inherited method gets shadowed on owner, and unshadowed again by uninstall
+    self._patches.append((owner, attr, original, attr in vars(owner)))
+    setattr(owner, attr, wrapper)
+
+  def patch_updaters(self):
+    """Mobject.update with a span around each updater call, named after the updater function"""
+    profiler = self
+
+    def update(mob, dt=0, recursive=True):
+      if mob.updating_suspended:
+        return mob
+      for updater in mob.updaters:
+        is_time_based = "dt" in inspect.signature(updater).parameters
+        profiler.begin(get_updater_name(updater), "updater")
+        try:
+          updater(mob, dt) if is_time_based else updater(mob)
+        finally:
+          profiler.end()
+      if recursive:
+        for submob in mob.submobjects:
+          submob.update(dt, recursive=recursive)
+      return mob
+
+    self._patches.append((Mobject, "update", Mobject.__dict__["update"], True))
+    Mobject.update = update
+
+  def install(self, scene: Scene):
+    """Hooks into manim's render pipeline for the scene. Everything is undone by uninstall"""
+    self.patch_updaters()
+    # update_to_time runs the updaters too, its self time is the interpolation of the animations
+    self.patch(Scene, "update_to_time", "interpolate", lambda *args, **kwargs: "interpolate")
+    # Only the scene's own camera class, MovingCamera & co wrap Camera's and would show up twice
+    self.patch(type(scene.renderer.camera), "capture_mobjects", "rasterize", lambda *args, **kwargs: "capture_mobjects")
+    self.patch(SceneFileWriter, "write_frame", "encode")
+    self.patch(SceneFileWriter, "finish", "encode")
+    self.patch(tex_mobject, "tex_to_svg_file", "latex")
+    self.patch(SVGMobject, "generate_mobject", "svg", lambda mob, *args, **kwargs: f"{type(mob).__name__} {os.path.basename(str(getattr(mob, 'file_name', '')))}")
+    self.patch(Text, "_text2svg", "text", lambda mob, *args, **kwargs: "Text")
+    self.patch(MarkupText, "_text2svg", "text", lambda mob, *args, **kwargs: "MarkupText")
+    return self
+
+  def uninstall(self):
+    while self._patches:
+      owner, attr, original, had_own = self._patches.pop()
+      if had_own:
+        setattr(owner, attr, original)
+      else:
+        delattr(owner, attr)
+
+  def get_summary(self) -> list[dict]:
+    """Total and self time of every (category, name), heaviest self time first"""
+    rows: dict[tuple[str, str], dict] = {}
+    for event in self.events:
+      row = rows.setdefault((event["cat"], event["name"]), {"category": event["cat"], "name": event["name"], "count": 0, "total": 0.0, "self": 0.0})
+      row["count"] += 1
+      row["total"] += event["dur"] / 1e6
+      row["self"] += event["self"] / 1e6
+
+    return sorted(rows.values(), key=lambda row: row["self"], reverse=True)
+
+  def get_category_totals(self) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for event in self.events:
+      totals[event["cat"]] = totals.get(event["cat"], 0.0) + event["self"] / 1e6
+
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+  def print_summary(self, top=20):
+    wall_time = max((event["ts"] + event["dur"] for event in self.events), default=0) / 1e6
+    print(f"\nRender profile: {wall_time:.2f}s wall time")
+
+    print(f"\n{'category':<14}{'self':>10}{'share':>8}")
+    for category, total in self.get_category_totals().items():
+      print(f"{category:<14}{total:>9.2f}s{total / wall_time * 100 if wall_time else 0:>7.1f}%")
+
+    print(f"\n{'category':<14}{'name':<48}{'calls':>8}{'total':>10}{'self':>10}{'mean':>10}")
+    for row in self.get_summary()[:top]:
+      name = row["name"] if len(row["name"]) <= 46 else row["name"][:43] + "..."
+      mean = row["total"] / row["count"] * 1000
+      print(f"{row['category']:<14}{name:<48}{row['count']:>8}{row['total']:>9.2f}s{row['self']:>9.2f}s{mean:>8.2f}ms")
+
+  def write_chrome_trace(self, path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    events = [{key: value for key, value in event.items() if key != "self"} for event in self.events]
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    return path
+
+class ProfiledSceneMixin:
+  """
+    Profiles the whole render of the scene: setup, every play/wait (and what's inside them) and tear_down.
+    The trace goes to PROFILE_TRACE, or media/profiles/<Scene>.trace.json, and the top PROFILE_TOP rows get printed.
+  """
+  PROFILE_TRACE: str | None = None
+  PROFILE_TOP = 20
+
+  def render(self, *args, **kwargs):
+    self.profiler = SceneProfiler().install(self)
+    self.profiler.begin(type(self).__name__, "render")
+    try:
+      return super().render(*args, **kwargs)
+    finally:
+      self.profiler.end()
+      self.profiler.uninstall()
+      trace = self.profiler.write_chrome_trace(self.PROFILE_TRACE or Path(config.media_dir) / "profiles" / f"{type(self).__name__}.trace.json")
+      self.profiler.print_summary(self.PROFILE_TOP)
+      print(f"\nTrace written to {trace}")
+
+  def _profile_span(self, name: str, category: str, method, *args, **kwargs):
+    self.profiler.begin(name, category, {"scene_time": round(self.renderer.time, 3)})
+    try:
+      return method(*args, **kwargs)
+    finally:
+      self.profiler.end()
+
+  def setup(self):
+    self._profile_span("setup", "setup", super().setup)
+
+  def construct(self):
+    self._profile_span("construct", "construct", super().construct)
+
+  def tear_down(self):
+    self._profile_span("tear_down", "setup", super().tear_down)
+
+  def play(self, *args, **kwargs):
+    return self._profile_span(get_play_name(args), "play", super().play, *args, **kwargs)
+
+  def wait(self, *args, **kwargs):
+    return self._profile_span("wait", "wait", super().wait, *args, **kwargs)
+
+def load_scene_class(file_name: str, scene_name: str) -> type:
+  """Imports the scene's file like manim does, its own folder on sys.path so sibling modules import"""
+  path = Path(file_name).resolve()
+  sys.path.insert(0, str(path.parent))
+
+  spec = importlib.util.spec_from_file_location(path.stem, path)
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[path.stem] = module
+  spec.loader.exec_module(module)
+
+  return getattr(module, scene_name)
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Render a scene and profile where the time goes")
+  parser.add_argument("file", help="python file with the scene, e.g. darwin.py")
+  parser.add_argument("scene", help="scene class, e.g. Fibonacci")
+  parser.add_argument("-q", "--quality", default="l", choices=["l", "m", "h", "p", "k"])
+  parser.add_argument("--top", type=int, default=20, help="rows of the summary table")
+  parser.add_argument("--trace", default=None, help="where to write the chrome trace (media/profiles/<Scene>.trace.json)")
+  args = parser.parse_args()
+
+  scene_class = load_scene_class(args.file, args.scene)
+  profiled_class = type(scene_class.__name__, (ProfiledSceneMixin, scene_class), {
+    "PROFILE_TRACE": args.trace,
+    "PROFILE_TOP": args.top,
+  })
+
+  quality = {"l": "low_quality", "m": "medium_quality", "h": "high_quality", "p": "production_quality", "k": "fourk_quality"}[args.quality]
+  with tempconfig({"quality": quality, "input_file": args.file, "scene_names": [args.scene]}):
+    profiled_class().render()